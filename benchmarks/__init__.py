@@ -0,0 +1,5 @@
+"""Benchmarks of the Venta integration hot paths."""
+
+from .runner import BenchmarkResult, compare, load_report, measure, report
+
+__all__ = ["BenchmarkResult", "compare", "load_report", "measure", "report"]
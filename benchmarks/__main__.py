@@ -0,0 +1,65 @@
+"""Run the Venta benchmarks from the command line."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from pathlib import Path
+
+from simulator import DEVICE_TYPES
+
+from .runner import compare, load_report, report
+from .stages import run
+
+
+def _parse_args() -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark the per-poll hot path of the Venta integration.",
+    )
+    parser.add_argument("-i", "--iterations", type=int, default=1000)
+    parser.add_argument(
+        "-m",
+        "--models",
+        type=int,
+        nargs="+",
+        default=list(DEVICE_TYPES),
+        choices=DEVICE_TYPES,
+    )
+    parser.add_argument("-o", "--output", type=Path, help="write the JSON report")
+    parser.add_argument("--baseline", type=Path, help="report to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="allowed relative slowdown of the median against the baseline",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    args = _parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+    result = report(asyncio.run(run(args.models, args.iterations)))
+
+    output = json.dumps(result, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+
+    if args.baseline:
+        regressions = compare(result, load_report(args.baseline), args.threshold)
+        for regression in regressions:
+            print(regression, file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Benchmarked stages of the entities, run in a bare Home Assistant."""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import tempfile
+from collections.abc import AsyncIterator
+from datetime import timedelta
+from importlib import import_module
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity as entity_helper
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import EntityPlatform
+from homeassistant.loader import async_setup as async_setup_loader
+
+from custom_components.venta.venta import VentaApi, VentaDataUpdateCoordinator
+
+from .runner import BenchmarkResult, measure
+from .stages import create_device, fixture_payload
+
+_LOGGER = logging.getLogger(__name__)
+
+PLATFORMS: tuple[str, ...] = (
+    "binary_sensor",
+    "humidifier",
+    "light",
+    "select",
+    "sensor",
+    "switch",
+)
+
+
+@contextlib.asynccontextmanager
+async def async_start_hass() -> AsyncIterator[HomeAssistant]:
+    """Start a Home Assistant with just the registries the entities need."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        async_setup_loader(hass)
+        entity_helper.async_setup(hass)
+        await er.async_load(hass)
+        await dr.async_load(hass)
+        try:
+            yield hass
+        finally:
+            await hass.async_stop(force=True)
+
+
+async def collect_entities(
+    coordinator: VentaDataUpdateCoordinator, model: int
+) -> dict[str, list[Entity]]:
+    """Collect the entities the model sets up on every platform."""
+    module = import_module(f"custom_components.venta.devices.{model}")
+    entities: dict[str, list[Entity]] = {}
+    for platform in PLATFORMS:
+        if setup := getattr(module, f"async_setup_{platform}", None):
+            await setup(
+                coordinator,
+                lambda new, _=False, platform=platform: entities.setdefault(
+                    platform, []
+                ).extend(new),
+            )
+    return entities
+
+
+async def _write_state(
+    hass: HomeAssistant,
+    model: int,
+    entities: dict[str, list[Entity]],
+    iterations: int,
+) -> BenchmarkResult:
+    """Measure writing the state of all the entities of the model."""
+    for domain, domain_entities in entities.items():
+        platform = EntityPlatform(
+            hass=hass,
+            logger=_LOGGER,
+            domain=domain,
+            platform_name=f"venta_{model}",
+            platform=None,
+            scan_interval=timedelta(seconds=10),
+            entity_namespace=None,
+        )
+        await platform.async_add_entities(domain_entities)
+    # The entities disabled by default, like the metrics, are not added
+    added = [
+        entity
+        for domain in entities.values()
+        for entity in domain
+        if entity.hass is not None
+    ]
+
+    def _write() -> None:
+        for entity in added:
+            entity.async_write_ha_state()
+
+    return measure(model, "write_state", _write, iterations)
+
+
+async def run_model(
+    hass: HomeAssistant, model: int, iterations: int
+) -> list[BenchmarkResult]:
+    """Run the entity stages for a single device model."""
+    data, _ = fixture_payload(model)
+    device = create_device(model, data)
+    coordinator = VentaDataUpdateCoordinator(hass, VentaApi(device))
+    coordinator.data = await device._map_data(data)
+    entities = await collect_entities(coordinator, model)
+    # Sensors compute their values from the coordinator, the rest from the data
+    value_funcs = [
+        (
+            entity.entity_description.value_func,
+            coordinator if platform == "sensor" else coordinator.data,
+        )
+        for platform, platform_entities in entities.items()
+        for entity in platform_entities
+        if hasattr(entity.entity_description, "value_func")
+    ]
+
+    def _values() -> None:
+        for value_func, argument in value_funcs:
+            value_func(argument)
+
+    return [
+        measure(model, "value_funcs", _values, iterations),
+        await _write_state(hass, model, entities, iterations),
+    ]
@@ -0,0 +1,133 @@
+"""Fault injection around the real Venta strategies."""
+
+from __future__ import annotations
+
+import asyncio
+import errno
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from aiohttp import ClientOSError
+
+from custom_components.venta.venta_strategy import (
+    VentaHttpStrategy,
+    VentaProtocolStrategy,
+    VentaTcpStrategy,
+    retry_on_timeout,
+)
+
+
+@dataclass
+class RetryPolicy:
+    """Arguments of the retry_on_timeout decorator."""
+
+    retries: int = 5
+    timeout: int = 10
+    delay: float = 0.5
+
+
+@dataclass
+class FaultRates:
+    """Probabilities of the injected faults for a single attempt."""
+
+    delay: float = 0.0
+    delay_rate: float = 0.0
+    reset_rate: float = 0.0
+    hang_rate: float = 0.0
+
+
+@dataclass
+class FaultStats:
+    """Work done by the attempts of the wrapped strategy."""
+
+    attempts: int = 0
+    failed: int = 0
+    wasted_s: float = 0.0
+    wasted_cpu_s: float = 0.0
+
+
+class VentaFaultStrategy(VentaProtocolStrategy):
+    """Inject faults into the requests of a HTTP or TCP strategy.
+
+    Every attempt is a single request of the wrapped strategy, retried by the
+    policy instead, so the injected faults go through the same retries and
+    timeouts as real ones. Corrupted payloads are sent by the simulator, see
+    its fault profile, and parsed by the wrapped strategy.
+    """
+
+    def __init__(
+        self,
+        inner: VentaHttpStrategy | VentaTcpStrategy,
+        faults: FaultRates | None = None,
+        policy: RetryPolicy | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """Fault strategy constructor."""
+        self.inner = inner
+        self.faults = faults or FaultRates()
+        self.stats = FaultStats()
+        self._random = random.Random(seed)
+        policy = policy or RetryPolicy()
+        # Longer than the policy, so the wrapped strategy never retries itself
+        self.request_timeout = inner.request_timeout or policy.timeout
+        inner.request_timeout = self.request_timeout + 1
+        self._send: Callable[..., Awaitable[dict[str, Any] | None]] = retry_on_timeout(
+            policy.retries, policy.timeout, policy.delay
+        )(VentaFaultStrategy._attempt)
+
+    async def get_status(self, method: str, url: str) -> dict[str, Any] | None:
+        """Request status through the faults."""
+        return await self._send(self, self.inner.get_status, method, url)
+
+    async def send_action(
+        self, method: str, url: str, json: dict[str, Any] | None = None
+    ) -> dict[str, Any] | None:
+        """Send action through the faults."""
+        return await self._send(self, self.inner.send_action, method, url, json)
+
+    async def close(self) -> None:
+        """Close the wrapped strategy."""
+        await self.inner.close()
+
+    def _happens(self, rate: float) -> bool:
+        """Return if the fault with the rate happens in this attempt."""
+        return rate > 0 and self._random.random() < rate
+
+    async def _attempt(
+        self,
+        request: Callable[..., Awaitable[dict[str, Any] | None]],
+        *arguments: Any,  # noqa: ANN401
+    ) -> dict[str, Any] | None:
+        """Run a single attempt of the wrapped request with the faults."""
+        self.stats.attempts += 1
+        start, cpu_start = time.perf_counter(), time.process_time()
+        result = None
+        try:
+            result = await self._faulty(request, *arguments)
+        finally:
+            if result is None:
+                self.stats.failed += 1
+                self.stats.wasted_s += time.perf_counter() - start
+                self.stats.wasted_cpu_s += time.process_time() - cpu_start
+        return result
+
+    async def _faulty(
+        self,
+        request: Callable[..., Awaitable[dict[str, Any] | None]],
+        *arguments: Any,  # noqa: ANN401
+    ) -> dict[str, Any] | None:
+        """Apply the faults around the wrapped request."""
+        faults = self.faults
+        if self._happens(faults.hang_rate):
+            await asyncio.Event().wait()
+        if self._happens(faults.delay_rate):
+            await asyncio.sleep(faults.delay)
+        if self._happens(faults.reset_rate):
+            if isinstance(self.inner, VentaTcpStrategy):
+                # The TCP strategy logs the failed read and gives up
+                return None
+            raise ClientOSError(errno.ECONNRESET, "Connection reset by peer")
+        return await request(*arguments)
@@ -0,0 +1,410 @@
+"""Fleet scale harness running many config entries against the simulator.
+
+Home Assistant is created with ``pytest-homeassistant-custom-component`` and
+one config entry is added per simulated device. The harness records the time
+needed to set up all the entries, the peak RSS, the top ``tracemalloc``
+allocators and the event loop lag while the entries keep polling.
+
+The simulator runs in its own process so it does not skew the measurements.
+Devices listen on the real Venta ports, binding port 80 needs enough
+privileges.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+from homeassistant.const import (
+    CONF_API_VERSION,
+    CONF_HOST,
+    CONF_MAC,
+    CONF_SCAN_INTERVAL,
+)
+from homeassistant.core import callback
+
+from .runner import git_revision
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN = "venta"
+LAG_INTERVAL = 0.05
+SIMULATOR_START_TIMEOUT = 60
+
+# The ids of the api definitions are stored in the config entries, so they are
+# stable across the revisions and are resolved here rather than imported from
+# modules which moved around
+API_DEFINITION_IDS: dict[int, str] = {
+    0: "0/Complete/Action",
+    2: "2/datastructure/datastructure",
+    3: "3/api/telemetry/api/telemetry?request=set",
+}
+SENSOR_API_DEFINITION_ID = "3/sensordata.json/None"
+SENSOR_DEVICE_TYPES = (100, 150)
+
+
+@dataclass
+class FleetDevice:
+    """Simulated device as listed in the simulator hosts file."""
+
+    host: str
+    device_type: int
+    api_version: int
+    mac: str
+
+    @property
+    def api_definition_id(self) -> str:
+        """Return the id of the api definition spoken by the device."""
+        if self.device_type in SENSOR_DEVICE_TYPES:
+            return SENSOR_API_DEFINITION_ID
+        return API_DEFINITION_IDS[self.api_version]
+
+
+@dataclass
+class FleetReport:
+    """Measurements of a single fleet run."""
+
+    entries: int
+    loaded: int
+    setup_s: float
+    rss_baseline_mib: float
+    rss_peak_mib: float
+    polls: int
+    lag_ms: dict[str, float] = field(default_factory=dict)
+    top_allocators: list[dict[str, Any]] = field(default_factory=list)
+
+
+def _peak_rss_mib() -> float:
+    """Return the peak resident set size of the process."""
+    # ru_maxrss is reported in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    """Summarize the lag samples given in seconds."""
+    if not samples:
+        return {}
+    samples = sorted(samples)
+
+    def _at(percentile: float) -> float:
+        return samples[min(len(samples) - 1, int(len(samples) * percentile))] * 1e3
+
+    return {
+        "p50": _at(0.5),
+        "p95": _at(0.95),
+        "p99": _at(0.99),
+        "max": samples[-1] * 1e3,
+        "mean": statistics.fmean(samples) * 1e3,
+    }
+
+
+def read_hosts(path: Path) -> list[FleetDevice]:
+    """Read the devices from the simulator hosts file."""
+    devices = []
+    for line in path.read_text().splitlines():
+        if line.strip():
+            host, device_type, api_version, mac = line.split("\t")
+            devices.append(
+                FleetDevice(host, int(device_type), int(api_version[1:]), mac)
+            )
+    return devices
+
+
+async def _start_simulator(
+    devices: int, network: str, hosts_file: Path, keep_alive: bool
+) -> asyncio.subprocess.Process:
+    """Start the simulator process and wait until it serves the devices."""
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "simulator",
+        "--devices",
+        str(devices),
+        "--network",
+        network,
+        "--hosts-file",
+        str(hosts_file),
+        *(() if keep_alive else ("--no-keep-alive",)),
+    )
+    async with asyncio.timeout(SIMULATOR_START_TIMEOUT):
+        while not hosts_file.exists() or not hosts_file.read_text().endswith("\n"):
+            if process.returncode is not None:
+                raise RuntimeError("Simulator exited before serving the devices")
+            await asyncio.sleep(0.1)
+    return process
+
+
+async def _monitor_lag(samples: list[float]) -> None:
+    """Record how late the event loop wakes up from a fixed sleep."""
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + LAG_INTERVAL
+        await asyncio.sleep(LAG_INTERVAL)
+        samples.append(max(0.0, loop.time() - expected))
+
+
+def _top_allocators(snapshot: tracemalloc.Snapshot, top: int) -> list[dict[str, Any]]:
+    """Return the source lines that allocated the most memory."""
+    return [
+        {
+            "location": str(stat.traceback[0]),
+            "size_kib": stat.size / 1024,
+            "count": stat.count,
+        }
+        for stat in snapshot.statistics("lineno")[:top]
+    ]
+
+
+async def _check_api_definitions(devices: list[FleetDevice]) -> None:
+    """Check the integration under test knows the api definitions of the fleet.
+
+    Only the device class is used, it is importable from every revision.
+    """
+    from custom_components.venta.venta import VentaDevice
+
+    for definition_id in {device.api_definition_id for device in devices}:
+        # Raises a ValueError for an unknown definition
+        device = VentaDevice(devices[0].host, timedelta(seconds=10), definition_id)
+        # Older revisions have nothing to close
+        if close := getattr(device, "close", None):
+            await close()
+
+
+async def run_fleet(
+    devices: list[FleetDevice], window: float, scan_interval: int, top: int
+) -> FleetReport:
+    """Set up a config entry per device and keep them polling for the window."""
+    # Imported late so the integration is loaded from the requested source
+    from homeassistant.loader import DATA_CUSTOM_COMPONENTS
+    from homeassistant.setup import async_setup_component
+    from pytest_homeassistant_custom_component.common import (
+        MockConfigEntry,
+        async_test_home_assistant,
+    )
+
+    await _check_api_definitions(devices)
+    rss_baseline = _peak_rss_mib()
+    if top:
+        tracemalloc.start()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        async with async_test_home_assistant(config_dir=config_dir) as hass:
+            # Allow loading the integration from custom_components
+            hass.data.pop(DATA_CUSTOM_COMPONENTS, None)
+
+            for device in devices:
+                MockConfigEntry(
+                    domain=DOMAIN,
+                    version=4,
+                    unique_id=device.mac,
+                    data={
+                        CONF_HOST: device.host,
+                        CONF_MAC: device.mac,
+                        CONF_API_VERSION: device.api_version,
+                        "api_definition_id": device.api_definition_id,
+                        CONF_SCAN_INTERVAL: scan_interval,
+                    },
+                ).add_to_hass(hass)
+
+            start = time.perf_counter()
+            await async_setup_component(hass, DOMAIN, {})
+            await hass.async_block_till_done()
+            setup_s = time.perf_counter() - start
+            loaded = len(hass.data.get(DOMAIN, {}))
+            _LOGGER.info(
+                "Set up %d of %d entries in %.2fs", loaded, len(devices), setup_s
+            )
+
+            polls = 0
+
+            @callback
+            def _count_poll() -> None:
+                nonlocal polls
+                polls += 1
+
+            for coordinator in hass.data.get(DOMAIN, {}).values():
+                coordinator.async_add_listener(_count_poll)
+
+            samples: list[float] = []
+            monitor = asyncio.create_task(_monitor_lag(samples))
+            await asyncio.sleep(window)
+            monitor.cancel()
+
+            top_allocators = []
+            if top:
+                top_allocators = _top_allocators(tracemalloc.take_snapshot(), top)
+                tracemalloc.stop()
+
+    return FleetReport(
+        entries=len(devices),
+        loaded=loaded,
+        setup_s=setup_s,
+        rss_baseline_mib=rss_baseline,
+        rss_peak_mib=_peak_rss_mib(),
+        polls=polls,
+        lag_ms=_percentiles(samples),
+        top_allocators=top_allocators,
+    )
+
+
+async def _run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run a single fleet measurement."""
+    simulator = None
+    with tempfile.TemporaryDirectory() as directory:
+        hosts_file = args.hosts_file
+        if hosts_file is None:
+            hosts_file = Path(directory) / "hosts.txt"
+            simulator = await _start_simulator(
+                args.entries, args.network, hosts_file, not args.no_keep_alive
+            )
+        try:
+            devices = read_hosts(hosts_file)[: args.entries]
+            result = await run_fleet(devices, args.window, args.scan_interval, args.top)
+        finally:
+            if simulator is not None:
+                simulator.terminate()
+                await simulator.wait()
+
+    return {
+        "meta": {"revision": git_revision(args.source), "source": str(args.source)},
+        "fleet": asdict(result),
+    }
+
+
+def _worktree(revision: str, path: Path) -> None:
+    """Check out the revision into a detached worktree."""
+    subprocess.run(
+        ["git", "worktree", "add", "--detach", str(path), revision],  # noqa: S607
+        check=True,
+        capture_output=True,
+    )
+
+
+def compare_revisions(args: argparse.Namespace, revisions: list[str]) -> dict[str, Any]:
+    """Run the fleet for each revision in its own process and compare them."""
+    reports: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for revision in revisions:
+            source = Path(directory) / revision.replace("/", "_")
+            output = Path(directory) / f"{source.name}.json"
+            _worktree(revision, source)
+            try:
+                command = [
+                    sys.executable,
+                    "-m",
+                    "benchmarks.fleet",
+                    "--source",
+                    str(source),
+                    "--output",
+                    str(output),
+                    "--entries",
+                    str(args.entries),
+                    "--window",
+                    str(args.window),
+                    "--scan-interval",
+                    str(args.scan_interval),
+                    "--top",
+                    str(args.top),
+                    "--network",
+                    args.network,
+                    # Older revisions read the V0 replies until the device
+                    # closes the connection, so every revision is measured
+                    # against devices closing them
+                    "--no-keep-alive",
+                ]
+                subprocess.run(command, check=True)
+                reports[revision] = json.loads(output.read_text())
+            finally:
+                subprocess.run(
+                    ["git", "worktree", "remove", "--force", str(source)],  # noqa: S607
+                    check=False,
+                    capture_output=True,
+                )
+
+    base, head = (reports[revision]["fleet"] for revision in revisions)
+    delta = {
+        name: {"base": base[name], "head": head[name], "diff": head[name] - base[name]}
+        for name in ("loaded", "setup_s", "rss_peak_mib", "polls")
+    }
+    delta.update(
+        {
+            f"lag_{name}_ms": {
+                "base": base["lag_ms"].get(name),
+                "head": value,
+                "diff": value - base["lag_ms"].get(name, 0),
+            }
+            for name, value in head["lag_ms"].items()
+        }
+    )
+    return {"revisions": reports, "delta": delta}
+
+
+def _parse_args() -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.fleet",
+        description="Measure the integration with many config entries.",
+    )
+    parser.add_argument("-n", "--entries", type=int, default=500)
+    parser.add_argument(
+        "-w", "--window", type=float, default=60, help="steady polling seconds"
+    )
+    parser.add_argument("--scan-interval", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10, help="tracemalloc entries")
+    parser.add_argument("--network", default="127.1.0.0/16")
+    parser.add_argument(
+        "--no-keep-alive",
+        action="store_true",
+        help="simulate devices closing the connections",
+    )
+    parser.add_argument(
+        "--hosts-file", type=Path, help="use an already running simulator"
+    )
+    parser.add_argument(
+        "--source",
+        type=Path,
+        default=Path.cwd(),
+        help="directory containing custom_components",
+    )
+    parser.add_argument(
+        "--revisions", nargs=2, metavar=("BASE", "HEAD"), help="compare revisions"
+    )
+    parser.add_argument("-o", "--output", type=Path, help="write the JSON report")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the fleet harness."""
+    args = _parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+    _LOGGER.setLevel(logging.INFO)
+
+    if args.revisions:
+        result = compare_revisions(args, args.revisions)
+    else:
+        sys.path.insert(0, str(args.source.resolve()))
+        result = asyncio.run(_run(args))
+
+    output = json.dumps(result, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Replay a captured device traffic and measure the polls.
+
+The polls are issued at the recorded pace divided by the speed, each of them
+served by the replay strategy after the recorded duration divided by the
+speed. A speed of 0 replays everything back to back without waiting.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+from custom_components.venta.json import extract_json
+from custom_components.venta.venta_capture import (
+    VentaReplayStrategy,
+    is_action,
+    read_capture,
+)
+from custom_components.venta.venta_client import VentaDevice
+from custom_components.venta.venta_protocol import API_DEFINITIONS, VentaDeviceType
+
+from .runner import BenchmarkResult, report
+
+
+async def replay(paths: list[Path], speed: float) -> list[BenchmarkResult]:
+    """Replay the captured status polls through a device."""
+    exchanges = read_capture(paths)
+    # The capture may start with actions, the polls are the status requests
+    # of the definition polled first
+    statuses = {(d.status.method, d.status.url): d for d in API_DEFINITIONS}
+    polls = [
+        exchange
+        for exchange in exchanges
+        if (exchange["method"], exchange["url"]) in statuses and not is_action(exchange)
+    ]
+    if not polls:
+        return []
+    status = (polls[0]["method"], polls[0]["url"])
+    polls = [e for e in polls if (e["method"], e["url"]) == status]
+
+    header = next(extract_json(polls[0]["response"]), {}).get("Header", {})
+    device = VentaDevice("replay", timedelta(seconds=10), statuses[status].id)
+    device.set_strategy(VentaReplayStrategy(exchanges, speed))
+    try:
+        device.device_type = VentaDeviceType(header.get("DeviceType"))
+    except ValueError:
+        device.device_type = VentaDeviceType.UNKNOWN
+
+    timings, cpu_timings = [], []
+    clock, start = time.perf_counter, time.perf_counter()
+    for exchange in polls:
+        if speed and (delay := (exchange["ts"] - polls[0]["ts"]) / speed) > (
+            elapsed := clock() - start
+        ):
+            await asyncio.sleep(delay - elapsed)
+        poll_start, cpu_start = clock(), time.process_time()
+        await device.status()
+        timings.append(clock() - poll_start)
+        cpu_timings.append(time.process_time() - cpu_start)
+    await device.close()
+
+    model = device.device_type.value
+    return [
+        BenchmarkResult.from_timings(model, "replay_poll", timings),
+        BenchmarkResult.from_timings(model, "replay_poll_cpu", cpu_timings),
+    ]
+
+
+def main() -> None:
+    """Replay the capture files."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.replay",
+        description="Replay a Venta capture and measure the polls.",
+    )
+    parser.add_argument("captures", type=Path, nargs="+")
+    parser.add_argument("-s", "--speed", type=float, default=1.0)
+    parser.add_argument("-o", "--output", type=Path, help="write the JSON report")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    output = json.dumps(
+        report(asyncio.run(replay(args.captures, args.speed))), indent=2
+    )
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        sys.stdout.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
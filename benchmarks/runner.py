@@ -0,0 +1,127 @@
+"""Timing helpers and result reporting for the benchmarks."""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import subprocess
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings of a single stage for a single device model."""
+
+    model: int
+    stage: str
+    iterations: int
+    min_us: float
+    mean_us: float
+    median_us: float
+    p95_us: float
+    max_us: float
+    ops_per_sec: float
+
+    @classmethod
+    def from_timings(
+        cls, model: int, stage: str, timings: list[float]
+    ) -> BenchmarkResult:
+        """Summarize the timings given in seconds."""
+        timings = sorted(timings)
+        mean = statistics.fmean(timings)
+        return cls(
+            model=model,
+            stage=stage,
+            iterations=len(timings),
+            min_us=timings[0] * 1e6,
+            mean_us=mean * 1e6,
+            median_us=statistics.median(timings) * 1e6,
+            p95_us=timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1e6,
+            max_us=timings[-1] * 1e6,
+            ops_per_sec=1 / mean if mean else 0.0,
+        )
+
+
+def measure(
+    model: int, stage: str, fun: Callable[[], Any], iterations: int
+) -> BenchmarkResult:
+    """Measure a synchronous callable."""
+    timings = []
+    clock = time.perf_counter
+    for _ in range(iterations):
+        start = clock()
+        fun()
+        timings.append(clock() - start)
+    return BenchmarkResult.from_timings(model, stage, timings)
+
+
+async def measure_async(
+    model: int, stage: str, fun: Callable[[], Awaitable[Any]], iterations: int
+) -> BenchmarkResult:
+    """Measure an awaitable factory."""
+    timings = []
+    clock = time.perf_counter
+    for _ in range(iterations):
+        start = clock()
+        await fun()
+        timings.append(clock() - start)
+    return BenchmarkResult.from_timings(model, stage, timings)
+
+
+def git_revision(cwd: Path | None = None) -> str | None:
+    """Return the current git revision if available."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            capture_output=True,
+            check=True,
+            cwd=cwd,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def report(results: list[BenchmarkResult]) -> dict[str, Any]:
+    """Build the machine readable report."""
+    return {
+        "meta": {
+            "created": datetime.now(UTC).isoformat(),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": [asdict(result) for result in results],
+    }
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Return the stages that got slower than the baseline by the threshold."""
+    previous = {
+        (result["model"], result["stage"]): result for result in baseline["results"]
+    }
+    regressions = []
+    for result in current["results"]:
+        if (old := previous.get((result["model"], result["stage"]))) is None:
+            continue
+        ratio = result["median_us"] / old["median_us"] if old["median_us"] else 1
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{result['model']:>4} {result['stage']:<16} "
+                f"{old['median_us']:10.2f}us -> {result['median_us']:10.2f}us "
+                f"({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def load_report(path: Path) -> dict[str, Any]:
+    """Load a previously written report."""
+    return json.loads(path.read_text())
@@ -0,0 +1,217 @@
+"""Measure the cost of the retry policies under injected faults.
+
+Every scenario polls a simulated device through the fault strategy for a
+number of polls, then switches the faults off and measures how long it
+takes until the next successful poll.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+from aiohttp import ClientSession
+
+from custom_components.venta.venta_client import VentaDevice
+from custom_components.venta.venta_protocol import VentaApiVersion, VentaTcpHeader
+from custom_components.venta.venta_strategy import (
+    VentaApiHostDefinition,
+    VentaHttpStrategy,
+    VentaTcpStrategy,
+)
+from simulator import FaultProfile, VentaSimulator, VirtualDevice
+
+from .faults import FaultRates, RetryPolicy, VentaFaultStrategy
+from .runner import git_revision
+from .stages import SIMULATOR_HOST, api_definition
+
+
+@dataclass
+class Scenario:
+    """Faults injected by the strategy and sent by the simulated device."""
+
+    rates: FaultRates = field(default_factory=FaultRates)
+    device: FaultProfile = field(default_factory=FaultProfile)
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "lossy": Scenario(FaultRates(delay=0.3, delay_rate=0.3, reset_rate=0.1)),
+    "half_open": Scenario(FaultRates(hang_rate=0.3)),
+    "corrupt": Scenario(device=FaultProfile(truncate_rate=0.2, garbage_rate=0.2)),
+    "outage": Scenario(FaultRates(reset_rate=1.0)),
+}
+POLICIES: dict[str, RetryPolicy] = {
+    "default": RetryPolicy(),
+    "fast": RetryPolicy(retries=3, timeout=2, delay=0.2),
+    "single": RetryPolicy(retries=1, timeout=5, delay=0),
+}
+MAX_RECOVERY_POLLS = 100
+
+
+@dataclass
+class ScenarioResult:
+    """Outcome of a scenario for a retry policy and device model."""
+
+    scenario: str
+    policy: str
+    model: int
+    polls: int
+    successes: int = 0
+    errors: int = 0
+    attempts: int = 0
+    retries: int = 0
+    timeouts: int = 0
+    wasted_s: float = 0.0
+    wasted_cpu_s: float = 0.0
+    poll_ms: dict[str, float] = field(default_factory=dict)
+    recovery_s: float | None = None
+
+
+async def _poll(device: VentaDevice) -> bool:
+    """Poll the device the way the coordinator does, returns the success."""
+    try:
+        return not (await device.status()).is_empty
+    except Exception:  # noqa: BLE001
+        # The coordinator catches everything and marks the update as failed
+        return False
+
+
+async def run_scenario(  # noqa: PLR0913
+    session: ClientSession,
+    simulator: VentaSimulator,
+    virtual: VirtualDevice,
+    scenario: str,
+    policy: str,
+    polls: int,
+    seed: int,
+) -> ScenarioResult:
+    """Run a single scenario against the simulated device."""
+    definition = api_definition(virtual.device_type)
+    if definition.version == VentaApiVersion.V0:
+        inner = VentaTcpStrategy(
+            VentaApiHostDefinition(SIMULATOR_HOST, simulator.tcp_port)
+        )
+        inner.set_header(VentaTcpHeader(virtual.mac, virtual.device_type))
+    else:
+        inner = VentaHttpStrategy(
+            VentaApiHostDefinition(SIMULATOR_HOST, simulator.http_port), session
+        )
+    strategy = VentaFaultStrategy(
+        inner, SCENARIOS[scenario].rates, POLICIES[policy], seed=seed
+    )
+    simulator.faults = SCENARIOS[scenario].device
+    device = VentaDevice(SIMULATOR_HOST, timedelta(seconds=10), definition.id)
+    device.set_strategy(strategy)
+
+    result = ScenarioResult(scenario, policy, virtual.device_type, polls)
+    timings = []
+    for _ in range(polls):
+        start = time.perf_counter()
+        if await _poll(device):
+            result.successes += 1
+        else:
+            result.errors += 1
+        timings.append(time.perf_counter() - start)
+
+    strategy.faults = FaultRates()
+    simulator.faults = FaultProfile()
+    start = time.perf_counter()
+    for _ in range(MAX_RECOVERY_POLLS):
+        if await _poll(device):
+            result.recovery_s = time.perf_counter() - start
+            break
+
+    timings.sort()
+    result.poll_ms = {
+        "p50": statistics.median(timings) * 1e3,
+        "p95": timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1e3,
+        "max": timings[-1] * 1e3,
+    }
+    result.attempts = strategy.stats.attempts
+    result.retries = device.metrics.retries
+    result.timeouts = device.metrics.timeouts
+    result.wasted_s = strategy.stats.wasted_s
+    result.wasted_cpu_s = strategy.stats.wasted_cpu_s
+    return result
+
+
+async def run(
+    scenarios: list[str],
+    policies: list[str],
+    models: list[int],
+    polls: int,
+    seed: int = 0,
+) -> list[ScenarioResult]:
+    """Run every combination of the scenarios, policies and models."""
+    # The simulated devices draw their faults from the global generator
+    random.seed(seed)
+    devices = [VirtualDevice.create(model, SIMULATOR_HOST, model) for model in models]
+    results = []
+    async with ClientSession() as session:
+        for virtual in devices:
+            async with VentaSimulator(
+                [virtual], http_port=0, tcp_port=0, bind=SIMULATOR_HOST
+            ) as simulator:
+                for scenario in scenarios:
+                    for policy in policies:
+                        logging.info("Running %s with %s policy", scenario, policy)
+                        results.append(
+                            await run_scenario(
+                                session,
+                                simulator,
+                                virtual,
+                                scenario,
+                                policy,
+                                polls,
+                                seed,
+                            )
+                        )
+    return results
+
+
+def main() -> None:
+    """Run the fault scenarios."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.scenarios",
+        description="Measure recovery time and wasted work of the retry policies.",
+    )
+    parser.add_argument(
+        "--scenarios", nargs="+", default=list(SCENARIOS), choices=SCENARIOS
+    )
+    parser.add_argument(
+        "--policies", nargs="+", default=list(POLICIES), choices=POLICIES
+    )
+    parser.add_argument("-m", "--models", type=int, nargs="+", default=[1, 500])
+    parser.add_argument("-n", "--polls", type=int, default=20)
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", type=Path, help="write the JSON report")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.CRITICAL)
+
+    results = asyncio.run(
+        run(args.scenarios, args.policies, args.models, args.polls, args.seed)
+    )
+    report: dict[str, Any] = {
+        "meta": {"revision": git_revision(), "seed": args.seed},
+        "results": [asdict(result) for result in results],
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        sys.stdout.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
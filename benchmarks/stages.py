@@ -0,0 +1,222 @@
+"""Benchmarked stages of the per-poll hot path."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import socket
+import struct
+from datetime import timedelta
+from typing import Any
+
+from aiohttp import ClientSession
+
+from custom_components.venta.json import extract_json
+from custom_components.venta.venta_client import VentaDevice
+from custom_components.venta.venta_protocol import (
+    API_DEFINITIONS,
+    VentaApiVersion,
+    VentaDeviceType,
+    VentaTcpHeader,
+    build_message,
+    parse_v0_response,
+)
+from custom_components.venta.venta_strategy import (
+    VentaApiHostDefinition,
+    VentaHttpStrategy,
+    VentaProtocolStrategy,
+    VentaTcpProtocol,
+    VentaTcpStrategy,
+)
+from simulator import FaultProfile, VentaSimulator, VirtualDevice
+
+from .runner import BenchmarkResult, measure, measure_async
+
+_LOGGER = logging.getLogger(__name__)
+
+SIMULATOR_HOST = "127.0.0.1"
+
+
+def api_definition(model: int) -> Any:  # noqa: ANN401
+    """Return the api definition used by the device model."""
+    version = VirtualDevice.create(model, SIMULATOR_HOST, 0).api_version
+    if model in (100, 150):
+        return API_DEFINITIONS[1]
+    return next(d for d in API_DEFINITIONS if d.version.value == version)
+
+
+def fixture_payload(model: int) -> tuple[dict[str, Any], str]:
+    """Return the status payload of the model generated from the resources."""
+    data = VirtualDevice.create(model, SIMULATOR_HOST, model).status()
+    return data, json.dumps(data, separators=(",", ":"))
+
+
+def create_device(model: int, data: dict[str, Any], **kwargs: Any) -> VentaDevice:  # noqa: ANN401
+    """Create the device of the model without talking to it."""
+    device = VentaDevice(
+        SIMULATOR_HOST, timedelta(seconds=10), api_definition(model).id, **kwargs
+    )
+    device.device_type = VentaDeviceType(model)
+    device.mac = data["Header"].get("MacAdress") or data["Header"].get("DeviceId")
+    return device
+
+
+async def _round_trip(
+    model: int, iterations: int, session: ClientSession
+) -> BenchmarkResult:
+    """Measure the transport round trip against the loopback simulator."""
+    virtual = VirtualDevice.create(model, SIMULATOR_HOST, model)
+    definition = api_definition(model)
+    async with VentaSimulator(
+        [virtual], FaultProfile(), http_port=0, tcp_port=0, bind=SIMULATOR_HOST
+    ) as simulator:
+        strategy: VentaProtocolStrategy
+        if definition.version == VentaApiVersion.V0:
+            strategy = VentaTcpStrategy(
+                VentaApiHostDefinition(SIMULATOR_HOST, simulator.tcp_port)
+            )
+        else:
+            strategy = VentaHttpStrategy(
+                VentaApiHostDefinition(SIMULATOR_HOST, simulator.http_port), session
+            )
+        status = definition.status
+        return await measure_async(
+            model,
+            "round_trip",
+            lambda: strategy.get_status(status.method, status.url),
+            iterations,
+        )
+
+
+async def _stream_exchange(port: int, message: bytes) -> dict[str, Any] | None:
+    """Exchange the message over streams, the V0 path before VentaTcpProtocol.
+
+    The response is read in chunks and fully parsed after every chunk to know
+    if it is complete, then decoded again, and the connection is reset the
+    same way the strategy does.
+    """
+    reader, writer = await asyncio.open_connection(SIMULATOR_HOST, port)
+    try:
+        writer.write(message)
+        await writer.drain()
+        response = b""
+        while chunk := await reader.read(2**16):
+            response += chunk
+            with contextlib.suppress(ValueError):
+                json.loads(response)
+                break
+        return parse_v0_response(response)
+    finally:
+        writer.get_extra_info("socket").setsockopt(
+            socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+        )
+        writer.transport.abort()
+
+
+async def _stream_round_trip(model: int, iterations: int) -> BenchmarkResult:
+    """Measure the round trip of the former V0 stream path for comparison."""
+    virtual = VirtualDevice.create(model, SIMULATOR_HOST, model)
+    message = build_message(
+        "GET", "Complete", header=VentaTcpHeader(virtual.mac, model)
+    )
+    async with VentaSimulator(
+        [virtual], FaultProfile(), http_port=0, tcp_port=0, bind=SIMULATOR_HOST
+    ) as simulator:
+        return await measure_async(
+            model,
+            "round_trip_stream",
+            lambda: _stream_exchange(simulator.tcp_port, message),
+            iterations,
+        )
+
+
+async def _receive(model: int, raw: bytes, iterations: int) -> list[BenchmarkResult]:
+    """Measure receiving a response on a socket pair, with both V0 paths."""
+    loop = asyncio.get_running_loop()
+    protocol_sock, protocol_peer = socket.socketpair()
+    stream_sock, stream_peer = socket.socketpair()
+    transport, protocol = await loop.create_connection(
+        lambda: VentaTcpProtocol(bytearray(2**12)), sock=protocol_sock
+    )
+    reader, writer = await asyncio.open_connection(sock=stream_sock)
+
+    async def _protocol() -> None:
+        # Received by the loop only once the request waits for it
+        protocol_peer.send(raw)
+        await protocol.request(b"")
+
+    async def _stream() -> None:
+        stream_peer.send(raw)
+        response = b""
+        while chunk := await reader.read(2**16):
+            response += chunk
+            with contextlib.suppress(ValueError):
+                json.loads(response)
+                break
+        parse_v0_response(response)
+
+    try:
+        return [
+            await measure_async(model, "receive", _protocol, iterations),
+            await measure_async(model, "receive_stream", _stream, iterations),
+        ]
+    finally:
+        transport.close()
+        writer.close()
+        protocol_peer.close()
+        stream_peer.close()
+
+
+async def run_model(
+    session: ClientSession, model: int, iterations: int
+) -> list[BenchmarkResult]:
+    """Run the transport and parsing stages for a single device model."""
+    data, raw = fixture_payload(model)
+    device = create_device(model, data)
+    results = []
+
+    if api_definition(model).version == VentaApiVersion.V0:
+        header = VentaTcpHeader(device.mac, model)
+        results.append(
+            measure(
+                model,
+                "build_message",
+                lambda: build_message("GET", "Complete", header=header),
+                iterations,
+            )
+        )
+
+    results.append(await _round_trip(model, max(1, iterations // 10), session))
+    if api_definition(model).version == VentaApiVersion.V0:
+        results.append(await _stream_round_trip(model, max(1, iterations // 10)))
+        results.extend(await _receive(model, raw.encode(), iterations))
+    results.append(
+        measure(model, "extract_json", lambda: next(extract_json(raw)), iterations)
+    )
+    encoded = raw.encode()
+    results.append(
+        measure(model, "parse_response", lambda: parse_v0_response(encoded), iterations)
+    )
+    results.append(
+        await measure_async(
+            model, "map_data", lambda: device._map_data(data), iterations
+        )
+    )
+    return results
+
+
+async def run(models: list[int], iterations: int) -> list[BenchmarkResult]:
+    """Run the benchmarks for the device models."""
+    # Home Assistant is only needed by the entity stages
+    from .entities import async_start_hass
+    from .entities import run_model as run_entities
+
+    results: list[BenchmarkResult] = []
+    async with async_start_hass() as hass, ClientSession() as session:
+        for model in models:
+            _LOGGER.info("Benchmarking model %s", model)
+            results.extend(await run_model(session, model, iterations))
+            results.extend(await run_entities(hass, model, iterations))
+    return results
@@ -0,0 +1,399 @@
+"""Talk to Venta devices from the command line, without Home Assistant."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from itertools import cycle
+from typing import Any
+
+from .const import DEFAULT_SCAN_INTERVAL, DEFAULT_TIMEOUT
+from .venta_client import VentaDevice
+from .venta_discovery import discover, network_hosts
+from .venta_protocol import (
+    DEVICE_TYPE_API_DEFINITIONS,
+    VentaApiVersion,
+    VentaDeviceType,
+    VentaTcpHeader,
+    shape_action,
+)
+from .venta_session import VentaSession
+from .venta_strategy import (
+    VentaApiHostDefinition,
+    VentaHttpStrategy,
+    VentaSocketOptions,
+    VentaTcpStrategy,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _latency(timings: list[float]) -> str:
+    """Format the latency percentiles of the timings."""
+    if not timings:
+        return "no responses"
+    ordered = sorted(timings)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (
+        f"p50 {statistics.median(ordered) * 1e3:.1f} ms  "
+        f"p95 {p95 * 1e3:.1f} ms  max {ordered[-1] * 1e3:.1f} ms"
+    )
+
+
+def _value(value: str) -> Any:  # noqa: ANN401
+    """Parse the action value as JSON, e.g. true or 2, falling back to text."""
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+async def _gather(
+    hosts: list[str],
+    concurrency: int,
+    func: Callable[[str], Awaitable[Any]],
+) -> list[Any]:
+    """Run the function for every host, at most concurrency at a time."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run(host: str) -> Any:  # noqa: ANN401
+        async with semaphore:
+            return await func(host)
+
+    return await asyncio.gather(*(_run(host) for host in hosts), return_exceptions=True)
+
+
+async def _connect(
+    session: VentaSession, host: str, args: argparse.Namespace
+) -> VentaDevice:
+    """Detect the api of the device and read its identity.
+
+    The device is closed when it cannot be identified, otherwise the caller
+    closes it.
+    """
+    device = VentaDevice(
+        host,
+        timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+        None,
+        session,
+        request_timeout=args.timeout,
+    )
+    try:
+        await device.detect_api(args.api_version)
+        await device.init()
+    except BaseException:
+        await device.close()
+        raise
+    return device
+
+
+async def _close(devices: list[VentaDevice]) -> None:
+    """Close the devices and their kept connections."""
+    await asyncio.gather(*(device.close() for device in devices))
+
+
+async def _detect(session: VentaSession, args: argparse.Namespace) -> None:
+    """Detect the api of every host concurrently."""
+
+    async def _probe(host: str) -> tuple[VentaDevice, float]:
+        start = time.perf_counter()
+        device = await _connect(session, host, args)
+        return device, time.perf_counter() - start
+
+    results = await _gather(args.hosts, args.concurrency, _probe)
+    devices = [result[0] for result in results if isinstance(result, tuple)]
+    try:
+        for host, result in zip(args.hosts, results):
+            if isinstance(result, BaseException):
+                print(f"{host}\terror\t{type(result).__name__}")
+                continue
+            device, duration = result
+            print(
+                f"{host}\t{device.api_definition.id}\t{device.device_type.name}"
+                f"\t{device.mac}\t{duration * 1e3:.1f} ms"
+            )
+    finally:
+        await _close(devices)
+
+
+async def _scan(session: VentaSession, args: argparse.Namespace) -> None:
+    """Scan the network for devices."""
+    start = time.perf_counter()
+    devices = await discover(network_hosts(args.network), session, args.concurrency)
+    for device in sorted(devices, key=lambda d: d.duration):
+        print(
+            f"{device.host}\t{device.api_definition.id}\t{device.device_type.name}"
+            f"\t{device.mac}\t{device.duration * 1e3:.1f} ms"
+        )
+    print(f"{len(devices)} devices in {time.perf_counter() - start:.1f} s")
+
+
+async def _poll(session: VentaSession, args: argparse.Namespace) -> None:
+    """Poll the hosts in a loop and print their latency."""
+    results = await _gather(
+        args.hosts, args.concurrency, lambda host: _connect(session, host, args)
+    )
+    devices = []
+    for host, result in zip(args.hosts, results):
+        if isinstance(result, BaseException):
+            print(f"{host}\terror\t{type(result).__name__}")
+        else:
+            devices.append(result)
+
+    timings: dict[str, list[float]] = {device.host: [] for device in devices}
+    errors = dict.fromkeys(timings, 0)
+
+    async def _status(device: VentaDevice) -> None:
+        start = time.perf_counter()
+        try:
+            data = await device.status()
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.info("Polling %s failed: %s", device.host, err)
+            errors[device.host] += 1
+            return
+        if data.is_empty:
+            errors[device.host] += 1
+        else:
+            timings[device.host].append(time.perf_counter() - start)
+
+    polls = 0
+    try:
+        while devices and (not args.count or polls < args.count):
+            start = time.monotonic()
+            await asyncio.gather(*(_status(device) for device in devices))
+            polls += 1
+            _LOGGER.info("Poll %d done in %.3f s", polls, time.monotonic() - start)
+            if not args.count or polls < args.count:
+                await asyncio.sleep(max(0, args.interval - time.monotonic() + start))
+    finally:
+        for device in devices:
+            metrics = device.metrics
+            keep_alive = {None: "unknown", True: "yes", False: "no"}[device.keep_alive]
+            print(
+                f"{device.host}\t{device.device_type.name}\t{polls} polls"
+                f"\t{errors[device.host]} errors\t{_latency(timings[device.host])}"
+                f"\t{metrics.retries} retries\t{metrics.timeouts} timeouts"
+                f"\t{metrics.bytes_out} B out\t{metrics.bytes_in} B in"
+                f"\tkeep-alive {keep_alive}\t{metrics.sockets_opened} sockets"
+                f" ({metrics.sockets_open} open, {metrics.sockets_reset} reset,"
+                f" linger p95 {metrics.linger.p95} ms)"
+            )
+        await _close(devices)
+
+
+async def _action(session: VentaSession, args: argparse.Namespace) -> None:
+    """Send the action to the host and print the resulting settings."""
+    changes = {}
+    for setting in args.settings:
+        name, separator, value = setting.partition("=")
+        if not separator:
+            raise SystemExit(f"Setting {setting!r} is not in the NAME=VALUE form")
+        changes[name] = _value(value)
+
+    device = await _connect(session, args.host, args)
+    try:
+        data = await device.action(shape_action(device.api_version, changes))
+    finally:
+        await device.close()
+    if data.is_empty:
+        raise SystemExit(f"No response from {args.host}")
+    print(json.dumps(data.action.as_dict(), indent=2))
+
+
+async def _bench(session: VentaSession, args: argparse.Namespace) -> None:
+    """Poll simulated devices as fast as possible and print the throughput."""
+    try:
+        from simulator import VentaSimulator
+    except ImportError as err:
+        raise SystemExit(
+            "The bench command needs the simulator package of the repository"
+        ) from err
+
+    simulator = VentaSimulator.create(
+        args.devices,
+        tuple(args.models),
+        network=args.network,
+        http_port=0,
+        tcp_port=0,
+        bind=args.bind,
+    )
+    async with simulator:
+        devices = []
+        for virtual in simulator.devices.values():
+            definition = DEVICE_TYPE_API_DEFINITIONS[
+                VentaDeviceType(virtual.device_type)
+            ]
+            device = VentaDevice(
+                virtual.host,
+                timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+                definition.id,
+                session,
+                request_timeout=args.timeout,
+            )
+            if definition.version == VentaApiVersion.V0:
+                strategy = VentaTcpStrategy(
+                    VentaApiHostDefinition(virtual.host, simulator.tcp_port),
+                    resolver=session.resolver,
+                    socket_options=VentaSocketOptions(
+                        nodelay=not args.delay, abortive_close=args.abortive_close
+                    ),
+                )
+                strategy.set_header(VentaTcpHeader(virtual.mac, virtual.device_type))
+            else:
+                strategy = VentaHttpStrategy(
+                    VentaApiHostDefinition(virtual.host, simulator.http_port), session
+                )
+            device.set_strategy(strategy)
+            devices.append(device)
+
+        timings: list[float] = []
+        errors = 0
+        deadline = time.monotonic() + args.duration
+        queue = cycle(devices)
+
+        async def _worker() -> None:
+            nonlocal errors
+            while time.monotonic() < deadline:
+                device = next(queue)
+                start = time.perf_counter()
+                try:
+                    empty = (await device.status()).is_empty
+                except Exception:  # noqa: BLE001
+                    empty = True
+                if empty:
+                    errors += 1
+                else:
+                    timings.append(time.perf_counter() - start)
+
+        start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            await asyncio.gather(*(_worker() for _ in range(args.concurrency)))
+            elapsed = time.perf_counter() - start
+            cpu = time.process_time() - cpu_start
+            kept = sum(d.metrics.sockets_open for d in devices)
+        finally:
+            # Before the simulator stops, so the kept connections close cleanly
+            await _close(devices)
+
+    polls = len(timings) + errors
+    print(
+        f"{len(devices)} devices\t{polls} polls\t{polls / elapsed:.1f} polls/s"
+        f"\t{errors} errors"
+    )
+    print(f"{_latency(timings)}\tcpu {cpu / max(polls, 1) * 1e3:.3f} ms/poll")
+    print(
+        f"{sum(d.metrics.sockets_opened for d in devices)} V0 sockets"
+        f"\t{kept} open"
+        f"\t{sum(d.metrics.sockets_reset for d in devices)} reset"
+    )
+
+
+COMMANDS: dict[str, Callable[[VentaSession, argparse.Namespace], Awaitable[None]]] = {
+    "detect": _detect,
+    "scan": _scan,
+    "poll": _poll,
+    "action": _action,
+    "bench": _bench,
+}
+
+
+def _parse_args() -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m custom_components.venta",
+        description="Talk to Venta devices without Home Assistant.",
+    )
+    parser.add_argument("-v", "--verbose", action="count", default=0)
+    parser.add_argument(
+        "--timeout",
+        type=int,
+        default=DEFAULT_TIMEOUT,
+        help="seconds to wait for a single request",
+    )
+    parser.add_argument(
+        "--api-version",
+        type=int,
+        choices=[version.value for version in VentaApiVersion],
+        help="only try this protocol version when detecting",
+    )
+    parser.add_argument(
+        "-c", "--concurrency", type=int, default=32, help="parallel requests"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    detect = commands.add_parser("detect", help="detect the api of the hosts")
+    detect.add_argument("hosts", nargs="+")
+
+    scan = commands.add_parser("scan", help="scan the network for devices")
+    scan.add_argument("network", help="e.g. 192.168.1.0/24")
+
+    poll = commands.add_parser("poll", help="poll the hosts and print the latency")
+    poll.add_argument("hosts", nargs="+")
+    poll.add_argument(
+        "-n", "--count", type=int, default=0, help="number of polls, 0 until stopped"
+    )
+    poll.add_argument(
+        "-i",
+        "--interval",
+        type=float,
+        default=DEFAULT_SCAN_INTERVAL,
+        help="seconds between the polls",
+    )
+
+    action = commands.add_parser("action", help="change the settings of a host")
+    action.add_argument("host")
+    action.add_argument("settings", nargs="+", help="NAME=VALUE, e.g. Power=false")
+
+    bench = commands.add_parser(
+        "bench", help="measure the polling throughput against the simulator"
+    )
+    bench.add_argument("-n", "--devices", type=int, default=100)
+    bench.add_argument("-m", "--models", type=int, nargs="+", default=[1, 106, 500])
+    bench.add_argument("-d", "--duration", type=float, default=10.0, help="seconds")
+    bench.add_argument("--network", default="127.1.0.0/16")
+    bench.add_argument(
+        "--bind",
+        default="0.0.0.0",
+        help="address the simulator listens on for all the devices",
+    )
+    bench.add_argument(
+        "--abortive-close",
+        action="store_true",
+        help="reset the V0 connections instead of closing them with a handshake",
+    )
+    bench.add_argument(
+        "--delay", action="store_true", help="keep Nagle's algorithm on V0 sockets"
+    )
+    return parser.parse_args()
+
+
+async def _run(args: argparse.Namespace) -> None:
+    """Run the command with a shared session."""
+    session = VentaSession()
+    try:
+        await COMMANDS[args.command](session, args)
+    finally:
+        _LOGGER.info("HTTP connection pool: %s", session.as_dict())
+        await session.close()
+
+
+def main() -> None:
+    """Run the command line."""
+    args = _parse_args()
+    logging.basicConfig(
+        level=[logging.WARNING, logging.INFO, logging.DEBUG][min(args.verbose, 2)]
+    )
+    try:
+        asyncio.run(_run(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -4,36 +4,57 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
 from datetime import timedelta
 from enum import IntEnum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 from aiohttp import ClientError
 from homeassistant import config_entries
+from homeassistant.components import network
 from homeassistant.const import (
     CONF_API_VERSION,
     CONF_HOST,
     CONF_MAC,
     CONF_SCAN_INTERVAL,
+    CONF_TIMEOUT,
 )
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers import selector
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers import discovery_flow, selector
+from homeassistant.helpers.device_registry import format_mac
+from homeassistant.helpers.typing import DiscoveryInfoType
 
 from .const import (
     AUTO_API_VERSION,
     CONF_API_DEFINITION_ID,
+    CONF_CAPTURE,
+    CONF_ENTITY_PROFILE,
+    CONF_HOSTS,
+    CONF_KEEP_ALIVE,
+    CONF_NETWORK,
+    DEFAULT_ENTITY_PROFILE,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TIMEOUT,
+    DISCOVERY_MAX_HOSTS,
     DOMAIN,
+    ENTITY_PROFILES,
 )
-from .venta import (
-    VentaApiDefinition,
-    VentaApiVersion,
-    VentaApiVersionError,
-    VentaDevice,
+from .utils import async_get_session
+from .venta_client import VentaApiVersionError, VentaDevice
+from .venta_discovery import (
+    VentaDiscoveredDevice,
+    VentaHostReport,
+    discover,
+    identify,
+    identify_hosts,
+    network_hosts,
 )
+from .venta_protocol import API_DEFINITIONS, VentaApiDefinition, VentaApiVersion
+
+if TYPE_CHECKING:
+    from homeassistant.helpers.service_info.dhcp import DhcpServiceInfo
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -60,6 +81,30 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
+def _discovery_info(device: VentaDiscoveredDevice) -> DiscoveryInfoType:
+    """Return the discovery info of the device found on the network."""
+    return {
+        CONF_HOST: device.host,
+        CONF_MAC: device.mac,
+        CONF_API_DEFINITION_ID: device.api_definition.id,
+        "model": device.device_type.name,
+    }
+
+
+def _format_report(report: VentaHostReport, configured: set[str | None]) -> str:
+    """Format the outcome of the onboarding of a single host."""
+    timing = f"{report.duration * 1000:.0f} ms"
+    if (device := report.device) is None:
+        return f"- {report.host}: no Venta device found ({timing})"
+    if report.duplicate_of is not None:
+        return f"- {report.host}: same device as {report.duplicate_of} ({timing})"
+    if device.mac in configured:
+        return (
+            f"- {report.host}: {device.device_type.name} already configured ({timing})"
+        )
+    return f"- {report.host}: {device.device_type.name} added ({timing})"
+
+
 class ConfigVersion(IntEnum):
     """Config version."""
 
@@ -81,16 +126,34 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Create the options flow."""
         return OptionsFlowHandler(config_entry)
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._discovery_info: DiscoveryInfoType = {}
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the initial step."""
+        return self.async_show_menu(
+            step_id="user", menu_options=["manual", "scan", "hosts"]
+        )
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle the device entered by its address."""
         errors: dict[str, str] = {}
         if user_input is not None:
             host = user_input[CONF_HOST]
             update_interval = timedelta(
                 seconds=user_input.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
             )
+            device = VentaDevice(
+                host,
+                update_interval,
+                None,
+                async_get_session(self.hass),
+            )
             try:
                 async with asyncio.timeout(30):
                     api_version = (
@@ -98,12 +161,6 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         if user_input[CONF_API_VERSION] != AUTO_API_VERSION
                         else None
                     )
-                    device = VentaDevice(
-                        host,
-                        update_interval,
-                        None,
-                        async_get_clientsession(self.hass),
-                    )
                     await device.detect_api(api_version=api_version)
                     await device.init()
             except (asyncio.TimeoutError, ClientError):
@@ -121,10 +178,180 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     device.update_interval,
                     device.api_definition,
                     device.mac,
+                    device.keep_alive,
+                )
+            finally:
+                await device.close()
+
+        return self.async_show_form(
+            step_id="manual", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+        )
+
+    async def async_step_scan(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Scan the network and offer the found devices for the setup."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            try:
+                hosts = network_hosts(user_input[CONF_NETWORK])
+            except ValueError:
+                errors[CONF_NETWORK] = "invalid_network"
+            else:
+                if len(hosts) > DISCOVERY_MAX_HOSTS:
+                    errors[CONF_NETWORK] = "network_too_large"
+
+            if not errors:
+                devices = await discover(hosts, async_get_session(self.hass))
+                configured = self._async_current_ids()
+                devices = [d for d in devices if d.mac not in configured]
+                if not devices:
+                    return self.async_abort(reason="no_devices_found")
+                for device in devices:
+                    discovery_flow.async_create_flow(
+                        self.hass,
+                        DOMAIN,
+                        context={"source": config_entries.SOURCE_INTEGRATION_DISCOVERY},
+                        data=_discovery_info(device),
+                    )
+                return self.async_abort(
+                    reason="devices_found",
+                    description_placeholders={"count": str(len(devices))},
+                )
+
+        source_ip = await network.async_get_source_ip(self.hass)
+        return self.async_show_form(
+            step_id="scan",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_NETWORK,
+                        default=f"{source_ip.rpartition('.')[0]}.0/24",
+                    ): str,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_dhcp(self, discovery_info: DhcpServiceInfo) -> FlowResult:
+        """Handle a device found by DHCP, identified with a status request."""
+        host = discovery_info.ip
+        mac = format_mac(discovery_info.macaddress)
+        for entry in self._async_current_entries():
+            if entry.unique_id and format_mac(entry.unique_id) == mac:
+                # Known device, only its address can have changed. The update
+                # listener of the entry reloads it when it did
+                await self.async_set_unique_id(entry.unique_id)
+                self._abort_if_unique_id_configured(
+                    updates={CONF_HOST: host}, reload_on_update=False
                 )
 
+        device = await identify(host, async_get_session(self.hass))
+        if device is None:
+            return self.async_abort(reason="not_venta_device")
+        return await self.async_step_integration_discovery(_discovery_info(device))
+
+    async def async_step_hosts(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Add all the devices found on the listed hosts at once."""
+        if user_input is not None:
+            hosts = list(dict.fromkeys(re.split(r"[\s,;]+", user_input[CONF_HOSTS])))
+            hosts = [host for host in hosts if host]
+            reports = await identify_hosts(hosts, async_get_session(self.hass))
+            configured = self._async_current_ids()
+            devices = [
+                report.device
+                for report in reports
+                if report.device is not None
+                and report.duplicate_of is None
+                and report.device.mac not in configured
+            ]
+            await asyncio.gather(
+                *(
+                    self.hass.config_entries.flow.async_init(
+                        DOMAIN,
+                        context={"source": config_entries.SOURCE_IMPORT},
+                        data=_discovery_info(device),
+                    )
+                    for device in devices
+                )
+            )
+
+            report = "\n".join(_format_report(r, configured) for r in reports)
+            _LOGGER.info("Added %d of %d hosts:\n%s", len(devices), len(hosts), report)
+            return self.async_abort(
+                reason="hosts_added",
+                description_placeholders={
+                    "count": str(len(devices)),
+                    "report": report,
+                },
+            )
+
         return self.async_show_form(
-            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            step_id="hosts",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_HOSTS): selector.TextSelector(
+                        selector.TextSelectorConfig(multiline=True)
+                    ),
+                }
+            ),
+        )
+
+    async def async_step_import(self, import_data: DiscoveryInfoType) -> FlowResult:
+        """Add a device identified by the onboarding of many hosts."""
+        await self.async_set_unique_id(import_data[CONF_MAC])
+        self._abort_if_unique_id_configured(
+            updates={CONF_HOST: import_data[CONF_HOST]}, reload_on_update=False
+        )
+        return await self._create_entry(
+            import_data[CONF_HOST],
+            timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            next(
+                d
+                for d in API_DEFINITIONS
+                if d.id == import_data[CONF_API_DEFINITION_ID]
+            ),
+            import_data[CONF_MAC],
+        )
+
+    async def async_step_integration_discovery(
+        self, discovery_info: DiscoveryInfoType
+    ) -> FlowResult:
+        """Handle a device found on the network."""
+        await self.async_set_unique_id(discovery_info[CONF_MAC])
+        self._abort_if_unique_id_configured(
+            updates={CONF_HOST: discovery_info[CONF_HOST]}, reload_on_update=False
+        )
+        self._discovery_info = discovery_info
+        self.context["title_placeholders"] = {
+            "name": f"{discovery_info['model']} ({discovery_info[CONF_HOST]})"
+        }
+        return await self.async_step_discovery_confirm()
+
+    async def async_step_discovery_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Confirm the setup of the discovered device."""
+        info = self._discovery_info
+        if user_input is not None:
+            return await self._create_entry(
+                info[CONF_HOST],
+                timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+                next(
+                    d for d in API_DEFINITIONS if d.id == info[CONF_API_DEFINITION_ID]
+                ),
+                info[CONF_MAC],
+            )
+
+        self._set_confirm_only()
+        return self.async_show_form(
+            step_id="discovery_confirm",
+            description_placeholders={
+                "model": info["model"],
+                CONF_HOST: info[CONF_HOST],
+            },
         )
 
     async def _create_entry(
@@ -133,6 +360,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         update_interval: timedelta,
         api_definition: VentaApiDefinition,
         mac: str,
+        keep_alive: bool | None = None,
     ) -> FlowResult:
         """Register new entry."""
         if not self.unique_id:
@@ -147,6 +375,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 CONF_API_DEFINITION_ID: api_definition.id,
                 CONF_MAC: mac,
                 CONF_SCAN_INTERVAL: update_interval.seconds,
+                CONF_KEEP_ALIVE: keep_alive,
             },
         )
 
@@ -177,6 +406,23 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         CONF_SCAN_INTERVAL,
                         default=data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
                     ): vol.All(cv.positive_int, vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_TIMEOUT,
+                        default=data.get(CONF_TIMEOUT, DEFAULT_TIMEOUT),
+                    ): vol.All(cv.positive_int, vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_ENTITY_PROFILE,
+                        default=data.get(CONF_ENTITY_PROFILE, DEFAULT_ENTITY_PROFILE),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=ENTITY_PROFILES,
+                            translation_key=CONF_ENTITY_PROFILE,
+                            mode=selector.SelectSelectorMode.DROPDOWN,
+                        ),
+                    ),
+                    vol.Optional(
+                        CONF_CAPTURE, default=data.get(CONF_CAPTURE, False)
+                    ): bool,
                 }
             ),
         )
@@ -1,16 +1,49 @@
 """Constants for the Venta integration."""
 
-from homeassistant.components.humidifier import (
-    MODE_AUTO,
-)
+from datetime import timedelta
+
+try:
+    from homeassistant.components.humidifier import MODE_AUTO
+except ImportError:
+    # The protocol, the client and the command line run without Home Assistant
+    MODE_AUTO = "auto"
 
 DOMAIN = "venta"
 CONF_API_DEFINITION_ID = "api_definition_id"
+CONF_ENTITY_PROFILE = "entity_profile"
+CONF_CAPTURE = "capture"
+CONF_KEEP_ALIVE = "keep_alive"
+CONF_NETWORK = "network"
+CONF_HOSTS = "hosts"
 
 AUTO_API_VERSION = "auto"
 DEFAULT_SCAN_INTERVAL = 10
+DEFAULT_TIMEOUT = 10
+SLOW_UPDATE_TIER_INTERVAL = 6
+# Raw fields read by the slow tier sensors, a change makes the tier due at once
+SLOW_UPDATE_TIER_ACTION_FIELDS: tuple[str, ...] = ("FiltLifetime",)
+SLOW_UPDATE_TIER_INFO_FIELDS: tuple[str, ...] = (
+    "OperationT",
+    "FilterT",
+    "CleaningT",
+    "DiscIonT",
+    "ServiceT",
+    "ServiceMax",
+    "UVCOnT",
+    "UVCOffT",
+)
 NO_WATER_THRESHOLD = 50000
 
+ENTITY_PROFILE_MINIMAL = "minimal"
+ENTITY_PROFILE_STANDARD = "standard"
+ENTITY_PROFILE_FULL = "full"
+ENTITY_PROFILES: list[str] = [
+    ENTITY_PROFILE_MINIMAL,
+    ENTITY_PROFILE_STANDARD,
+    ENTITY_PROFILE_FULL,
+]
+DEFAULT_ENTITY_PROFILE = ENTITY_PROFILE_FULL
+
 MODE_LEVEL_0 = "level_0"
 MODE_LEVEL_1 = "level_1"
 MODE_LEVEL_2 = "level_2"
@@ -95,12 +128,68 @@ ATTR_TIMER = "timer"
 ATTR_LED_STRIP = "led_strip"
 ATTR_LED_STRIP_MODE = "led_strip_mode"
 ATTR_SLEEP_MODE = "sleep_mode"
+ATTR_POLL_LATENCY_P50 = "poll_latency_p50"
+ATTR_POLL_LATENCY_P95 = "poll_latency_p95"
+ATTR_POLL_LATENCY_MAX = "poll_latency_max"
+ATTR_ACTION_LATENCY_P50 = "action_latency_p50"
+ATTR_ACTION_LATENCY_P95 = "action_latency_p95"
+ATTR_ACTION_LATENCY_MAX = "action_latency_max"
+ATTR_RETRIES = "retries"
+ATTR_TIMEOUTS = "timeouts"
+ATTR_EMPTY_RESPONSES = "empty_responses"
+ATTR_BYTES_IN = "bytes_in"
+ATTR_BYTES_OUT = "bytes_out"
 
 ION_DISC_REPLACE_TIME_DAYS = 121  # max seen value 17426 ~ 121 days
 CLEAN_TIME_DAYS = 182  # max seen value 26210 ~ 182 days
 SERVICE_TIME_DAYS = 14  # max seen value 2018 ~ 14 days
 FILTER_TIME_DAYS = 182  # max seen value 26210 ~ 182 days
 
+TEMPERATURE_DEADBAND = 0.2
+HUMIDITY_DEADBAND = 0.5
+PM_DEADBAND = 1
+PARTICLES_DEADBAND = 10
+VOC_DEADBAND = 1
+DEFAULT_MAX_STALENESS = timedelta(minutes=5)
+METRICS_LATENCY_SAMPLES = 100
+DIAGNOSTICS_EXCHANGES = 20
+
+SERVICE_PROFILE = "profile"
+ATTR_CYCLES = "cycles"
+DEFAULT_PROFILE_CYCLES = 5
+PROFILE_SUMMARY_LINES = 50
+
+CAPTURE_DIRECTORY = "venta_capture"
+CAPTURE_MAX_BYTES = 5 * 1024 * 1024
+CAPTURE_BACKUPS = 3
+CAPTURE_QUEUE_SIZE = 1000
+
+DATA_SESSION = f"{DOMAIN}_session"
+DATA_SESSION_LISTENER = f"{DOMAIN}_session_listener"
+HTTP_LIMIT_PER_HOST = 1  # The device web servers misbehave with parallel requests
+HTTP_KEEPALIVE_TIMEOUT = 2 * DEFAULT_SCAN_INTERVAL
+HTTP_CONNECT_TIMEOUT = 3
+KEEP_ALIVE_PROBES = 3  # Connection reuses needed to trust the keep-alive
+TCP_CLOSE_TIMEOUT = 1  # Seconds to wait for a graceful close before a reset
+TCP_KEEPALIVE_IDLE = 30
+TCP_KEEPALIVE_INTERVAL = 10
+TCP_KEEPALIVE_COUNT = 3
+DNS_CACHE_TTL = 300
+DNS_NEGATIVE_TTL = 30  # Seconds a failed lookup is not retried
+DNS_TIMEOUT = 3
+
+DISCOVERY_CONCURRENCY = 64
+DISCOVERY_CONNECT_TIMEOUT = 1
+DISCOVERY_REQUEST_TIMEOUT = 3
+DISCOVERY_MAX_HOSTS = 1024
+
+DATA_REDISCOVERY = f"{DOMAIN}_rediscovery"
+EVENT_HOST_CHANGED = f"{DOMAIN}_host_changed"
+ATTR_OLD_HOST = "old_host"
+ATTR_NEW_HOST = "new_host"
+REDISCOVERY_FAILURES = 3  # Consecutive failed updates before sweeping
+REDISCOVERY_INTERVAL = 600  # Seconds between the sweeps of the same entry
+
 ONE_MINUTE_RESOLUTION = 1
 FIVE_MINUTES_RESOLUTION = 5
 TEN_MINUTES_RESOLUTION = 10
@@ -16,9 +16,14 @@ from ..const import (
     ATTR_HUMIDITY,
     ATTR_TOLUENE,
     ATTR_VOC,
+    HUMIDITY_DEADBAND,
+    TEMPERATURE_DEADBAND,
+    VOC_DEADBAND,
 )
 from ..venta import VentaDataUpdateCoordinator
+from ..venta_device import async_profile_descriptions
 from ..venta_entity import (
+    METRICS_SENSOR_DESCRIPTIONS,
     VentaSensor,
     VentaSensorEntityDescription,
 )
@@ -48,28 +53,31 @@ async def async_setup_sensor(
         VentaSensorEntityDescription(
             key=ATTR_TEMPERATURE,
             translation_key=ATTR_TEMPERATURE,
+            deadband=TEMPERATURE_DEADBAND,
             device_class=SensorDeviceClass.TEMPERATURE,
             state_class=SensorStateClass.MEASUREMENT,
             native_unit_of_measurement=UnitOfTemperature.CELSIUS,
             suggested_display_precision=1,
-            value_func=lambda coordinator: coordinator.data.measure.get("Temperature"),
+            value_func=lambda coordinator: coordinator.data.measure.Temperature,
         ),
         VentaSensorEntityDescription(
             key=ATTR_HUMIDITY,
             translation_key=ATTR_HUMIDITY,
+            deadband=HUMIDITY_DEADBAND,
             state_class=SensorStateClass.MEASUREMENT,
             device_class=SensorDeviceClass.HUMIDITY,
             native_unit_of_measurement=PERCENTAGE,
             suggested_display_precision=1,
-            value_func=lambda coordinator: coordinator.data.measure.get("Humidity"),
+            value_func=lambda coordinator: coordinator.data.measure.Humidity,
         ),
         VentaSensorEntityDescription(
             key=ATTR_VOC,
             translation_key=ATTR_VOC,
+            deadband=VOC_DEADBAND,
             device_class=SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS_PARTS,
             state_class=SensorStateClass.MEASUREMENT,
             value_func=lambda coordinator: skip_zeros(
-                coordinator.data.measure.get("Voc"),
+                coordinator.data.measure.Voc,
             ),
         ),
         VentaSensorEntityDescription(
@@ -77,11 +85,15 @@ async def async_setup_sensor(
             translation_key=ATTR_TOLUENE,
             device_class=SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS_PARTS,
             state_class=SensorStateClass.MEASUREMENT,
-            value_func=lambda coordinator: coordinator.data.measure.get("Toluene"),
+            value_func=lambda coordinator: coordinator.data.measure.Toluene,
         ),
+        *METRICS_SENSOR_DESCRIPTIONS,
     ]
     async_add_entities(
-        [VentaSensor(coordinator, description) for description in descriptions]
+        [
+            VentaSensor(coordinator, description)
+            for description in async_profile_descriptions(coordinator, descriptions)
+        ]
     )
 
 
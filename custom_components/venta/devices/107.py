@@ -31,17 +31,21 @@ from ..const import (
     ATTR_TIME_TO_SERVICE,
     ATTR_WARNINGS,
     ATTR_WATER_LEVEL,
+    HUMIDITY_DEADBAND,
     LED_STRIP_MODES_EXTERNAL,
     LED_STRIP_MODES_EXTERNAL_NO_WATER,
     LED_STRIP_MODES_INTERNAL,
     LED_STRIP_MODES_INTERNAL_NO_WATER,
     MODES_4,
     SERVICE_TIME_DAYS,
+    TEMPERATURE_DEADBAND,
     TEN_MINUTES_RESOLUTION,
 )
 from ..utils import venta_time_to_days_left, venta_time_to_minutes
-from ..venta import VentaDataUpdateCoordinator
+from ..venta import VentaDataUpdateCoordinator, VentaUpdateTier
+from ..venta_device import async_profile_descriptions
 from ..venta_entity import (
+    METRICS_SENSOR_DESCRIPTIONS,
     VentaBinarySensor,
     VentaBinarySensorEntityDescription,
     VentaLight,
@@ -80,29 +84,32 @@ async def async_setup_binary_sensor(
             key=ATTR_NEEDS_REFILL,
             translation_key=ATTR_NEEDS_REFILL,
             icon="mdi:water-alert",
-            value_func=lambda data: data.info.get("Warnings") & WATER_WARNING,
+            value_func=lambda data: data.info.Warnings & WATER_WARNING,
         ),
         VentaBinarySensorEntityDescription(
             key=ATTR_NEEDS_DISC_REPLACEMENT,
             translation_key=ATTR_NEEDS_DISC_REPLACEMENT,
             icon="mdi:disc-alert",
-            value_func=lambda data: data.info.get("Warnings") & ION_DISC_WARNING,
+            value_func=lambda data: data.info.Warnings & ION_DISC_WARNING,
         ),
         VentaBinarySensorEntityDescription(
             key=ATTR_NEEDS_CLEANING,
             translation_key=ATTR_NEEDS_CLEANING,
             icon="mdi:spray-bottle",
-            value_func=lambda data: data.info.get("Warnings") & CLEANING_WARNING,
+            value_func=lambda data: data.info.Warnings & CLEANING_WARNING,
         ),
         VentaBinarySensorEntityDescription(
             key=ATTR_NEEDS_SERVICE,
             translation_key=ATTR_NEEDS_SERVICE,
             icon="mdi:account-wrench",
-            value_func=lambda data: data.info.get("Warnings") & SERVICE_WARNING,
+            value_func=lambda data: data.info.Warnings & SERVICE_WARNING,
         ),
     ]
     async_add_entities(
-        [VentaBinarySensor(coordinator, description) for description in descriptions]
+        [
+            VentaBinarySensor(coordinator, description)
+            for description in async_profile_descriptions(coordinator, descriptions)
+        ]
     )
 
 
@@ -114,11 +121,12 @@ async def async_setup_sensor(
         VentaSensorEntityDescription(
             key=ATTR_DISC_ION_TIME_TO_REPLACE,
             translation_key=ATTR_DISC_ION_TIME_TO_REPLACE,
+            update_tier=VentaUpdateTier.SLOW,
             icon="mdi:wrench-clock",
             native_unit_of_measurement=UnitOfTime.DAYS,
             entity_category=EntityCategory.DIAGNOSTIC,
             value_func=lambda coordinator: venta_time_to_days_left(
-                coordinator.data.info.get("DiscIonT"),
+                coordinator.data.info.DiscIonT,
                 ION_DISC_REPLACE_TIME_DAYS,
                 TEN_MINUTES_RESOLUTION,
             ),
@@ -126,11 +134,12 @@ async def async_setup_sensor(
         VentaSensorEntityDescription(
             key=ATTR_TIME_TO_CLEAN,
             translation_key=ATTR_TIME_TO_CLEAN,
+            update_tier=VentaUpdateTier.SLOW,
             icon="mdi:wrench-clock",
             native_unit_of_measurement=UnitOfTime.DAYS,
             entity_category=EntityCategory.DIAGNOSTIC,
             value_func=lambda coordinator: venta_time_to_days_left(
-                coordinator.data.info.get("CleaningT"),
+                coordinator.data.info.CleaningT,
                 CLEAN_TIME_DAYS,
                 TEN_MINUTES_RESOLUTION,
             ),
@@ -138,11 +147,12 @@ async def async_setup_sensor(
         VentaSensorEntityDescription(
             key=ATTR_TIME_TO_SERVICE,
             translation_key=ATTR_TIME_TO_SERVICE,
+            update_tier=VentaUpdateTier.SLOW,
             icon="mdi:wrench-clock",
             native_unit_of_measurement=UnitOfTime.DAYS,
             entity_category=EntityCategory.DIAGNOSTIC,
             value_func=lambda coordinator: venta_time_to_days_left(
-                coordinator.data.info.get("ServiceT"),
+                coordinator.data.info.ServiceT,
                 SERVICE_TIME_DAYS,
                 TEN_MINUTES_RESOLUTION,
             ),
@@ -150,20 +160,22 @@ async def async_setup_sensor(
         VentaSensorEntityDescription(
             key=ATTR_TEMPERATURE,
             translation_key=ATTR_TEMPERATURE,
+            deadband=TEMPERATURE_DEADBAND,
             device_class=SensorDeviceClass.TEMPERATURE,
             state_class=SensorStateClass.MEASUREMENT,
             native_unit_of_measurement=UnitOfTemperature.CELSIUS,
             suggested_display_precision=1,
-            value_func=lambda coordinator: coordinator.data.measure.get("Temperature"),
+            value_func=lambda coordinator: coordinator.data.measure.Temperature,
         ),
         VentaSensorEntityDescription(
             key=ATTR_HUMIDITY,
             translation_key=ATTR_HUMIDITY,
+            deadband=HUMIDITY_DEADBAND,
             state_class=SensorStateClass.MEASUREMENT,
             device_class=SensorDeviceClass.HUMIDITY,
             native_unit_of_measurement=PERCENTAGE,
             suggested_display_precision=1,
-            value_func=lambda coordinator: coordinator.data.measure.get("Humidity"),
+            value_func=lambda coordinator: coordinator.data.measure.Humidity,
         ),
         VentaSensorEntityDescription(
             key=ATTR_WATER_LEVEL,
@@ -171,7 +183,7 @@ async def async_setup_sensor(
             icon="mdi:water",
             state_class=SensorStateClass.MEASUREMENT,
             entity_category=EntityCategory.DIAGNOSTIC,
-            value_func=lambda coordinator: coordinator.data.measure.get("WaterLevel"),
+            value_func=lambda coordinator: coordinator.data.measure.WaterLevel,
         ),
         VentaSensorEntityDescription(
             key=ATTR_FAN_SPEED,
@@ -180,46 +192,50 @@ async def async_setup_sensor(
             icon="mdi:fast-forward",
             state_class=SensorStateClass.MEASUREMENT,
             entity_category=EntityCategory.DIAGNOSTIC,
-            value_func=lambda coordinator: coordinator.data.measure.get("FanRpm"),
+            value_func=lambda coordinator: coordinator.data.measure.FanRpm,
         ),
         VentaSensorEntityDescription(
             key=ATTR_OPERATION_TIME,
             translation_key=ATTR_OPERATION_TIME,
+            update_tier=VentaUpdateTier.SLOW,
             icon="mdi:timer",
             native_unit_of_measurement=UnitOfTime.MINUTES,
             entity_category=EntityCategory.DIAGNOSTIC,
             value_func=lambda coordinator: venta_time_to_minutes(
-                coordinator.data.info.get("OperationT"), TEN_MINUTES_RESOLUTION
+                coordinator.data.info.OperationT, TEN_MINUTES_RESOLUTION
             ),
         ),
         VentaSensorEntityDescription(
             key=ATTR_DISC_ION_TIME,
             translation_key=ATTR_DISC_ION_TIME,
+            update_tier=VentaUpdateTier.SLOW,
             icon="mdi:timer",
             native_unit_of_measurement=UnitOfTime.MINUTES,
             entity_category=EntityCategory.DIAGNOSTIC,
             value_func=lambda coordinator: venta_time_to_minutes(
-                coordinator.data.info.get("DiscIonT"), TEN_MINUTES_RESOLUTION
+                coordinator.data.info.DiscIonT, TEN_MINUTES_RESOLUTION
             ),
         ),
         VentaSensorEntityDescription(
             key=ATTR_CLEANING_TIME,
             translation_key=ATTR_CLEANING_TIME,
+            update_tier=VentaUpdateTier.SLOW,
             icon="mdi:timer",
             native_unit_of_measurement=UnitOfTime.MINUTES,
             entity_category=EntityCategory.DIAGNOSTIC,
             value_func=lambda coordinator: venta_time_to_minutes(
-                coordinator.data.info.get("CleaningT"), TEN_MINUTES_RESOLUTION
+                coordinator.data.info.CleaningT, TEN_MINUTES_RESOLUTION
             ),
         ),
         VentaSensorEntityDescription(
             key=ATTR_SERVICE_TIME,
             translation_key=ATTR_SERVICE_TIME,
+            update_tier=VentaUpdateTier.SLOW,
             icon="mdi:timer",
             native_unit_of_measurement=UnitOfTime.MINUTES,
             entity_category=EntityCategory.DIAGNOSTIC,
             value_func=lambda coordinator: venta_time_to_minutes(
-                coordinator.data.info.get("ServiceT"), TEN_MINUTES_RESOLUTION
+                coordinator.data.info.ServiceT, TEN_MINUTES_RESOLUTION
             ),
         ),
         VentaSensorEntityDescription(
@@ -227,11 +243,15 @@ async def async_setup_sensor(
             translation_key=ATTR_WARNINGS,
             icon="mdi:alert",
             entity_category=EntityCategory.DIAGNOSTIC,
-            value_func=lambda coordinator: coordinator.data.info.get("Warnings"),
+            value_func=lambda coordinator: coordinator.data.info.Warnings,
         ),
+        *METRICS_SENSOR_DESCRIPTIONS,
     ]
     async_add_entities(
-        [VentaSensor(coordinator, description) for description in descriptions]
+        [
+            VentaSensor(coordinator, description)
+            for description in async_profile_descriptions(coordinator, descriptions)
+        ]
     )
 
 
@@ -253,25 +273,24 @@ async def async_setup_select(
     coordinator: VentaDataUpdateCoordinator, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up selects for Venta LW74."""
+    descriptions = [
+        VentaSelectEntityDescription(
+            key=ATTR_LED_STRIP_MODE,
+            translation_key=ATTR_LED_STRIP_MODE,
+            entity_category=EntityCategory.CONFIG,
+            value_func=lambda data: str(data.action.LEDStripMode),
+            action_func=lambda option: {"Action": {"LEDStripMode": int(option)}},
+            options=[
+                LED_STRIP_MODES_INTERNAL,
+                LED_STRIP_MODES_INTERNAL_NO_WATER,
+                LED_STRIP_MODES_EXTERNAL,
+                LED_STRIP_MODES_EXTERNAL_NO_WATER,
+            ],
+        ),
+    ]
     async_add_entities(
         [
-            VentaSelect(
-                coordinator,
-                VentaSelectEntityDescription(
-                    key=ATTR_LED_STRIP_MODE,
-                    translation_key=ATTR_LED_STRIP_MODE,
-                    entity_category=EntityCategory.CONFIG,
-                    value_func=lambda data: str(data.action.get("LEDStripMode")),
-                    action_func=lambda option: {
-                        "Action": {"LEDStripMode": int(option)}
-                    },
-                    options=[
-                        LED_STRIP_MODES_INTERNAL,
-                        LED_STRIP_MODES_INTERNAL_NO_WATER,
-                        LED_STRIP_MODES_EXTERNAL,
-                        LED_STRIP_MODES_EXTERNAL_NO_WATER,
-                    ],
-                ),
-            )
+            VentaSelect(coordinator, description)
+            for description in async_profile_descriptions(coordinator, descriptions)
         ]
     )
@@ -28,8 +28,11 @@ from ..const import (
     ATTR_WARNINGS,
     ATTR_WATER_LEVEL,
     FIVE_MINUTES_RESOLUTION,
+    HUMIDITY_DEADBAND,
     MODES_5,
     ONE_MINUTE_RESOLUTION,
+    PM_DEADBAND,
+    TEMPERATURE_DEADBAND,
     TEN_MINUTES_RESOLUTION,
     TIMER_MODES_1H,
     TIMER_MODES_3H,
@@ -44,8 +47,10 @@ from ..const import (
     WATER_LEVEL_YELLOW,
 )
 from ..utils import venta_temperature_unit, venta_time_to_minutes
-from ..venta import VentaDataUpdateCoordinator
+from ..venta import VentaDataUpdateCoordinator, VentaUpdateTier
+from ..venta_device import async_profile_descriptions
 from ..venta_entity import (
+    METRICS_SENSOR_DESCRIPTIONS,
     VentaBinarySensor,
     VentaBinarySensorEntityDescription,
     VentaSelect,
@@ -78,11 +83,14 @@ async def async_setup_binary_sensor(
             key=ATTR_NEEDS_FILTER_CLEANING,
             translation_key=ATTR_NEEDS_FILTER_CLEANING,
             icon="mdi:air-filter",
-            value_func=lambda data: data.info.get("Warnings") & FILTER_WARNING,
+            value_func=lambda data: data.info.Warnings & FILTER_WARNING,
         ),
     ]
     async_add_entities(
-        [VentaBinarySensor(coordinator, description) for description in descriptions]
+        [
+            VentaBinarySensor(coordinator, description)
+            for description in async_profile_descriptions(coordinator, descriptions)
+        ]
     )
 
 
@@ -98,48 +106,52 @@ async def async_setup_sensor(
             native_unit_of_measurement=UnitOfTime.MINUTES,
             entity_category=EntityCategory.DIAGNOSTIC,
             value_func=lambda coordinator: venta_time_to_minutes(
-                coordinator.data.info.get("TimerT"), ONE_MINUTE_RESOLUTION
+                coordinator.data.info.TimerT, ONE_MINUTE_RESOLUTION
             ),
         ),
         VentaSensorEntityDescription(
             key=ATTR_OPERATION_TIME,
             translation_key=ATTR_OPERATION_TIME,
+            update_tier=VentaUpdateTier.SLOW,
             icon="mdi:timer",
             native_unit_of_measurement=UnitOfTime.MINUTES,
             entity_category=EntityCategory.DIAGNOSTIC,
             value_func=lambda coordinator: venta_time_to_minutes(
-                coordinator.data.info.get("OperationT"), FIVE_MINUTES_RESOLUTION
+                coordinator.data.info.OperationT, FIVE_MINUTES_RESOLUTION
             ),
         ),
         VentaSensorEntityDescription(
             key=ATTR_FILTER_TIME,
             translation_key=ATTR_FILTER_TIME,
+            update_tier=VentaUpdateTier.SLOW,
             icon="mdi:timer",
             native_unit_of_measurement=UnitOfTime.MINUTES,
             entity_category=EntityCategory.DIAGNOSTIC,
             value_func=lambda coordinator: venta_time_to_minutes(
-                coordinator.data.info.get("FilterT"), TEN_MINUTES_RESOLUTION
+                coordinator.data.info.FilterT, TEN_MINUTES_RESOLUTION
             ),
         ),
         VentaSensorEntityDescription(
             key=ATTR_TEMPERATURE,
             translation_key=ATTR_TEMPERATURE,
+            deadband=TEMPERATURE_DEADBAND,
             device_class=SensorDeviceClass.TEMPERATURE,
             state_class=SensorStateClass.MEASUREMENT,
             suggested_display_precision=1,
-            value_func=lambda coordinator: coordinator.data.measure.get("Temperature"),
+            value_func=lambda coordinator: coordinator.data.measure.Temperature,
             unit_func=lambda coordinator: venta_temperature_unit(
-                coordinator.data.action.get("TempUnit")
+                coordinator.data.action.TempUnit
             ),
         ),
         VentaSensorEntityDescription(
             key=ATTR_HUMIDITY,
             translation_key=ATTR_HUMIDITY,
+            deadband=HUMIDITY_DEADBAND,
             state_class=SensorStateClass.MEASUREMENT,
             device_class=SensorDeviceClass.HUMIDITY,
             native_unit_of_measurement=PERCENTAGE,
             suggested_display_precision=1,
-            value_func=lambda coordinator: coordinator.data.measure.get("Humidity"),
+            value_func=lambda coordinator: coordinator.data.measure.Humidity,
         ),
         VentaSensorEntityDescription(
             key=ATTR_WATER_LEVEL,
@@ -155,18 +167,19 @@ async def async_setup_sensor(
                 WATER_LEVEL_OVERFLOW,
             ],
             value_func=lambda coordinator: (
-                str(coordinator.data.measure.get("WaterLevel"))
-                if coordinator.data.measure.get("WaterLevel") is not None
+                str(coordinator.data.measure.WaterLevel)
+                if coordinator.data.measure.WaterLevel is not None
                 else None
             ),
         ),
         VentaSensorEntityDescription(
             key=ATTR_PM_2_5,
             translation_key=ATTR_PM_2_5,
+            deadband=PM_DEADBAND,
             device_class=SensorDeviceClass.PM25,
             native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
             state_class=SensorStateClass.MEASUREMENT,
-            value_func=lambda coordinator: coordinator.data.measure.get("Dust"),
+            value_func=lambda coordinator: coordinator.data.measure.Dust,
         ),
         VentaSensorEntityDescription(
             key=ATTR_FAN_SPEED,
@@ -175,29 +188,34 @@ async def async_setup_sensor(
             icon="mdi:fast-forward",
             state_class=SensorStateClass.MEASUREMENT,
             entity_category=EntityCategory.DIAGNOSTIC,
-            value_func=lambda coordinator: coordinator.data.measure.get("FanRpm"),
+            value_func=lambda coordinator: coordinator.data.measure.FanRpm,
         ),
         VentaSensorEntityDescription(
             key=ATTR_WARNINGS,
             translation_key=ATTR_WARNINGS,
             icon="mdi:alert",
             entity_category=EntityCategory.DIAGNOSTIC,
-            value_func=lambda coordinator: coordinator.data.info.get("Warnings"),
+            value_func=lambda coordinator: coordinator.data.info.Warnings,
         ),
         VentaSensorEntityDescription(
             key=ATTR_HEPA_FILTER_LIFETIME,
             translation_key=ATTR_HEPA_FILTER_LIFETIME,
+            update_tier=VentaUpdateTier.SLOW,
             icon="mdi:air-filter",
             state_class=SensorStateClass.MEASUREMENT,
             entity_category=EntityCategory.DIAGNOSTIC,
             value_func=lambda coordinator: venta_time_to_minutes(
-                coordinator.data.action.get("FiltLifetime"),
+                coordinator.data.action.FiltLifetime,
                 TEN_MINUTES_RESOLUTION,
             ),
         ),
+        *METRICS_SENSOR_DESCRIPTIONS,
     ]
     async_add_entities(
-        [VentaSensor(coordinator, description) for description in descriptions]
+        [
+            VentaSensor(coordinator, description)
+            for description in async_profile_descriptions(coordinator, descriptions)
+        ]
     )
 
 
@@ -210,7 +228,7 @@ async def async_setup_switch(
             key=ATTR_CHILD_LOCK,
             translation_key=ATTR_CHILD_LOCK,
             entity_category=EntityCategory.CONFIG,
-            value_func=lambda data: data.action.get("ChildLock"),
+            value_func=lambda data: data.action.ChildLock,
             action_func=lambda _, is_on: {
                 "ChildLock": is_on,
                 "Action": "control",
@@ -218,7 +236,10 @@ async def async_setup_switch(
         ),
     ]
     async_add_entities(
-        [VentaSwitch(coordinator, description) for description in descriptions]
+        [
+            VentaSwitch(coordinator, description)
+            for description in async_profile_descriptions(coordinator, descriptions)
+        ]
     )
 
 
@@ -233,29 +254,28 @@ async def async_setup_select(
     coordinator: VentaDataUpdateCoordinator, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up selects for Venta AP902."""
+    descriptions = [
+        VentaSelectEntityDescription(
+            key=ATTR_TIMER,
+            translation_key=ATTR_TIMER,
+            entity_category=EntityCategory.CONFIG,
+            value_func=lambda data: (
+                str(data.action.Timer) if data.action.Timer else None
+            ),
+            action_func=lambda option: {"Action": {"Timer": int(option)}},
+            options=[
+                TIMER_MODES_OFF,
+                TIMER_MODES_1H,
+                TIMER_MODES_3H,
+                TIMER_MODES_5H,
+                TIMER_MODES_7H,
+                TIMER_MODES_9H,
+            ],
+        ),
+    ]
     async_add_entities(
         [
-            VentaSelect(
-                coordinator,
-                VentaSelectEntityDescription(
-                    key=ATTR_TIMER,
-                    translation_key=ATTR_TIMER,
-                    entity_category=EntityCategory.CONFIG,
-                    value_func=lambda data: (
-                        str(data.action.get("Timer"))
-                        if data.action.get("Timer")
-                        else None
-                    ),
-                    action_func=lambda option: {"Action": {"Timer": int(option)}},
-                    options=[
-                        TIMER_MODES_OFF,
-                        TIMER_MODES_1H,
-                        TIMER_MODES_3H,
-                        TIMER_MODES_5H,
-                        TIMER_MODES_7H,
-                        TIMER_MODES_9H,
-                    ],
-                ),
-            )
+            VentaSelect(coordinator, description)
+            for description in async_profile_descriptions(coordinator, descriptions)
         ]
     )
@@ -29,9 +29,16 @@ from ..const import (
     ATTR_PM_10,
     ATTR_TOLUENE,
     ATTR_VOC,
+    HUMIDITY_DEADBAND,
+    PARTICLES_DEADBAND,
+    PM_DEADBAND,
+    TEMPERATURE_DEADBAND,
+    VOC_DEADBAND,
 )
 from ..venta import VentaDataUpdateCoordinator
+from ..venta_device import async_profile_descriptions
 from ..venta_entity import (
+    METRICS_SENSOR_DESCRIPTIONS,
     VentaSensor,
     VentaSensorEntityDescription,
 )
@@ -61,20 +68,22 @@ async def async_setup_sensor(
         VentaSensorEntityDescription(
             key=ATTR_TEMPERATURE,
             translation_key=ATTR_TEMPERATURE,
+            deadband=TEMPERATURE_DEADBAND,
             device_class=SensorDeviceClass.TEMPERATURE,
             state_class=SensorStateClass.MEASUREMENT,
             native_unit_of_measurement=UnitOfTemperature.CELSIUS,
             suggested_display_precision=1,
-            value_func=lambda coordinator: coordinator.data.measure.get("Temperature"),
+            value_func=lambda coordinator: coordinator.data.measure.Temperature,
         ),
         VentaSensorEntityDescription(
             key=ATTR_HUMIDITY,
             translation_key=ATTR_HUMIDITY,
+            deadband=HUMIDITY_DEADBAND,
             state_class=SensorStateClass.MEASUREMENT,
             device_class=SensorDeviceClass.HUMIDITY,
             native_unit_of_measurement=PERCENTAGE,
             suggested_display_precision=1,
-            value_func=lambda coordinator: coordinator.data.measure.get("Humidity"),
+            value_func=lambda coordinator: coordinator.data.measure.Humidity,
         ),
         VentaSensorEntityDescription(
             key=ATTR_CO2,
@@ -82,17 +91,16 @@ async def async_setup_sensor(
             device_class=SensorDeviceClass.CO2,
             native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
             state_class=SensorStateClass.MEASUREMENT,
-            value_func=lambda coordinator: skip_zeros(
-                coordinator.data.measure.get("Co2")
-            ),
+            value_func=lambda coordinator: skip_zeros(coordinator.data.measure.Co2),
         ),
         VentaSensorEntityDescription(
             key=ATTR_VOC,
             translation_key=ATTR_VOC,
+            deadband=VOC_DEADBAND,
             device_class=SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS_PARTS,
             state_class=SensorStateClass.MEASUREMENT,
             value_func=lambda coordinator: skip_zeros(
-                coordinator.data.measure.get("Voc"),
+                coordinator.data.measure.Voc,
             ),
         ),
         VentaSensorEntityDescription(
@@ -100,77 +108,87 @@ async def async_setup_sensor(
             translation_key=ATTR_TOLUENE,
             device_class=SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS_PARTS,
             state_class=SensorStateClass.MEASUREMENT,
-            value_func=lambda coordinator: coordinator.data.measure.get("Toluene"),
+            value_func=lambda coordinator: coordinator.data.measure.Toluene,
         ),
         VentaSensorEntityDescription(
             key=ATTR_HCHO,
             translation_key=ATTR_HCHO,
             native_unit_of_measurement=CONCENTRATION_PARTS_PER_BILLION,
             state_class=SensorStateClass.MEASUREMENT,
-            value_func=lambda coordinator: skip_zeros(
-                coordinator.data.measure.get("Hcho")
-            ),
+            value_func=lambda coordinator: skip_zeros(coordinator.data.measure.Hcho),
         ),
         VentaSensorEntityDescription(
             key=ATTR_PM_1_0,
             translation_key=ATTR_PM_1_0,
+            deadband=PM_DEADBAND,
             device_class=SensorDeviceClass.PM1,
             native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
             state_class=SensorStateClass.MEASUREMENT,
-            value_func=lambda coordinator: coordinator.data.measure.get("PmCalc1u0")
-            or coordinator.data.measure.get("Pm1u0"),
+            value_func=lambda coordinator: coordinator.data.measure.PmCalc1u0
+            or coordinator.data.measure.Pm1u0,
         ),
         VentaSensorEntityDescription(
             key=ATTR_PM_2_5,
             translation_key=ATTR_PM_2_5,
+            deadband=PM_DEADBAND,
             device_class=SensorDeviceClass.PM25,
             native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
             state_class=SensorStateClass.MEASUREMENT,
-            value_func=lambda coordinator: coordinator.data.measure.get("PmCalc2u5")
-            or coordinator.data.measure.get("Pm2u5"),
+            value_func=lambda coordinator: coordinator.data.measure.PmCalc2u5
+            or coordinator.data.measure.Pm2u5,
         ),
         VentaSensorEntityDescription(
             key=ATTR_PM_10,
             translation_key=ATTR_PM_10,
+            deadband=PM_DEADBAND,
             device_class=SensorDeviceClass.PM10,
             native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
             state_class=SensorStateClass.MEASUREMENT,
-            value_func=lambda coordinator: coordinator.data.measure.get("PmCalc10u")
-            or coordinator.data.measure.get("Pm10u"),
+            value_func=lambda coordinator: coordinator.data.measure.PmCalc10u
+            or coordinator.data.measure.Pm10u,
         ),
         VentaSensorEntityDescription(
             key=ATTR_PARTICLES_0_3,
             translation_key=ATTR_PARTICLES_0_3,
+            deadband=PARTICLES_DEADBAND,
             state_class=SensorStateClass.MEASUREMENT,
-            value_func=lambda coordinator: coordinator.data.measure.get("Particles0u3"),
+            value_func=lambda coordinator: coordinator.data.measure.Particles0u3,
         ),
         VentaSensorEntityDescription(
             key=ATTR_PARTICLES_0_5,
             translation_key=ATTR_PARTICLES_0_5,
+            deadband=PARTICLES_DEADBAND,
             state_class=SensorStateClass.MEASUREMENT,
-            value_func=lambda coordinator: coordinator.data.measure.get("Particles0u5"),
+            value_func=lambda coordinator: coordinator.data.measure.Particles0u5,
         ),
         VentaSensorEntityDescription(
             key=ATTR_PARTICLES_2_5,
             translation_key=ATTR_PARTICLES_2_5,
+            deadband=PARTICLES_DEADBAND,
             state_class=SensorStateClass.MEASUREMENT,
-            value_func=lambda coordinator: coordinator.data.measure.get("Particles2u5"),
+            value_func=lambda coordinator: coordinator.data.measure.Particles2u5,
         ),
         VentaSensorEntityDescription(
             key=ATTR_PARTICLES_5_0,
             translation_key=ATTR_PARTICLES_5_0,
+            deadband=PARTICLES_DEADBAND,
             state_class=SensorStateClass.MEASUREMENT,
-            value_func=lambda coordinator: coordinator.data.measure.get("Particles5u0"),
+            value_func=lambda coordinator: coordinator.data.measure.Particles5u0,
         ),
         VentaSensorEntityDescription(
             key=ATTR_PARTICLES_10,
             translation_key=ATTR_PARTICLES_10,
+            deadband=PARTICLES_DEADBAND,
             state_class=SensorStateClass.MEASUREMENT,
-            value_func=lambda coordinator: coordinator.data.measure.get("Particles10u"),
+            value_func=lambda coordinator: coordinator.data.measure.Particles10u,
         ),
+        *METRICS_SENSOR_DESCRIPTIONS,
     ]
     async_add_entities(
-        [VentaSensor(coordinator, description) for description in descriptions]
+        [
+            VentaSensor(coordinator, description)
+            for description in async_profile_descriptions(coordinator, descriptions)
+        ]
     )
 
 
@@ -40,9 +40,12 @@ from ..const import (
     ATTR_WARNINGS,
     CLEAN_TIME_DAYS,
     FIVE_MINUTES_RESOLUTION,
+    HUMIDITY_DEADBAND,
     ION_DISC_REPLACE_TIME_DAYS,
     MODES_5,
     ONE_MINUTE_RESOLUTION,
+    PM_DEADBAND,
+    TEMPERATURE_DEADBAND,
     TEN_MINUTES_RESOLUTION,
     TIMER_MODES_1H,
     TIMER_MODES_3H,
@@ -57,8 +60,10 @@ from ..utils import (
     venta_time_to_days_left,
     venta_time_to_minutes,
 )
-from ..venta import VentaDataUpdateCoordinator
+from ..venta import VentaDataUpdateCoordinator, VentaUpdateTier
+from ..venta_device import async_profile_descriptions
 from ..venta_entity import (
+    METRICS_SENSOR_DESCRIPTIONS,
     VentaBinarySensor,
     VentaBinarySensorEntityDescription,
     VentaSelect,
@@ -96,73 +101,74 @@ async def async_setup_binary_sensor(
             key=ATTR_CLEAN_MODE,
             translation_key=ATTR_CLEAN_MODE,
             icon="mdi:silverware-clean",
-            value_func=lambda data: data.info.get("CleanMode"),
+            value_func=lambda data: data.info.CleanMode,
         ),
         VentaBinarySensorEntityDescription(
             key=ATTR_FAN_RELAY,
             translation_key=ATTR_FAN_RELAY,
             icon="mdi:electric-switch",
-            value_func=lambda data: get_from_list(data.info.get("RelState"), 0),
+            value_func=lambda data: get_from_list(data.info.RelState, 0),
         ),
         VentaBinarySensorEntityDescription(
             key=ATTR_DISC_RELAY,
             translation_key=ATTR_DISC_RELAY,
             icon="mdi:electric-switch",
-            value_func=lambda data: get_from_list(data.info.get("RelState"), 1),
+            value_func=lambda data: get_from_list(data.info.RelState, 1),
         ),
         VentaBinarySensorEntityDescription(
             key=ATTR_UVC_RELAY,
             translation_key=ATTR_UVC_RELAY,
             icon="mdi:electric-switch",
-            value_func=lambda data: get_from_list(data.info.get("RelState"), 2),
+            value_func=lambda data: get_from_list(data.info.RelState, 2),
         ),
         VentaBinarySensorEntityDescription(
             key=ATTR_VALVE_RELAY,
             translation_key=ATTR_VALVE_RELAY,
             icon="mdi:electric-switch",
-            value_func=lambda data: get_from_list(data.info.get("RelState"), 3),
+            value_func=lambda data: get_from_list(data.info.RelState, 3),
         ),
         VentaBinarySensorEntityDescription(
             key=ATTR_NEEDS_REFILL,
             translation_key=ATTR_NEEDS_REFILL,
             icon="mdi:water-alert",
-            value_func=lambda data: data.info.get("Warnings") & FILL_TANK_RED_WARNING,
+            value_func=lambda data: data.info.Warnings & FILL_TANK_RED_WARNING,
         ),
         VentaBinarySensorEntityDescription(
             key=ATTR_NEEDS_REFILL_SOON,
             translation_key=ATTR_NEEDS_REFILL_SOON,
             icon="mdi:water-alert",
-            value_func=(
-                lambda data: data.info.get("Warnings") & FILL_TANK_YELLOW_WARNING
-            ),
+            value_func=(lambda data: data.info.Warnings & FILL_TANK_YELLOW_WARNING),
         ),
         VentaBinarySensorEntityDescription(
             key=ATTR_DOOR_OPEN,
             translation_key=ATTR_DOOR_OPEN,
             icon="mdi:door-closed",
-            value_func=lambda data: data.info.get("Warnings") & CLOSE_DOOR_WARNING,
+            value_func=lambda data: data.info.Warnings & CLOSE_DOOR_WARNING,
         ),
         VentaBinarySensorEntityDescription(
             key=ATTR_NEEDS_FILTER_CLEANING,
             translation_key=ATTR_NEEDS_FILTER_CLEANING,
             icon="mdi:air-filter",
-            value_func=lambda data: data.info.get("Warnings") & FILTER_WARNING,
+            value_func=lambda data: data.info.Warnings & FILTER_WARNING,
         ),
         VentaBinarySensorEntityDescription(
             key=ATTR_NEEDS_DISC_REPLACEMENT,
             translation_key=ATTR_NEEDS_DISC_REPLACEMENT,
             icon="mdi:disc-alert",
-            value_func=lambda data: data.info.get("Warnings") & ION_DISC_WARNING,
+            value_func=lambda data: data.info.Warnings & ION_DISC_WARNING,
         ),
         VentaBinarySensorEntityDescription(
             key=ATTR_NEEDS_CLEANING,
             translation_key=ATTR_NEEDS_CLEANING,
             icon="mdi:spray-bottle",
-            value_func=lambda data: data.info.get("Warnings") & CLEANING_WARNING,
+            value_func=lambda data: data.info.Warnings & CLEANING_WARNING,
         ),
     ]
     async_add_entities(
-        [VentaBinarySensor(coordinator, description) for description in descriptions]
+        [
+            VentaBinarySensor(coordinator, description)
+            for description in async_profile_descriptions(coordinator, descriptions)
+        ]
     )
 
 
@@ -178,27 +184,29 @@ async def async_setup_sensor(
             native_unit_of_measurement=UnitOfTime.MINUTES,
             entity_category=EntityCategory.DIAGNOSTIC,
             value_func=lambda coordinator: venta_time_to_minutes(
-                coordinator.data.info.get("TimerT"), ONE_MINUTE_RESOLUTION
+                coordinator.data.info.TimerT, ONE_MINUTE_RESOLUTION
             ),
         ),
         VentaSensorEntityDescription(
             key=ATTR_OPERATION_TIME,
             translation_key=ATTR_OPERATION_TIME,
+            update_tier=VentaUpdateTier.SLOW,
             icon="mdi:timer",
             native_unit_of_measurement=UnitOfTime.MINUTES,
             entity_category=EntityCategory.DIAGNOSTIC,
             value_func=lambda coordinator: venta_time_to_minutes(
-                coordinator.data.info.get("OperationT"), FIVE_MINUTES_RESOLUTION
+                coordinator.data.info.OperationT, FIVE_MINUTES_RESOLUTION
             ),
         ),
         VentaSensorEntityDescription(
             key=ATTR_DISC_ION_TIME_TO_REPLACE,
             translation_key=ATTR_DISC_ION_TIME_TO_REPLACE,
+            update_tier=VentaUpdateTier.SLOW,
             icon="mdi:wrench-clock",
             native_unit_of_measurement=UnitOfTime.DAYS,
             entity_category=EntityCategory.DIAGNOSTIC,
             value_func=lambda coordinator: venta_time_to_days_left(
-                coordinator.data.info.get("DiscIonT"),
+                coordinator.data.info.DiscIonT,
                 ION_DISC_REPLACE_TIME_DAYS,
                 FIVE_MINUTES_RESOLUTION,
             ),
@@ -206,11 +214,12 @@ async def async_setup_sensor(
         VentaSensorEntityDescription(
             key=ATTR_TIME_TO_CLEAN,
             translation_key=ATTR_TIME_TO_CLEAN,
+            update_tier=VentaUpdateTier.SLOW,
             icon="mdi:wrench-clock",
             native_unit_of_measurement=UnitOfTime.DAYS,
             entity_category=EntityCategory.DIAGNOSTIC,
             value_func=lambda coordinator: venta_time_to_days_left(
-                coordinator.data.info.get("CleaningT"),
+                coordinator.data.info.CleaningT,
                 CLEAN_TIME_DAYS,
                 FIVE_MINUTES_RESOLUTION,
             ),
@@ -218,11 +227,12 @@ async def async_setup_sensor(
         VentaSensorEntityDescription(
             key=ATTR_FILTER_TIME,
             translation_key=ATTR_FILTER_TIME,
+            update_tier=VentaUpdateTier.SLOW,
             icon="mdi:timer",
             native_unit_of_measurement=UnitOfTime.MINUTES,
             entity_category=EntityCategory.DIAGNOSTIC,
             value_func=lambda coordinator: venta_time_to_minutes(
-                coordinator.data.info.get("FilterT"), TEN_MINUTES_RESOLUTION
+                coordinator.data.info.FilterT, TEN_MINUTES_RESOLUTION
             ),
         ),
         VentaSensorEntityDescription(
@@ -232,36 +242,39 @@ async def async_setup_sensor(
             native_unit_of_measurement=UnitOfTime.MINUTES,
             entity_category=EntityCategory.DIAGNOSTIC,
             value_func=lambda coordinator: venta_time_to_minutes(
-                coordinator.data.info.get("CleaningR"), ONE_MINUTE_RESOLUTION
+                coordinator.data.info.CleaningR, ONE_MINUTE_RESOLUTION
             ),
         ),
         VentaSensorEntityDescription(
             key=ATTR_TEMPERATURE,
             translation_key=ATTR_TEMPERATURE,
+            deadband=TEMPERATURE_DEADBAND,
             device_class=SensorDeviceClass.TEMPERATURE,
             state_class=SensorStateClass.MEASUREMENT,
             suggested_display_precision=1,
-            value_func=lambda coordinator: coordinator.data.measure.get("Temperature"),
+            value_func=lambda coordinator: coordinator.data.measure.Temperature,
             unit_func=lambda coordinator: venta_temperature_unit(
-                coordinator.data.action.get("TempUnit")
+                coordinator.data.action.TempUnit
             ),
         ),
         VentaSensorEntityDescription(
             key=ATTR_HUMIDITY,
             translation_key=ATTR_HUMIDITY,
+            deadband=HUMIDITY_DEADBAND,
             state_class=SensorStateClass.MEASUREMENT,
             device_class=SensorDeviceClass.HUMIDITY,
             native_unit_of_measurement=PERCENTAGE,
             suggested_display_precision=1,
-            value_func=lambda coordinator: coordinator.data.measure.get("Humidity"),
+            value_func=lambda coordinator: coordinator.data.measure.Humidity,
         ),
         VentaSensorEntityDescription(
             key=ATTR_PM_2_5,
             translation_key=ATTR_PM_2_5,
+            deadband=PM_DEADBAND,
             device_class=SensorDeviceClass.PM25,
             native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
             state_class=SensorStateClass.MEASUREMENT,
-            value_func=lambda coordinator: coordinator.data.measure.get("Dust"),
+            value_func=lambda coordinator: coordinator.data.measure.Dust,
         ),
         VentaSensorEntityDescription(
             key=ATTR_FAN_SPEED,
@@ -270,18 +283,22 @@ async def async_setup_sensor(
             icon="mdi:fast-forward",
             state_class=SensorStateClass.MEASUREMENT,
             entity_category=EntityCategory.DIAGNOSTIC,
-            value_func=lambda coordinator: coordinator.data.measure.get("FanRpm"),
+            value_func=lambda coordinator: coordinator.data.measure.FanRpm,
         ),
         VentaSensorEntityDescription(
             key=ATTR_WARNINGS,
             translation_key=ATTR_WARNINGS,
             icon="mdi:alert",
             entity_category=EntityCategory.DIAGNOSTIC,
-            value_func=lambda coordinator: coordinator.data.info.get("Warnings"),
+            value_func=lambda coordinator: coordinator.data.info.Warnings,
         ),
+        *METRICS_SENSOR_DESCRIPTIONS,
     ]
     async_add_entities(
-        [VentaSensor(coordinator, description) for description in descriptions]
+        [
+            VentaSensor(coordinator, description)
+            for description in async_profile_descriptions(coordinator, descriptions)
+        ]
     )
 
 
@@ -294,7 +311,7 @@ async def async_setup_switch(
             key=ATTR_CHILD_LOCK,
             translation_key=ATTR_CHILD_LOCK,
             entity_category=EntityCategory.CONFIG,
-            value_func=lambda data: data.action.get("ChildLock"),
+            value_func=lambda data: data.action.ChildLock,
             action_func=lambda _, is_on: {
                 "ChildLock": is_on,
                 "Action": "control",
@@ -302,7 +319,10 @@ async def async_setup_switch(
         ),
     ]
     async_add_entities(
-        [VentaSwitch(coordinator, description) for description in descriptions]
+        [
+            VentaSwitch(coordinator, description)
+            for description in async_profile_descriptions(coordinator, descriptions)
+        ]
     )
 
 
@@ -317,29 +337,28 @@ async def async_setup_select(
     coordinator: VentaDataUpdateCoordinator, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up selects for Venta LPH60."""
+    descriptions = [
+        VentaSelectEntityDescription(
+            key=ATTR_TIMER,
+            translation_key=ATTR_TIMER,
+            entity_category=EntityCategory.CONFIG,
+            value_func=lambda data: (
+                str(data.action.Timer) if data.action.Timer else None
+            ),
+            action_func=lambda option: {"Action": {"Timer": int(option)}},
+            options=[
+                TIMER_MODES_OFF,
+                TIMER_MODES_1H,
+                TIMER_MODES_3H,
+                TIMER_MODES_5H,
+                TIMER_MODES_7H,
+                TIMER_MODES_9H,
+            ],
+        ),
+    ]
     async_add_entities(
         [
-            VentaSelect(
-                coordinator,
-                VentaSelectEntityDescription(
-                    key=ATTR_TIMER,
-                    translation_key=ATTR_TIMER,
-                    entity_category=EntityCategory.CONFIG,
-                    value_func=lambda data: (
-                        str(data.action.get("Timer"))
-                        if data.action.get("Timer")
-                        else None
-                    ),
-                    action_func=lambda option: {"Action": {"Timer": int(option)}},
-                    options=[
-                        TIMER_MODES_OFF,
-                        TIMER_MODES_1H,
-                        TIMER_MODES_3H,
-                        TIMER_MODES_5H,
-                        TIMER_MODES_7H,
-                        TIMER_MODES_9H,
-                    ],
-                ),
-            )
+            VentaSelect(coordinator, description)
+            for description in async_profile_descriptions(coordinator, descriptions)
         ]
     )
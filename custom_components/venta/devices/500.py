@@ -24,13 +24,17 @@ from ..const import (
     ATTR_SLEEP_MODE,
     ATTR_TIME_TO_SERVICE,
     ATTR_WARNINGS,
+    HUMIDITY_DEADBAND,
     MODES_3,
     SERVICE_TIME_DAYS,
+    TEMPERATURE_DEADBAND,
     TEN_MINUTES_RESOLUTION,
 )
 from ..utils import venta_time_to_days_left, venta_time_to_minutes
-from ..venta import VentaDataUpdateCoordinator
+from ..venta import VentaDataUpdateCoordinator, VentaUpdateTier
+from ..venta_device import async_profile_descriptions
 from ..venta_entity import (
+    METRICS_SENSOR_DESCRIPTIONS,
     VentaBinarySensor,
     VentaBinarySensorEntityDescription,
     VentaSensor,
@@ -62,29 +66,32 @@ async def async_setup_binary_sensor(
             key=ATTR_NEEDS_REFILL,
             translation_key=ATTR_NEEDS_REFILL,
             icon="mdi:water-alert",
-            value_func=lambda data: data.info.get("Warnings") & WATER_WARNING,
+            value_func=lambda data: data.info.Warnings & WATER_WARNING,
         ),
         VentaBinarySensorEntityDescription(
             key=ATTR_NEEDS_SERVICE,
             translation_key=ATTR_NEEDS_SERVICE,
             icon="mdi:account-wrench",
-            value_func=lambda data: data.info.get("Warnings") & SERVICE_WARNING,
+            value_func=lambda data: data.info.Warnings & SERVICE_WARNING,
         ),
         VentaBinarySensorEntityDescription(
             key=ATTR_BOX_OPEN,
             translation_key=ATTR_BOX_OPEN,
             icon="mdi:open-in-app",
-            value_func=lambda data: data.info.get("Warnings") & BOX_OPEN_WARNING,
+            value_func=lambda data: data.info.Warnings & BOX_OPEN_WARNING,
         ),
         VentaBinarySensorEntityDescription(
             key=ATTR_FAN_BLOCKED,
             translation_key=ATTR_FAN_BLOCKED,
             icon="mdi:fan-alert",
-            value_func=lambda data: data.info.get("Warnings") & FAN_BLOCKED_WARNING,
+            value_func=lambda data: data.info.Warnings & FAN_BLOCKED_WARNING,
         ),
     ]
     async_add_entities(
-        [VentaBinarySensor(coordinator, description) for description in descriptions]
+        [
+            VentaBinarySensor(coordinator, description)
+            for description in async_profile_descriptions(coordinator, descriptions)
+        ]
     )
 
 
@@ -96,21 +103,23 @@ async def async_setup_sensor(
         VentaSensorEntityDescription(
             key=ATTR_OPERATION_TIME,
             translation_key=ATTR_OPERATION_TIME,
+            update_tier=VentaUpdateTier.SLOW,
             icon="mdi:timer",
             native_unit_of_measurement=UnitOfTime.MINUTES,
             entity_category=EntityCategory.DIAGNOSTIC,
             value_func=lambda coordinator: venta_time_to_minutes(
-                coordinator.data.info.get("OperationT"), TEN_MINUTES_RESOLUTION
+                coordinator.data.info.OperationT, TEN_MINUTES_RESOLUTION
             ),
         ),
         VentaSensorEntityDescription(
             key=ATTR_TIME_TO_SERVICE,
             translation_key=ATTR_TIME_TO_SERVICE,
+            update_tier=VentaUpdateTier.SLOW,
             icon="mdi:wrench-clock",
             native_unit_of_measurement=UnitOfTime.DAYS,
             entity_category=EntityCategory.DIAGNOSTIC,
             value_func=lambda coordinator: venta_time_to_days_left(
-                coordinator.data.info.get("ServiceT"),
+                coordinator.data.info.ServiceT,
                 SERVICE_TIME_DAYS,
                 TEN_MINUTES_RESOLUTION,
             ),
@@ -118,51 +127,59 @@ async def async_setup_sensor(
         VentaSensorEntityDescription(
             key=ATTR_SERVICE_TIME,
             translation_key=ATTR_SERVICE_TIME,
+            update_tier=VentaUpdateTier.SLOW,
             icon="mdi:timer",
             native_unit_of_measurement=UnitOfTime.MINUTES,
             entity_category=EntityCategory.DIAGNOSTIC,
             value_func=lambda coordinator: venta_time_to_minutes(
-                coordinator.data.info.get("ServiceT"), TEN_MINUTES_RESOLUTION
+                coordinator.data.info.ServiceT, TEN_MINUTES_RESOLUTION
             ),
         ),
         VentaSensorEntityDescription(
             key=ATTR_SERVICE_MAX_TIME,
             translation_key=ATTR_SERVICE_MAX_TIME,
+            update_tier=VentaUpdateTier.SLOW,
             icon="mdi:timer",
             native_unit_of_measurement=UnitOfTime.MINUTES,
             entity_category=EntityCategory.DIAGNOSTIC,
             value_func=lambda coordinator: venta_time_to_minutes(
-                coordinator.data.info.get("ServiceMax"), TEN_MINUTES_RESOLUTION
+                coordinator.data.info.ServiceMax, TEN_MINUTES_RESOLUTION
             ),
         ),
         VentaSensorEntityDescription(
             key=ATTR_TEMPERATURE,
             translation_key=ATTR_TEMPERATURE,
+            deadband=TEMPERATURE_DEADBAND,
             device_class=SensorDeviceClass.TEMPERATURE,
             state_class=SensorStateClass.MEASUREMENT,
             native_unit_of_measurement=UnitOfTemperature.CELSIUS,
             suggested_display_precision=1,
-            value_func=lambda coordinator: coordinator.data.measure.get("Temperature"),
+            value_func=lambda coordinator: coordinator.data.measure.Temperature,
         ),
         VentaSensorEntityDescription(
             key=ATTR_HUMIDITY,
             translation_key=ATTR_HUMIDITY,
+            deadband=HUMIDITY_DEADBAND,
             state_class=SensorStateClass.MEASUREMENT,
             device_class=SensorDeviceClass.HUMIDITY,
             native_unit_of_measurement=PERCENTAGE,
             suggested_display_precision=1,
-            value_func=lambda coordinator: coordinator.data.measure.get("Humidity"),
+            value_func=lambda coordinator: coordinator.data.measure.Humidity,
         ),
         VentaSensorEntityDescription(
             key=ATTR_WARNINGS,
             translation_key=ATTR_WARNINGS,
             icon="mdi:alert",
             entity_category=EntityCategory.DIAGNOSTIC,
-            value_func=lambda coordinator: coordinator.data.info.get("Warnings"),
+            value_func=lambda coordinator: coordinator.data.info.Warnings,
         ),
+        *METRICS_SENSOR_DESCRIPTIONS,
     ]
     async_add_entities(
-        [VentaSensor(coordinator, description) for description in descriptions]
+        [
+            VentaSensor(coordinator, description)
+            for description in async_profile_descriptions(coordinator, descriptions)
+        ]
     )
 
 
@@ -175,7 +192,7 @@ async def async_setup_switch(
             key=ATTR_SLEEP_MODE,
             translation_key=ATTR_SLEEP_MODE,
             entity_category=EntityCategory.CONFIG,
-            value_func=lambda data: data.action.get("SleepMode"),
+            value_func=lambda data: data.action.SleepMode,
             action_func=lambda data, is_on: (
                 {
                     "SleepMode": True,
@@ -183,17 +200,20 @@ async def async_setup_switch(
                 }
                 if is_on
                 else {
-                    "Power": data.action.get("Power"),
+                    "Power": data.action.Power,
                     "SleepMode": False,
-                    "Automatic": data.action.get("Automatic"),
-                    "FanSpeed": data.action.get("FanSpeed"),
+                    "Automatic": data.action.Automatic,
+                    "FanSpeed": data.action.FanSpeed,
                     "Action": "control",
                 }
             ),
         ),
     ]
     async_add_entities(
-        [VentaSwitch(coordinator, description) for description in descriptions]
+        [
+            VentaSwitch(coordinator, description)
+            for description in async_profile_descriptions(coordinator, descriptions)
+        ]
     )
 
 
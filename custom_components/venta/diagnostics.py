@@ -0,0 +1,102 @@
+"""Diagnostics support for Venta."""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_MAC
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_SESSION, DOMAIN
+from .venta import VentaDataUpdateCoordinator
+from .venta_protocol import VentaRawRequest
+
+TO_REDACT = {CONF_MAC, "MacAdress", "MacAddress", "DeviceId"}
+
+
+def _redact_mac(text: str, mac: str | None) -> str:
+    """Redact the device mac address from the raw text."""
+    if not mac:
+        return text
+    return re.sub(re.escape(mac), REDACTED, text, flags=re.IGNORECASE)
+
+
+def _format_exchange(
+    exchange: tuple[float, float, VentaRawRequest, bytes], mac: str | None
+) -> dict[str, Any]:
+    """Format a single recorded request and response."""
+    started, duration, request, response = exchange
+    return {
+        "started": dt_util.utc_from_timestamp(started).isoformat(),
+        "duration_ms": round(duration * 1000, 1),
+        "request": _redact_mac(bytes(request).decode(errors="replace"), mac),
+        "response": _redact_mac(response.decode(errors="replace"), mac),
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: VentaDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    device = coordinator.api.device
+    metrics = device.metrics
+    data = coordinator.data
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), {*TO_REDACT, "unique_id"}),
+        "device": {
+            "device_type": device.device_type.name,
+            "api_definition_id": device.api_definition.id,
+            "update_interval": device.update_interval.total_seconds(),
+            "request_timeout": device.request_timeout,
+        },
+        "data": async_redact_data(
+            {
+                "header": data.header.as_dict(),
+                "action": data.action.as_dict(),
+                "info": data.info.as_dict(),
+                "measure": data.measure.as_dict(),
+            },
+            TO_REDACT,
+        )
+        if data
+        else None,
+        "metrics": {
+            "poll_latency_ms": {
+                "p50": metrics.polls.p50,
+                "p95": metrics.polls.p95,
+                "max": metrics.polls.max,
+            },
+            "action_latency_ms": {
+                "p50": metrics.actions.p50,
+                "p95": metrics.actions.p95,
+                "max": metrics.actions.max,
+            },
+            "retries": metrics.retries,
+            "timeouts": metrics.timeouts,
+            "empty_responses": metrics.empty_responses,
+            "bytes_in": metrics.bytes_in,
+            "bytes_out": metrics.bytes_out,
+            "sockets": {
+                "opened": metrics.sockets_opened,
+                "open": metrics.sockets_open,
+                "reset": metrics.sockets_reset,
+                "linger_ms": {
+                    "p50": metrics.linger.p50,
+                    "p95": metrics.linger.p95,
+                    "max": metrics.linger.max,
+                },
+            },
+        },
+        "session": session.as_dict()
+        if (session := hass.data.get(DATA_SESSION))
+        else None,
+        "exchanges": [
+            _format_exchange(exchange, device.mac) for exchange in metrics.exchanges
+        ],
+    }
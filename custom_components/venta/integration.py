@@ -0,0 +1,331 @@
+"""Home Assistant setup of the Venta integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import timedelta
+from pathlib import Path
+from time import monotonic
+
+from aiohttp import ClientConnectionError
+from homeassistant.components import network
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.const import (
+    ATTR_DEVICE_ID,
+    CONF_API_VERSION,
+    CONF_HOST,
+    CONF_MAC,
+    CONF_SCAN_INTERVAL,
+    CONF_TIMEOUT,
+    Platform,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.typing import ConfigType
+
+from .config_flow import ConfigVersion
+from .const import (
+    ATTR_NEW_HOST,
+    ATTR_OLD_HOST,
+    CAPTURE_DIRECTORY,
+    CONF_API_DEFINITION_ID,
+    CONF_CAPTURE,
+    CONF_ENTITY_PROFILE,
+    CONF_KEEP_ALIVE,
+    DATA_REDISCOVERY,
+    DEFAULT_ENTITY_PROFILE,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TIMEOUT,
+    DISCOVERY_MAX_HOSTS,
+    DOMAIN,
+    EVENT_HOST_CHANGED,
+    REDISCOVERY_INTERVAL,
+)
+from .services import async_setup_services
+from .utils import async_close_session, async_get_session
+from .venta import VentaApi, VentaDataUpdateCoordinator
+from .venta_capture import VentaCapture
+from .venta_client import VentaDevice
+from .venta_discovery import find_device, network_hosts
+from .venta_protocol import API_DEFINITIONS, VentaApiVersion
+
+_LOGGER = logging.getLogger(__name__)
+
+PLATFORMS: list[Platform] = [
+    Platform.HUMIDIFIER,
+    Platform.SENSOR,
+    Platform.LIGHT,
+    Platform.SELECT,
+    Platform.BINARY_SENSOR,
+    Platform.SWITCH,
+]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Venta services."""
+    async_setup_services(hass)
+    return True
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up Venta from a config entry."""
+    conf = entry.data
+    if entry.unique_id is None:
+        hass.config_entries.async_update_entry(entry, unique_id=conf[CONF_MAC])
+
+    try:
+        api = await venta_api_setup(
+            hass,
+            conf[CONF_HOST],
+            timedelta(seconds=conf.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)),
+            conf[CONF_API_DEFINITION_ID],
+            conf.get(CONF_TIMEOUT, DEFAULT_TIMEOUT),
+            conf.get(CONF_KEEP_ALIVE),
+        )
+    except ConfigEntryNotReady:
+        async_start_rediscovery(hass, entry)
+        raise
+    if not api:
+        return False
+
+    if conf.get(CONF_CAPTURE):
+        capture = VentaCapture(
+            Path(
+                hass.config.path(
+                    CAPTURE_DIRECTORY, f"{conf[CONF_MAC].replace(':', '')}.jsonl"
+                )
+            )
+        )
+        entry.async_create_background_task(
+            hass, capture.async_run(), f"{DOMAIN} capture {conf[CONF_HOST]}"
+        )
+        api.device.set_capture(capture)
+
+    coordinator = VentaDataUpdateCoordinator(
+        hass,
+        api,
+        conf.get(CONF_ENTITY_PROFILE, DEFAULT_ENTITY_PROFILE),
+        lambda: async_start_rediscovery(hass, entry),
+    )
+
+    await coordinator.async_config_entry_first_refresh()
+
+    @callback
+    def _async_store_keep_alive() -> None:
+        """Store the keep-alive support of the device once it is known."""
+        keep_alive = api.device.keep_alive
+        if keep_alive is not None and keep_alive != entry.data.get(CONF_KEEP_ALIVE):
+            hass.config_entries.async_update_entry(
+                entry, data={**entry.data, CONF_KEEP_ALIVE: keep_alive}
+            )
+
+    entry.async_on_unload(coordinator.async_add_listener(_async_store_keep_alive))
+
+    hass.data.setdefault(DOMAIN, {})
+    hass.data[DOMAIN][entry.entry_id] = coordinator
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+
+    return True
+
+
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Unload a config entry."""
+    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        coordinator: VentaDataUpdateCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        if coordinator.profiler is not None:
+            coordinator.profiler.async_remove(coordinator)
+        await coordinator.api.device.close()
+        if rediscovery := hass.data.get(DATA_REDISCOVERY, {}).pop(entry.entry_id, None):
+            rediscovery[1].cancel()
+        if not hass.data[DOMAIN]:
+            await async_close_session(hass)
+
+    return unload_ok
+
+
+@callback
+def async_start_rediscovery(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Start looking for the device of the entry, at most once per interval.
+
+    The start time and task of the last sweep are kept per entry, the task is
+    cancelled when the entry is unloaded.
+    """
+    sweeps: dict[str, tuple[float, asyncio.Task[None]]] = hass.data.setdefault(
+        DATA_REDISCOVERY, {}
+    )
+    if (last := sweeps.get(entry.entry_id)) and monotonic() - last[0] < (
+        REDISCOVERY_INTERVAL
+    ):
+        return
+    # Not a task of the entry, a setup that is not ready cancels those
+    sweeps[entry.entry_id] = (
+        monotonic(),
+        hass.async_create_background_task(
+            async_rediscover(hass, entry),
+            f"{DOMAIN} rediscovery {entry.data[CONF_HOST]}",
+        ),
+    )
+
+
+async def _async_local_hosts(hass: HomeAssistant, host: str) -> list[str]:
+    """Return the addresses of the local networks and around the host."""
+    networks = [f"{host}/24"]
+    for adapter in await network.async_get_adapters(hass):
+        if adapter["enabled"]:
+            networks.extend(
+                f"{ipv4['address']}/{ipv4['network_prefix']}"
+                for ipv4 in adapter["ipv4"]
+            )
+
+    hosts: dict[str, None] = {}
+    for local_network in networks:
+        try:
+            addresses = network_hosts(local_network)
+        except ValueError:
+            # The host can be a name instead of an address
+            continue
+        if len(addresses) <= DISCOVERY_MAX_HOSTS:
+            hosts.update(dict.fromkeys(addresses))
+    hosts.pop(host, None)
+    return list(hosts)
+
+
+async def async_rediscover(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Find the device of the entry by its mac address and update its host.
+
+    The api definition is kept, only the address of the device is changed.
+    """
+    old_host, mac = entry.data[CONF_HOST], entry.data[CONF_MAC]
+    hosts = await _async_local_hosts(hass, old_host)
+    _LOGGER.debug("Looking for %s among %d addresses", mac, len(hosts))
+    device = await find_device(mac, hosts, async_get_session(hass))
+    if device is None:
+        _LOGGER.debug("Device %s not found on the local networks", mac)
+        return
+
+    if hass.config_entries.async_get_entry(entry.entry_id) is not entry or (
+        entry.state not in (ConfigEntryState.LOADED, ConfigEntryState.SETUP_RETRY)
+    ):
+        _LOGGER.debug("Entry of %s unloaded while looking for it", mac)
+        return
+
+    _LOGGER.info("Device %s moved from %s to %s", mac, old_host, device.host)
+    coordinator: VentaDataUpdateCoordinator | None = hass.data.get(DOMAIN, {}).get(
+        entry.entry_id
+    )
+    if coordinator is not None:
+        # Moved before the entry is updated, so the update does not reload it
+        await coordinator.api.device.set_host(device.host)
+    hass.config_entries.async_update_entry(
+        entry,
+        title=device.host if entry.title == old_host else entry.title,
+        data={**entry.data, CONF_HOST: device.host},
+    )
+
+    event_data = {CONF_MAC: mac, ATTR_OLD_HOST: old_host, ATTR_NEW_HOST: device.host}
+    if registry_device := dr.async_get(hass).async_get_device(
+        connections={(dr.CONNECTION_NETWORK_MAC, mac)}
+    ):
+        event_data[ATTR_DEVICE_ID] = registry_device.id
+    hass.bus.async_fire(EVENT_HOST_CHANGED, event_data)
+
+    if coordinator is not None:
+        await coordinator.async_request_refresh()
+    elif entry.state is ConfigEntryState.SETUP_RETRY:
+        await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def venta_api_setup(  # noqa: PLR0913
+    hass: HomeAssistant,
+    host: str,
+    update_interval: timedelta,
+    api_definition_id: str,
+    request_timeout: int = DEFAULT_TIMEOUT,
+    keep_alive: bool | None = None,
+) -> VentaApi | None:
+    """Create a Venta instance only once."""
+    session = async_get_session(hass)
+    try:
+        async with asyncio.timeout(10):
+            device = VentaDevice(
+                host,
+                update_interval,
+                api_definition_id,
+                session,
+                request_timeout=request_timeout,
+                keep_alive=keep_alive,
+            )
+            await device.init()
+    except asyncio.TimeoutError as err:
+        _LOGGER.debug("Connection to %s timed out", host, exc_info=err)
+        raise ConfigEntryNotReady from err
+    except ClientConnectionError as err:
+        _LOGGER.debug("ClientConnectionError to %s", host, exc_info=err)
+        raise ConfigEntryNotReady from err
+    except Exception as err:  # pylint: disable=broad-except
+        _LOGGER.error("Unexpected error creating device %s", host, exc_info=err)
+        return None
+
+    api = VentaApi(device)
+
+    return api
+
+
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate old entry."""
+    _LOGGER.debug("Migrating from version %s", entry.version)
+
+    if entry.version == ConfigVersion.V1:
+        new = {**entry.data, CONF_API_VERSION: VentaApiVersion.V2.value}
+        entry.version = ConfigVersion.V2
+        hass.config_entries.async_update_entry(entry, data=new)
+    if entry.version == ConfigVersion.V2:
+        entry.version = ConfigVersion.V3
+        hass.config_entries.async_update_entry(entry)
+    if entry.version == ConfigVersion.V3:
+        api_version = entry.data[CONF_API_VERSION]
+        api_definition = [
+            api for api in API_DEFINITIONS if api.version.value == api_version
+        ][0]
+        new = {**entry.data, CONF_API_DEFINITION_ID: api_definition.id}
+        entry.version = ConfigVersion.V4
+        hass.config_entries.async_update_entry(entry, data=new)
+
+    _LOGGER.debug("Migration to version %s successful", entry.version)
+
+    return True
+
+
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Update options, reloading the entry only when required."""
+    conf = entry.data
+    coordinator: VentaDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    device = coordinator.api.device
+
+    if (
+        conf[CONF_HOST] != device.host
+        or conf[CONF_API_DEFINITION_ID] != device.api_definition.id
+        or conf.get(CONF_ENTITY_PROFILE, DEFAULT_ENTITY_PROFILE)
+        != coordinator.entity_profile
+        or bool(conf.get(CONF_CAPTURE)) != (device.capture is not None)
+    ):
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    update_interval = timedelta(
+        seconds=conf.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    )
+    device.set_request_timeout(conf.get(CONF_TIMEOUT, DEFAULT_TIMEOUT))
+    if update_interval != coordinator.update_interval:
+        _LOGGER.debug("Applying update interval %s to %s", update_interval, device.host)
+        device.update_interval = update_interval
+        coordinator.update_interval = update_interval
+        await coordinator.async_request_refresh()
@@ -46,7 +46,11 @@ class _RawJSONDecoder(JSONDecoder):
         return data
 
 
-def extract_json(value: str, index: int = 0) -> Generator[dict[str, Any]]:
+def extract_json(
+    value: str,
+    index: int = 0,
+    object_hook: Callable[[dict[str, Any]], Any] | None = None,
+) -> Generator[dict[str, Any]]:
     """Extract JSON from any string."""
     context = {"end": len(value)}
     while (index := value.find("{", index)) != -1:
@@ -54,6 +58,7 @@ def extract_json(value: str, index: int = 0) -> Generator[dict[str, Any]]:
             yield loads(
                 value,
                 cls=_RawJSONDecoder,
+                object_hook=object_hook,
                 index=index,
                 end_hook=lambda end: context.update(end=end),
             )
@@ -0,0 +1,35 @@
+"""Describe the Venta logbook events."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from homeassistant.components.logbook import (
+    LOGBOOK_ENTRY_MESSAGE,
+    LOGBOOK_ENTRY_NAME,
+)
+from homeassistant.const import CONF_MAC
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .const import ATTR_NEW_HOST, ATTR_OLD_HOST, DOMAIN, EVENT_HOST_CHANGED
+
+
+@callback
+def async_describe_events(
+    hass: HomeAssistant,
+    async_describe_event: Callable[[str, str, Callable[[Event], dict[str, str]]], None],
+) -> None:
+    """Describe the logbook events."""
+
+    @callback
+    def async_describe_host_changed(event: Event) -> dict[str, str]:
+        """Describe the device found at a new address."""
+        data = event.data
+        return {
+            LOGBOOK_ENTRY_NAME: f"Venta {data[CONF_MAC]}",
+            LOGBOOK_ENTRY_MESSAGE: (
+                f"was found at {data[ATTR_NEW_HOST]} instead of {data[ATTR_OLD_HOST]}"
+            ),
+        }
+
+    async_describe_event(DOMAIN, EVENT_HOST_CHANGED, async_describe_host_changed)
@@ -0,0 +1,63 @@
+"""Services for the Venta integration."""
+
+from __future__ import annotations
+
+import voluptuous as vol
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+
+from .const import ATTR_CYCLES, DEFAULT_PROFILE_CYCLES, DOMAIN, SERVICE_PROFILE
+from .venta import VentaDataUpdateCoordinator
+from .venta_profiler import VentaProfiler
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_CYCLES, default=DEFAULT_PROFILE_CYCLES): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+    }
+)
+
+
+def _coordinators(
+    hass: HomeAssistant, device_ids: list[str] | None
+) -> list[VentaDataUpdateCoordinator]:
+    """Return the coordinators of the devices, all of them when not given."""
+    coordinators: dict[str, VentaDataUpdateCoordinator] = hass.data.get(DOMAIN, {})
+    if not device_ids:
+        return list(coordinators.values())
+
+    registry = dr.async_get(hass)
+    selected = []
+    for device_id in device_ids:
+        if (device := registry.async_get(device_id)) is None:
+            raise HomeAssistantError(f"Device {device_id} not found")
+        selected.extend(
+            coordinators[entry_id]
+            for entry_id in device.config_entries
+            if entry_id in coordinators
+        )
+    return selected
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Venta services."""
+
+    async def _async_profile(call: ServiceCall) -> None:
+        """Profile the next coordinator cycles of the devices."""
+        coordinators = _coordinators(hass, call.data.get(ATTR_DEVICE_ID))
+        if not coordinators:
+            raise HomeAssistantError("No Venta devices to profile")
+        if any(coordinator.profiler is not None for coordinator in coordinators):
+            raise HomeAssistantError("Profiling is already in progress")
+
+        VentaProfiler(hass, coordinators, call.data[ATTR_CYCLES]).async_start()
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, _async_profile, schema=PROFILE_SCHEMA
+    )
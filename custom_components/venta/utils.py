@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
-import asyncio
-import logging
-from functools import wraps
-from typing import Any, Callable, List, TypeVar
+from typing import List, TypeVar
 
-from homeassistant.const import UnitOfTemperature
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, UnitOfTemperature
+from homeassistant.core import Event, HomeAssistant, callback
 
-_LOGGER = logging.getLogger(__name__)
+from .const import DATA_SESSION, DATA_SESSION_LISTENER
+from .venta_session import VentaSession
 
 
 def skip_zeros(
@@ -67,27 +66,26 @@ def venta_temperature_unit(value: int | None) -> str | None:
     return UnitOfTemperature.CELSIUS if value == 0 else UnitOfTemperature.FAHRENHEIT
 
 
-def retry_on_timeout(retries: int = 5, timeout: int = 10, delay: int = 0.5) -> Callable:
-    """Retry a function on timeout and with a delay."""
-
-    def decorator(fun: Callable) -> Callable:
-        @wraps(fun)
-        async def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
-            for attempt in range(retries):
-                try:
-                    async with asyncio.timeout(timeout):
-                        return await fun(*args, **kwargs)
-                except asyncio.TimeoutError:
-                    _LOGGER.warning(
-                        "Timeout calling %s, retrying... (attempt %d/%d)",
-                        fun.__name__,
-                        attempt + 1,
-                        retries,
-                    )
-                    await asyncio.sleep(delay)
-            _LOGGER.error("Retries exhausted calling %s, giving up...", fun.__name__)
-            return None
-
-        return wrapper
-
-    return decorator
+@callback
+def async_get_session(hass: HomeAssistant) -> VentaSession:
+    """Return the session shared by the Venta entries and config flows."""
+    if (session := hass.data.get(DATA_SESSION)) is None:
+        session = hass.data[DATA_SESSION] = VentaSession()
+
+        async def _async_close(_: Event) -> None:
+            # The listener is already removed once called
+            hass.data.pop(DATA_SESSION_LISTENER, None)
+            await async_close_session(hass)
+
+        hass.data[DATA_SESSION_LISTENER] = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, _async_close
+        )
+    return session
+
+
+async def async_close_session(hass: HomeAssistant) -> None:
+    """Close the shared session and stop listening for the shutdown."""
+    if (remove_listener := hass.data.pop(DATA_SESSION_LISTENER, None)) is not None:
+        remove_listener()
+    if (session := hass.data.pop(DATA_SESSION, None)) is not None:
+        await session.close()
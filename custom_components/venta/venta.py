@@ -1,248 +1,65 @@
 """Venta data and api classes."""
 
-import asyncio
 import logging
-from dataclasses import dataclass, field
-from datetime import timedelta
+from collections.abc import Callable
 from enum import Enum
+from operator import attrgetter
+from time import monotonic
+from typing import TYPE_CHECKING
 
-from aiohttp import ClientConnectionError, ClientError, ClientSession
-from homeassistant.core import HomeAssistant
+from aiohttp import ClientConnectionError
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC, DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN
-from .venta_strategy import (
-    VentaApiHostDefinition,
-    VentaHttpStrategy,
-    VentaTcpHeader,
-    VentaTcpStrategy,
+from .const import (
+    DEFAULT_ENTITY_PROFILE,
+    DOMAIN,
+    REDISCOVERY_FAILURES,
+    SLOW_UPDATE_TIER_ACTION_FIELDS,
+    SLOW_UPDATE_TIER_INFO_FIELDS,
+    SLOW_UPDATE_TIER_INTERVAL,
+)
+from .venta_client import VentaApiVersionError, VentaDevice
+from .venta_protocol import (
+    API_DEFINITIONS,
+    VentaApiDefinition,
+    VentaApiEndpointDefinition,
+    VentaApiVersion,
+    VentaData,
+    VentaDeviceType,
 )
 
-_LOGGER = logging.getLogger(__name__)
-
-
-class VentaApiVersionError(Exception):
-    """Can't detect the api version."""
-
-
-class VentaDeviceType(Enum):
-    """Venta device types."""
-
-    UNKNOWN = -1
-    LP60 = 1
-    LPH60 = 2
-    LW60 = 3
-    LW60T = 4
-    LW62 = 5
-    LW62T = 6
-    AP902 = 11
-    AH902 = 12
-    AW902 = 13
-    AS100 = 100
-    LW73 = 106
-    LW74 = 107
-    LP73 = 116
-    LP74 = 117
-    AS150 = 150
-    AH5XX = 500
-
-
-class VentaApiVersion(Enum):
-    """Veta api versions."""
-
-    V0 = 0
-    V2 = 2
-    V3 = 3
-
-
-@dataclass
-class VentaApiEndpointDefinition:
-    """Venta api endpoint definition."""
-
-    method: str
-    url: str
-
-
-@dataclass
-class VentaApiDefinition:
-    """Venta api definition."""
-
-    version: VentaApiVersion
-    status: VentaApiEndpointDefinition
-    action: VentaApiEndpointDefinition | None
-    port: int = 80
-
-    @property
-    def id(self) -> str:
-        """Return the id of the definition."""
-        status_id = self.status.url
-        action_id = self.action.url if self.action else "None"
-        return f"{self.version.value}/{status_id}/{action_id}"
-
-
-API_DEFINITIONS: list[VentaApiDefinition] = [
-    VentaApiDefinition(
-        VentaApiVersion.V3,
-        VentaApiEndpointDefinition("POST", "api/telemetry"),
-        VentaApiEndpointDefinition("POST", "api/telemetry?request=set"),
-    ),
-    VentaApiDefinition(
-        VentaApiVersion.V3, VentaApiEndpointDefinition("GET", "sensordata.json"), None
-    ),
-    VentaApiDefinition(
-        VentaApiVersion.V2,
-        VentaApiEndpointDefinition("POST", "datastructure"),
-        VentaApiEndpointDefinition("POST", "datastructure"),
-    ),
-    VentaApiDefinition(
-        VentaApiVersion.V0,
-        VentaApiEndpointDefinition("GET", "Complete"),
-        VentaApiEndpointDefinition("POST", "Action"),
-        48000,
-    ),
+if TYPE_CHECKING:
+    from .venta_profiler import VentaProfiler
+
+# The client and protocol names are still importable from here
+__all__ = [
+    "API_DEFINITIONS",
+    "VentaApi",
+    "VentaApiDefinition",
+    "VentaApiEndpointDefinition",
+    "VentaApiVersion",
+    "VentaApiVersionError",
+    "VentaData",
+    "VentaDataUpdateCoordinator",
+    "VentaDevice",
+    "VentaDeviceType",
+    "VentaUpdateTier",
 ]
 
+_LOGGER = logging.getLogger(__name__)
 
-@dataclass
-class VentaData:
-    """Class for holding the Venta data."""
-
-    header: dict[str, str | int | bool] = field(default_factory=dict)
-    action: dict[str, str | int | bool] = field(default_factory=dict)
-    info: dict[str, str | int | bool] = field(default_factory=dict)
-    measure: dict[str, str | int | bool] = field(default_factory=dict)
-    is_empty: bool = field(default=False)
-
-
-class VentaDevice:
-    """Representation of a Venta device."""
-
-    host: str
-    mac: str | None
-    device_type: VentaDeviceType
-    api_version: VentaApiVersion
-    update_interval: timedelta
-    api_definition: VentaApiDefinition
-
-    def __init__(
-        self,
-        host: str,
-        update_interval: timedelta,
-        api_definition_id: str | None,
-        session: ClientSession | None = None,
-    ) -> None:
-        """Venta device constructor."""
-        self.host = host
-        self.update_interval = update_interval
-        self.mac = None
-        self.device_type = VentaDeviceType.UNKNOWN
-        self._session = session
-        self._endpoint_definition = None
-        self._strategy = None
-
-        if api_definition_id is not None:
-            api_definition = next(
-                (d for d in API_DEFINITIONS if d.id == api_definition_id),
-                None,
-            )
-            if api_definition is None:
-                raise ValueError(f"Api definition {api_definition_id} not found.")
-            self._set_api_definition(api_definition)
-
-    async def detect_api(self, api_version: int | None = None) -> None:
-        """Detect the venta api."""
-        definitions = API_DEFINITIONS
-        if api_version is not None:
-            definitions = [d for d in definitions if d.version.value == api_version]
-
-        for api_definition in definitions:
-            self._set_api_definition(api_definition)
-            try:
-                status = self.api_definition.status
-                async with asyncio.timeout(5):
-                    data = await self._strategy.get_status(
-                        status.method,
-                        status.url,
-                    )
-                    if data is not None and data.get("Header") is not None:
-                        return
-                await asyncio.sleep(0.5)
-            except (asyncio.TimeoutError, ClientError) as err:
-                _LOGGER.debug("Error while detecting api: %s", err)
-                pass
-        raise VentaApiVersionError()
-
-    async def init(self) -> None:
-        """Initialize the Venta device."""
-        data = await self.status()
-        self.mac = data.header.get("MacAdress") or data.header.get("DeviceId")
-
-        try:
-            self.device_type = VentaDeviceType(data.header.get("DeviceType"))
-        except ValueError:
-            self.device_type = VentaDeviceType.UNKNOWN
-
-        if isinstance(self._strategy, VentaTcpStrategy):
-            self._strategy.set_header(
-                VentaTcpHeader(
-                    mac=self.mac,
-                    device_type=self.device_type.value,
-                )
-            )
-
-    async def status(self) -> VentaData:
-        """Update the Venta device."""
-        return await self._map_data(
-            await self._strategy.get_status(
-                self.api_definition.status.method, self.api_definition.status.url
-            )
-        )
-
-    async def action(
-        self,
-        action: dict[str, str | int | bool],
-        coordinator: "VentaDataUpdateCoordinator",
-    ) -> VentaData:
-        """Send action to the Venta device."""
-        if self.api_definition.action is None:
-            raise ValueError("Action is not supported for this device.")
-
-        data = await self._map_data(
-            await self._strategy.send_action(
-                self.api_definition.action.method,
-                self.api_definition.action.url,
-                action,
-            )
-        )
 
-        await asyncio.sleep(0.2)  # Wait for the device to process the action
-        await coordinator.async_request_refresh()
+class VentaUpdateTier(Enum):
+    """Venta entity update tiers."""
 
-        return data
+    FAST = "fast"
+    SLOW = "slow"
 
-    def _set_api_definition(self, api_definition: VentaApiDefinition) -> None:
-        """Set the api definition defaults."""
-        self.api_version = api_definition.version
-        self.api_definition = api_definition
 
-        host_definition = VentaApiHostDefinition(self.host, self.api_definition.port)
-        if self.api_version == VentaApiVersion.V0:
-            self._strategy = VentaTcpStrategy(host_definition)
-        else:
-            self._strategy = VentaHttpStrategy(host_definition, self._session)
-
-    async def _map_data(self, data: dict[str, str | int | bool] | None) -> VentaData:
-        """Map device response to data."""
-        if data is None:
-            return VentaData(is_empty=True)
-
-        return VentaData(
-            header=data.get("Header", {}),
-            action=data.get("Action", {}),
-            info=data.get("Info", {}),
-            measure=data.get("Measure", {}),
-        )
+_slow_tier_action = attrgetter(*SLOW_UPDATE_TIER_ACTION_FIELDS)
+_slow_tier_info = attrgetter(*SLOW_UPDATE_TIER_INFO_FIELDS)
 
 
 class VentaApi:
@@ -266,30 +83,102 @@ class VentaDataUpdateCoordinator(DataUpdateCoordinator[VentaData]):
 
     api: VentaApi
 
-    def __init__(self, hass: HomeAssistant, api: VentaApi) -> None:
-        """Initialize data coordinator."""
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: VentaApi,
+        entity_profile: str = DEFAULT_ENTITY_PROFILE,
+        on_unreachable: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialize data coordinator.
+
+        The on_unreachable callback is called after every failed update once
+        the device did not answer REDISCOVERY_FAILURES times in a row.
+        """
         super().__init__(
             hass, _LOGGER, name=DOMAIN, update_interval=api.device.update_interval
         )
         self.api = api
+        self.entity_profile = entity_profile
         self.data = VentaData()
+        self.update_count = 0
+        self.failures = 0
+        self._on_unreachable = on_unreachable
+        self.profiler: VentaProfiler | None = None
+        self._slow_tier_state: tuple | None = None
 
     async def _async_update_data(self) -> VentaData:
-        """Update data via library."""
+        """Update data via library, timing the poll when profiling."""
+        if (profiler := self.profiler) is None:
+            return await self._async_poll()
+
+        profiler.async_poll_started(self)
+        start = monotonic()
+        try:
+            return await self._async_poll()
+        finally:
+            profiler.async_poll_finished(self, monotonic() - start)
+
+    async def _async_poll(self) -> VentaData:
+        """Poll the device."""
         _LOGGER.debug("Polling Venta device: %s", self.api.device.host)
         try:
             data = await self.api.async_update()
             if data.is_empty:
                 _LOGGER.debug("Venta device: %s not updated", self.api.device.host)
+                self._async_failed()
             else:
+                self.failures = 0
                 self.data = data
             return self.data
         except ClientConnectionError as error:
             _LOGGER.warning(
                 "Connection failed for %s", self.api.device.host, exc_info=error
             )
+            self._async_failed()
             raise UpdateFailed(error) from error
 
+    @callback
+    def _async_failed(self) -> None:
+        """Count the failed update and report an unreachable device."""
+        self.failures += 1
+        if self.failures >= REDISCOVERY_FAILURES and self._on_unreachable:
+            self._on_unreachable()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners, slow tier ones only when due or their data changed.
+
+        The slow tier listeners have the tier as context. Their data is
+        compared on the raw fields they read, without calling their sensors.
+        """
+        self.update_count += 1
+        data = self.data
+        slow_tier_state = (
+            self.last_update_success,
+            _slow_tier_action(data.action),
+            _slow_tier_info(data.info),
+        )
+        slow_tier_due = (
+            self.update_count % SLOW_UPDATE_TIER_INTERVAL == 0
+            or slow_tier_state != self._slow_tier_state
+        )
+        if slow_tier_due:
+            self._slow_tier_state = slow_tier_state
+
+        if self.profiler is not None:
+            self.profiler.async_profile(self._async_notify, slow_tier_due)
+        else:
+            self._async_notify(slow_tier_due)
+
+    @callback
+    def _async_notify(self, slow_tier_due: bool) -> None:
+        """Call the listeners of the tiers due."""
+        for update_callback, context in list(self._listeners.values()):
+            if context is VentaUpdateTier.SLOW and not slow_tier_due:
+                continue
+            update_callback()
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return a device description for device registry."""
@@ -300,5 +189,5 @@ class VentaDataUpdateCoordinator(DataUpdateCoordinator[VentaData]):
             manufacturer="Venta",
             name=f"Venta {model}",
             model=model,
-            sw_version=self.data.info.get("SWMain"),
+            sw_version=self.data.info.SWMain,
         )
@@ -0,0 +1,188 @@
+"""Capture and replay of the raw Venta exchanges."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from .const import CAPTURE_BACKUPS, CAPTURE_MAX_BYTES, CAPTURE_QUEUE_SIZE
+from .venta_protocol import (
+    VentaProtocolError,
+    VentaRawRequest,
+    parse_http_request,
+    parse_message,
+    parse_v0_response,
+)
+from .venta_strategy import VentaProtocolStrategy
+
+_LOGGER = logging.getLogger(__name__)
+
+_Exchange = tuple[float, float, VentaRawRequest, bytes]
+_ReplayKey = tuple[str, str, bool]
+
+
+def _format_exchange(exchange: _Exchange) -> str:
+    """Format the exchange as a single JSON line."""
+    started, duration, raw_request, response = exchange
+    request = bytes(raw_request)
+    try:
+        method, url, raw_body = parse_message(request)
+    except VentaProtocolError:
+        try:
+            method, url, raw_body = parse_http_request(request)
+        except VentaProtocolError:
+            method, url, raw_body = "", "", request
+    body = raw_body.decode(errors="replace")
+    return json.dumps(
+        {
+            "ts": started,
+            "duration": duration,
+            "method": method,
+            "url": url,
+            "request": body,
+            "response": response.decode(errors="replace"),
+        },
+        separators=(",", ":"),
+    )
+
+
+class VentaCapture:
+    """Append the raw exchanges of a device to rotating JSONL files.
+
+    Recording only puts the raw exchange into a bounded queue, the writer
+    task formats the queued exchanges and appends them in the executor.
+    Exchanges are dropped when the writer cannot keep up.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = CAPTURE_MAX_BYTES,
+        backups: int = CAPTURE_BACKUPS,
+    ) -> None:
+        """Initialize the capture."""
+        self.path = path
+        self.dropped = 0
+        self._max_bytes = max_bytes
+        self._backups = backups
+        self._queue: asyncio.Queue[_Exchange] = asyncio.Queue(CAPTURE_QUEUE_SIZE)
+
+    def record(
+        self,
+        started: float,
+        duration: float,
+        request: VentaRawRequest,
+        response: bytes,
+    ) -> None:
+        """Queue the exchange for writing."""
+        try:
+            self._queue.put_nowait((started, duration, request, response))
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    async def async_run(self) -> None:
+        """Write the queued exchanges until cancelled."""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                while not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                await loop.run_in_executor(None, self._write, batch)
+        except asyncio.CancelledError:
+            batch = []
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            if batch:
+                await loop.run_in_executor(None, self._write, batch)
+            raise
+
+    def _write(self, batch: list[_Exchange]) -> None:
+        """Append the exchanges, rotating the file when it gets too big."""
+        lines = "".join(f"{_format_exchange(exchange)}\n" for exchange in batch)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists() and self.path.stat().st_size >= self._max_bytes:
+            self._rotate()
+        with self.path.open("a", encoding="utf-8") as file:
+            file.write(lines)
+
+    def _rotate(self) -> None:
+        """Shift the backups and start a new file."""
+        for index in range(self._backups - 1, 0, -1):
+            source = self.path.with_name(f"{self.path.name}.{index}")
+            if source.exists():
+                source.replace(self.path.with_name(f"{self.path.name}.{index + 1}"))
+        if self._backups:
+            self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+
+
+def is_action(exchange: dict[str, Any]) -> bool:
+    """Return if the captured exchange sent an action.
+
+    The V2 status and action share their method and url, only the actions
+    send an Action object.
+    """
+    return '"Action"' in exchange["request"]
+
+
+def read_capture(paths: Iterable[Path]) -> list[dict[str, Any]]:
+    """Read the captured exchanges ordered by their start time."""
+    exchanges = []
+    for path in paths:
+        with path.open(encoding="utf-8") as file:
+            exchanges.extend(json.loads(line) for line in file if line.strip())
+    return sorted(exchanges, key=lambda exchange: exchange["ts"])
+
+
+class VentaReplayStrategy(VentaProtocolStrategy):
+    """Serve the captured responses back in the recorded order.
+
+    Every request waits for the recorded duration divided by the speed, a
+    speed of 0 answers immediately. Requests are matched by their method, url
+    and whether they send an action, the responses of each are served in a
+    loop.
+    """
+
+    def __init__(self, exchanges: list[dict[str, Any]], speed: float = 1.0) -> None:
+        """Venta replay strategy constructor."""
+        self.speed = speed
+        self._exchanges: dict[_ReplayKey, list[dict[str, Any]]] = {}
+        self._positions: dict[_ReplayKey, int] = {}
+        for exchange in exchanges:
+            key = (exchange["method"], exchange["url"], is_action(exchange))
+            self._exchanges.setdefault(key, []).append(exchange)
+
+    async def get_status(self, method: str, url: str) -> dict[str, Any] | None:
+        """Serve the next captured status."""
+        return await self._replay((method, url, False))
+
+    async def send_action(
+        self, method: str, url: str, json: dict[str, Any] | None = None
+    ) -> dict[str, Any] | None:
+        """Serve the next captured action response."""
+        return await self._replay((method, url, True))
+
+    async def _replay(self, key: _ReplayKey) -> dict[str, Any] | None:
+        """Wait for the recorded duration and return the parsed response."""
+        if not (exchanges := self._exchanges.get(key)):
+            return None
+        position = self._positions.get(key, 0)
+        self._positions[key] = (position + 1) % len(exchanges)
+        exchange = exchanges[position]
+
+        if self.speed:
+            await asyncio.sleep(exchange["duration"] / self.speed)
+        response = exchange["response"]
+        if self.metrics is not None:
+            self.metrics.bytes_in += len(response)
+        try:
+            # The lenient V0 parsing accepts the HTTP bodies as well
+            return parse_v0_response(response)
+        except VentaProtocolError:
+            return None
@@ -0,0 +1,256 @@
+"""Venta device client, usable without Home Assistant."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import timedelta
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from aiohttp import ClientError, ClientSession
+
+from .venta_metrics import VentaMetrics
+from .venta_protocol import (
+    API_DEFINITIONS,
+    VentaApiDefinition,
+    VentaApiVersion,
+    VentaData,
+    VentaDeviceType,
+    VentaTcpHeader,
+    device_identity,
+    is_status,
+    map_data,
+)
+from .venta_session import VentaSession
+from .venta_strategy import (
+    VentaApiHostDefinition,
+    VentaHttpStrategy,
+    VentaKeepAlive,
+    VentaProfileHook,
+    VentaProtocolStrategy,
+    VentaTcpStrategy,
+)
+
+if TYPE_CHECKING:
+    from .venta import VentaDataUpdateCoordinator
+    from .venta_capture import VentaCapture
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class VentaApiVersionError(Exception):
+    """Can't detect the api version."""
+
+
+class VentaDevice:
+    """Representation of a Venta device.
+
+    Without a session the device owns a Venta session shared by all its
+    strategies, which is released by close() or leaving the context. The
+    keep-alive support is observed on the first requests and stored with the
+    api definition, from then on the connections are pooled only when it is.
+    """
+
+    host: str
+    mac: str | None
+    device_type: VentaDeviceType
+    api_version: VentaApiVersion
+    update_interval: timedelta
+    api_definition: VentaApiDefinition
+    metrics: VentaMetrics
+
+    def __init__(  # noqa: PLR0913
+        self,
+        host: str,
+        update_interval: timedelta,
+        api_definition_id: str | None,
+        session: ClientSession | VentaSession | None = None,
+        request_timeout: int | None = None,
+        keep_alive: bool | None = None,
+    ) -> None:
+        """Venta device constructor."""
+        self.host = host
+        self.update_interval = update_interval
+        self.mac = None
+        self.device_type = VentaDeviceType.UNKNOWN
+        self.request_timeout = request_timeout
+        self.metrics = VentaMetrics()
+        self.capture: VentaCapture | None = None
+        self.profile: VentaProfileHook | None = None
+        self._owns_session = session is None
+        self._session = VentaSession() if session is None else session
+        self._endpoint_definition = None
+        self._strategy = None
+        self._keep_alive = VentaKeepAlive()
+
+        if api_definition_id is not None:
+            api_definition = next(
+                (d for d in API_DEFINITIONS if d.id == api_definition_id),
+                None,
+            )
+            if api_definition is None:
+                raise ValueError(f"Api definition {api_definition_id} not found.")
+            self._set_api_definition(api_definition, keep_alive)
+
+    @property
+    def keep_alive(self) -> bool | None:
+        """Return if the device keeps the connections, None until known."""
+        return self._keep_alive.supported
+
+    async def detect_api(self, api_version: int | None = None) -> None:
+        """Detect the venta api."""
+        definitions = API_DEFINITIONS
+        if api_version is not None:
+            definitions = [d for d in definitions if d.version.value == api_version]
+
+        for api_definition in definitions:
+            if self._strategy is not None:
+                await self._strategy.close()
+            self._set_api_definition(api_definition)
+            try:
+                status = self.api_definition.status
+                async with asyncio.timeout(5):
+                    data = await self._strategy.get_status(
+                        status.method,
+                        status.url,
+                    )
+                    if is_status(data):
+                        return
+                await asyncio.sleep(0.5)
+            except (asyncio.TimeoutError, ClientError) as err:
+                _LOGGER.debug("Error while detecting api: %s", err)
+                pass
+        raise VentaApiVersionError()
+
+    async def init(self) -> None:
+        """Initialize the Venta device."""
+        data = await self.status()
+        self.mac, self.device_type = device_identity(data)
+        self._set_header()
+
+    async def set_host(self, host: str) -> None:
+        """Move the device to a new address, keeping its api definition."""
+        if self._strategy is not None:
+            await self._strategy.close()
+        self.host = host
+        self._set_api_definition(self.api_definition, self.keep_alive)
+        self._set_header()
+
+    async def status(self) -> VentaData:
+        """Update the Venta device."""
+        start = monotonic()
+        data = await self._strategy.get_status(
+            self.api_definition.status.method, self.api_definition.status.url
+        )
+        self.metrics.polls.record(monotonic() - start)
+        return await self._map_data(data)
+
+    async def action(
+        self,
+        action: dict[str, str | int | bool],
+        coordinator: VentaDataUpdateCoordinator | None = None,
+    ) -> VentaData:
+        """Send action to the Venta device, refreshing the coordinator if any."""
+        if self.api_definition.action is None:
+            raise ValueError("Action is not supported for this device.")
+
+        start = monotonic()
+        response = await self._strategy.send_action(
+            self.api_definition.action.method,
+            self.api_definition.action.url,
+            action,
+        )
+        self.metrics.actions.record(monotonic() - start)
+        data = await self._map_data(response)
+
+        if coordinator is not None:
+            await asyncio.sleep(0.2)  # Wait for the device to process the action
+            await coordinator.async_request_refresh()
+
+        return data
+
+    async def close(self) -> None:
+        """Close the strategy and the own session of the device."""
+        if self._strategy is not None:
+            await self._strategy.close()
+        if self._owns_session:
+            await self._session.close()
+
+    async def __aenter__(self) -> VentaDevice:
+        """Use the device in the context."""
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        """Close the device when leaving the context."""
+        await self.close()
+
+    def set_request_timeout(self, request_timeout: int | None) -> None:
+        """Set the request timeout of the running strategy."""
+        self.request_timeout = request_timeout
+        if self._strategy is not None:
+            self._strategy.request_timeout = request_timeout
+
+    def set_capture(self, capture: VentaCapture | None) -> None:
+        """Set the capture of the raw exchanges."""
+        self.capture = capture
+        if self._strategy is not None:
+            self._strategy.capture = capture
+
+    def set_profile(self, profile: VentaProfileHook | None) -> None:
+        """Set the hook running the parsing and mapping of the responses."""
+        self.profile = profile
+        if self._strategy is not None:
+            self._strategy.profile = profile
+
+    def set_strategy(self, strategy: VentaProtocolStrategy) -> None:
+        """Replace the strategy, e.g. to replay a capture."""
+        strategy.metrics = self.metrics
+        strategy.capture = self.capture
+        strategy.profile = self.profile
+        strategy.keep_alive = self._keep_alive
+        self._strategy = strategy
+
+    def _set_api_definition(
+        self, api_definition: VentaApiDefinition, keep_alive: bool | None = None
+    ) -> None:
+        """Set the api definition defaults."""
+        self.api_version = api_definition.version
+        self.api_definition = api_definition
+        self._keep_alive = VentaKeepAlive(keep_alive)
+
+        host_definition = VentaApiHostDefinition(self.host, self.api_definition.port)
+        if self.api_version == VentaApiVersion.V0:
+            self._strategy = VentaTcpStrategy(
+                host_definition,
+                request_timeout=self.request_timeout,
+                resolver=self._session.resolver
+                if isinstance(self._session, VentaSession)
+                else None,
+            )
+        else:
+            self._strategy = VentaHttpStrategy(
+                host_definition, self._session, self.request_timeout
+            )
+        self._strategy.metrics = self.metrics
+        self._strategy.capture = self.capture
+        self._strategy.profile = self.profile
+        self._strategy.keep_alive = self._keep_alive
+
+    def _set_header(self) -> None:
+        """Set the header of the TCP strategy from the device identity."""
+        if isinstance(self._strategy, VentaTcpStrategy):
+            self._strategy.set_header(
+                VentaTcpHeader(
+                    mac=self.mac,
+                    device_type=self.device_type.value,
+                )
+            )
+
+    async def _map_data(self, data: dict[str, str | int | bool] | None) -> VentaData:
+        """Map device response to data."""
+        if data is None:
+            self.metrics.empty_responses += 1
+        if self.profile is not None:
+            return self.profile(map_data, data)
+        return map_data(data)
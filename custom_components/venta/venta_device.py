@@ -3,16 +3,26 @@
 from __future__ import annotations
 
 import logging
-from typing import Literal
+from collections.abc import Iterable
+from typing import Literal, TypeVar
 
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.importlib import async_import_module
 
+from .const import (
+    ENTITY_PROFILE_MINIMAL,
+    ENTITY_PROFILE_STANDARD,
+)
 from .venta import VentaDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+_DescriptionT = TypeVar("_DescriptionT", bound=EntityDescription)
+
 
 async def async_setup_device(
     entity_type: Literal[
@@ -39,3 +49,54 @@ async def async_setup_device(
         await getattr(module, function_name)(coordinator, async_add_entities)
     except ImportError as error:
         _LOGGER.error("Unable to import module %s\n%s", module_path, error)
+
+
+def in_entity_profile(profile: str, entity_category: EntityCategory | None) -> bool:
+    """Check if the entity category is part of the entity profile."""
+    if profile == ENTITY_PROFILE_MINIMAL:
+        return entity_category is None
+    if profile == ENTITY_PROFILE_STANDARD:
+        return entity_category != EntityCategory.DIAGNOSTIC
+    return True
+
+
+@callback
+def async_profile_descriptions(
+    coordinator: VentaDataUpdateCoordinator, descriptions: Iterable[_DescriptionT]
+) -> list[_DescriptionT]:
+    """Return the descriptions of the entry profile, before making entities.
+
+    The registry entries of the entities left out are disabled by the
+    integration instead of removed, and enabled again once the profile
+    includes them, which reloads the entry after the registry delay.
+    """
+    profile = coordinator.entity_profile
+    mac = coordinator.api.device.mac
+    included: list[_DescriptionT] = []
+    excluded: set[str] = set()
+    for description in descriptions:
+        if in_entity_profile(profile, description.entity_category):
+            included.append(description)
+        else:
+            excluded.add(f"{mac}-{description.key}")
+
+    if (entry := coordinator.config_entry) is not None:
+        unique_ids = {f"{mac}-{description.key}" for description in included}
+        registry = er.async_get(coordinator.hass)
+        for entity_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+            if entity_entry.unique_id in excluded and not entity_entry.disabled_by:
+                _LOGGER.debug(
+                    "Disabling %s, not in the %s profile",
+                    entity_entry.entity_id,
+                    profile,
+                )
+                registry.async_update_entity(
+                    entity_entry.entity_id,
+                    disabled_by=er.RegistryEntryDisabler.INTEGRATION,
+                )
+            elif (
+                entity_entry.unique_id in unique_ids
+                and entity_entry.disabled_by is er.RegistryEntryDisabler.INTEGRATION
+            ):
+                registry.async_update_entity(entity_entry.entity_id, disabled_by=None)
+    return included
@@ -0,0 +1,190 @@
+"""Discovery of the Venta devices on the local network."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import timedelta
+from ipaddress import ip_network
+from time import monotonic
+
+from aiohttp import ClientError, ClientSession
+
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    DISCOVERY_CONCURRENCY,
+    DISCOVERY_CONNECT_TIMEOUT,
+    DISCOVERY_REQUEST_TIMEOUT,
+)
+from .venta_client import VentaDevice
+from .venta_protocol import (
+    API_DEFINITIONS,
+    DEVICE_TYPE_API_DEFINITIONS,
+    VentaApiDefinition,
+    VentaDeviceType,
+)
+from .venta_session import VentaSession
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class VentaDiscoveredDevice:
+    """Venta device found on the network."""
+
+    host: str
+    mac: str
+    device_type: VentaDeviceType
+    api_definition: VentaApiDefinition
+    duration: float
+
+
+@dataclass
+class VentaHostReport:
+    """Outcome of the identification of a single host."""
+
+    host: str
+    duration: float
+    device: VentaDiscoveredDevice | None = None
+    duplicate_of: str | None = None
+
+
+def same_mac(mac: str, other: str) -> bool:
+    """Return if the mac addresses are the same, whatever their format."""
+    return (
+        mac.replace(":", "").replace("-", "").lower()
+        == other.replace(":", "").replace("-", "").lower()
+    )
+
+
+def network_hosts(network: str) -> list[str]:
+    """Return the host addresses of the network, e.g. 192.168.1.0/24."""
+    return [str(host) for host in ip_network(network, strict=False).hosts()]
+
+
+async def open_ports(host: str, ports: Iterable[int]) -> set[int]:
+    """Return the ports accepting connections on the host."""
+
+    async def _connect(port: int) -> int | None:
+        try:
+            async with asyncio.timeout(DISCOVERY_CONNECT_TIMEOUT):
+                _, writer = await asyncio.open_connection(host, port)
+        except (asyncio.TimeoutError, OSError):
+            return None
+        writer.close()
+        with contextlib.suppress(OSError):
+            await writer.wait_closed()
+        return port
+
+    return set(await asyncio.gather(*(_connect(port) for port in ports))) - {None}
+
+
+async def identify(
+    host: str, session: ClientSession | VentaSession | None = None
+) -> VentaDiscoveredDevice | None:
+    """Identify the Venta device on the host from the header of its status.
+
+    Only the api definitions on the open ports are requested, so hosts
+    without a device cost a connection attempt per port. The device type
+    in the first status found picks the definition of the known models.
+    """
+    start = monotonic()
+    ports = await open_ports(host, {d.port for d in API_DEFINITIONS})
+    for api_definition in API_DEFINITIONS:
+        if api_definition.port not in ports:
+            continue
+        device = VentaDevice(
+            host,
+            timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            api_definition.id,
+            session,
+            request_timeout=DISCOVERY_REQUEST_TIMEOUT,
+        )
+        try:
+            async with asyncio.timeout(DISCOVERY_REQUEST_TIMEOUT):
+                await device.init()
+        except (asyncio.TimeoutError, ClientError, ValueError) as err:
+            # Malformed responses raise VentaProtocolError, a ValueError
+            _LOGGER.debug("No %s api on %s: %s", api_definition.id, host, err)
+            continue
+        finally:
+            await device.close()
+        if device.mac:
+            return VentaDiscoveredDevice(
+                host,
+                device.mac,
+                device.device_type,
+                DEVICE_TYPE_API_DEFINITIONS.get(device.device_type, api_definition),
+                monotonic() - start,
+            )
+    return None
+
+
+async def identify_hosts(
+    hosts: Iterable[str],
+    session: ClientSession | VentaSession | None = None,
+    concurrency: int = DISCOVERY_CONCURRENCY,
+) -> list[VentaHostReport]:
+    """Identify the hosts concurrently, in the order of the hosts.
+
+    A device found again under another host is reported as a duplicate of
+    the first host with the same mac address.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _identify(host: str) -> VentaHostReport:
+        async with semaphore:
+            start = monotonic()
+            device = await identify(host, session)
+            return VentaHostReport(host, monotonic() - start, device)
+
+    reports = await asyncio.gather(*(_identify(host) for host in hosts))
+    hosts_by_mac: dict[str, str] = {}
+    for report in reports:
+        if report.device is not None:
+            mac = report.device.mac.lower()
+            if (host := hosts_by_mac.setdefault(mac, report.host)) != report.host:
+                report.duplicate_of = host
+    return reports
+
+
+async def discover(
+    hosts: Iterable[str],
+    session: ClientSession | VentaSession | None = None,
+    concurrency: int = DISCOVERY_CONCURRENCY,
+) -> list[VentaDiscoveredDevice]:
+    """Identify the devices on the hosts concurrently, once per mac address."""
+    return [
+        report.device
+        for report in await identify_hosts(hosts, session, concurrency)
+        if report.device is not None and report.duplicate_of is None
+    ]
+
+
+async def find_device(
+    mac: str,
+    hosts: Iterable[str],
+    session: ClientSession | VentaSession | None = None,
+    concurrency: int = DISCOVERY_CONCURRENCY,
+) -> VentaDiscoveredDevice | None:
+    """Find the device with the mac address, the scan stops at the first match."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _identify(host: str) -> VentaDiscoveredDevice | None:
+        async with semaphore:
+            return await identify(host, session)
+
+    tasks = [asyncio.create_task(_identify(host)) for host in hosts]
+    try:
+        for identified in asyncio.as_completed(tasks):
+            device = await identified
+            if device is not None and same_mac(device.mac, mac):
+                return device
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return None
@@ -5,6 +5,8 @@ from __future__ import annotations
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import timedelta
+from time import monotonic
 from typing import Any
 
 from homeassistant.components import light
@@ -27,13 +29,35 @@ from homeassistant.components.light import (
     LightEntityDescription,
 )
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
-from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util.color import color_rgb_to_hex, rgb_hex_to_rgb_list
 
-from .const import ATTR_LED_STRIP
-from .venta import VentaData, VentaDataUpdateCoordinator
+from .const import (
+    ATTR_ACTION_LATENCY_MAX,
+    ATTR_ACTION_LATENCY_P50,
+    ATTR_ACTION_LATENCY_P95,
+    ATTR_BYTES_IN,
+    ATTR_BYTES_OUT,
+    ATTR_EMPTY_RESPONSES,
+    ATTR_LED_STRIP,
+    ATTR_POLL_LATENCY_MAX,
+    ATTR_POLL_LATENCY_P50,
+    ATTR_POLL_LATENCY_P95,
+    ATTR_RETRIES,
+    ATTR_TIMEOUTS,
+    DEFAULT_MAX_STALENESS,
+)
+from .venta import VentaData, VentaDataUpdateCoordinator, VentaUpdateTier
+from .venta_protocol import shape_action
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -117,28 +141,28 @@ class VentaBaseHumidifierEntity(
     @property
     def is_on(self) -> bool:
         """Return the device is on or off."""
-        return self.coordinator.data.action.get("Power", False)
+        return bool(self.coordinator.data.action.Power)
 
     @property
     def mode(self) -> str | None:
         """Return the current mode."""
         data = self.coordinator.data
-        if data.action.get("Automatic"):
+        if data.action.Automatic:
             return MODE_AUTO
-        if MODE_SLEEP in self._attr_available_modes and data.action.get("SleepMode"):
+        if MODE_SLEEP in self._attr_available_modes and data.action.SleepMode:
             return MODE_SLEEP
-        level = data.action.get("FanSpeed", 0)
+        level = data.action.FanSpeed or 0
         return f"level_{level}"
 
     @property
     def target_humidity(self) -> int | None:
         """Return the humidity we try to reach."""
-        return self.coordinator.data.action.get("TargetHum")
+        return self.coordinator.data.action.TargetHum
 
     @property
     def current_humidity(self) -> int | None:
         """Return the current humidity."""
-        return self.coordinator.data.measure.get("Humidity")
+        return self.coordinator.data.measure.Humidity
 
     async def async_turn_on(self, **kwargs: dict[str, Any]) -> None:
         """Turn the device on."""
@@ -167,9 +191,7 @@ class VentaBaseHumidifierEntity(
 
     def _map_to_action(self, data: dict[str, Any]) -> dict[str, Any]:
         """Map data to protocol based json action."""
-        return {
-            "Action": data,
-        }
+        return shape_action(self._device.api_version, data)
 
     async def _send_action(self, data: dict[str, Any]) -> None:
         """Send action to device."""
@@ -200,22 +222,16 @@ class VentaV2HumidifierEntity(VentaBaseHumidifierEntity):
 class VentaV3HumidifierEntity(VentaBaseHumidifierEntity):
     """Venta humidifier device for protocol version 3."""
 
-    def _map_to_action(self, data: dict[str, Any]) -> dict[str, Any]:
-        return {
-            **data,
-            "Action": "control",
-        }
-
     async def async_turn_on(self, **kwargs: dict[str, Any]) -> None:
         """Turn the device on."""
         state = self.coordinator.data.action
         action = {
             "Power": True,
-            "Automatic": state.get("Automatic"),
-            "FanSpeed": state.get("FanSpeed"),
+            "Automatic": state.Automatic,
+            "FanSpeed": state.FanSpeed,
         }
         if not action.get("Automatic"):
-            action.update({"SleepMode": state.get("SleepMode")})
+            action.update({"SleepMode": state.SleepMode})
         await self._send_action(action)
 
     async def async_turn_off(self, **kwargs: dict[str, Any]) -> None:
@@ -223,11 +239,11 @@ class VentaV3HumidifierEntity(VentaBaseHumidifierEntity):
         state = self.coordinator.data.action
         action = {
             "Power": False,
-            "Automatic": state.get("Automatic"),
-            "FanSpeed": state.get("FanSpeed"),
+            "Automatic": state.Automatic,
+            "FanSpeed": state.FanSpeed,
         }
         if not action.get("Automatic"):
-            action.update({"SleepMode": state.get("SleepMode")})
+            action.update({"SleepMode": state.SleepMode})
         await self._send_action(action)
 
     async def async_set_humidity(self, humidity: int) -> None:
@@ -235,8 +251,8 @@ class VentaV3HumidifierEntity(VentaBaseHumidifierEntity):
         state = self.coordinator.data.action
         await self._send_action(
             {
-                "Power": state.get("Power"),
-                "Automatic": state.get("Automatic"),
+                "Power": state.Power,
+                "Automatic": state.Automatic,
                 "TargetHum": humidity,
             }
         )
@@ -256,7 +272,7 @@ class VentaV3HumidifierEntity(VentaBaseHumidifierEntity):
             level = int(mode[-1])
             action.update(
                 {
-                    "SleepMode": state.get("SleepMode"),
+                    "SleepMode": state.SleepMode,
                     "Automatic": False,
                     "FanSpeed": level,
                 }
@@ -280,6 +296,10 @@ class VentaSensorEntityDescription(
 
     suggested_display_precision = 0
     unit_func: Callable[[VentaDataUpdateCoordinator], str | None] | None = None
+    deadband: float | None = None
+    min_interval: timedelta | None = None
+    max_staleness: timedelta = DEFAULT_MAX_STALENESS
+    update_tier: VentaUpdateTier = VentaUpdateTier.FAST
 
 
 class VentaSensor(CoordinatorEntity[VentaDataUpdateCoordinator], SensorEntity):
@@ -294,10 +314,58 @@ class VentaSensor(CoordinatorEntity[VentaDataUpdateCoordinator], SensorEntity):
         description: VentaSensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=description.update_tier)
         self.entity_description = description
         self._attr_device_info = coordinator.device_info
         self._attr_unique_id = f"{coordinator.api.device.mac}-{description.key}"
+        self.suppressed_writes = 0
+        self._written_value: int | float | str | None = None
+        self._written_available: bool | None = None
+        self._written_at: float | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when it changed enough or became stale."""
+        value = self.native_value
+        available = self.available
+        if not self._should_write_state(value, available):
+            self.suppressed_writes += 1
+            return
+
+        self._written_value = value
+        self._written_available = available
+        self._written_at = monotonic()
+        self.async_write_ha_state()
+
+    def _should_write_state(
+        self, value: int | float | str | None, available: bool
+    ) -> bool:
+        """Check the deadband and interval filters of the description."""
+        description = self.entity_description
+        if description.deadband is None and description.min_interval is None:
+            return True
+        if (
+            self._written_at is None
+            or available != self._written_available
+            or value is None
+            or self._written_value is None
+            or monotonic() - self._written_at
+            >= description.max_staleness.total_seconds()
+        ):
+            return True
+
+        elapsed = monotonic() - self._written_at
+        if (
+            description.min_interval is not None
+            and elapsed < description.min_interval.total_seconds()
+        ):
+            return False
+        if description.deadband is None:
+            return True
+        try:
+            return abs(value - self._written_value) > description.deadband
+        except TypeError:
+            return value != self._written_value
 
     @property
     def native_value(self) -> int | None:
@@ -312,6 +380,95 @@ class VentaSensor(CoordinatorEntity[VentaDataUpdateCoordinator], SensorEntity):
         return super().native_unit_of_measurement
 
 
+def _latency_description(
+    key: str, value_func: Callable[[VentaDataUpdateCoordinator], float | None]
+) -> VentaSensorEntityDescription:
+    """Describe a latency metric sensor."""
+    return VentaSensorEntityDescription(
+        key=key,
+        translation_key=key,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        icon="mdi:timer-outline",
+        value_func=value_func,
+    )
+
+
+def _counter_description(
+    key: str,
+    value_func: Callable[[VentaDataUpdateCoordinator], int],
+    icon: str = "mdi:counter",
+    **kwargs: Any,  # noqa: ANN401
+) -> VentaSensorEntityDescription:
+    """Describe a counter metric sensor."""
+    return VentaSensorEntityDescription(
+        key=key,
+        translation_key=key,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon=icon,
+        value_func=value_func,
+        **kwargs,
+    )
+
+
+METRICS_SENSOR_DESCRIPTIONS: list[VentaSensorEntityDescription] = [
+    _latency_description(
+        ATTR_POLL_LATENCY_P50,
+        lambda coordinator: coordinator.api.device.metrics.polls.p50,
+    ),
+    _latency_description(
+        ATTR_POLL_LATENCY_P95,
+        lambda coordinator: coordinator.api.device.metrics.polls.p95,
+    ),
+    _latency_description(
+        ATTR_POLL_LATENCY_MAX,
+        lambda coordinator: coordinator.api.device.metrics.polls.max,
+    ),
+    _latency_description(
+        ATTR_ACTION_LATENCY_P50,
+        lambda coordinator: coordinator.api.device.metrics.actions.p50,
+    ),
+    _latency_description(
+        ATTR_ACTION_LATENCY_P95,
+        lambda coordinator: coordinator.api.device.metrics.actions.p95,
+    ),
+    _latency_description(
+        ATTR_ACTION_LATENCY_MAX,
+        lambda coordinator: coordinator.api.device.metrics.actions.max,
+    ),
+    _counter_description(
+        ATTR_RETRIES, lambda coordinator: coordinator.api.device.metrics.retries
+    ),
+    _counter_description(
+        ATTR_TIMEOUTS, lambda coordinator: coordinator.api.device.metrics.timeouts
+    ),
+    _counter_description(
+        ATTR_EMPTY_RESPONSES,
+        lambda coordinator: coordinator.api.device.metrics.empty_responses,
+    ),
+    _counter_description(
+        ATTR_BYTES_IN,
+        lambda coordinator: coordinator.api.device.metrics.bytes_in,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        icon="mdi:download-network",
+    ),
+    _counter_description(
+        ATTR_BYTES_OUT,
+        lambda coordinator: coordinator.api.device.metrics.bytes_out,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        icon="mdi:upload-network",
+    ),
+]
+
+
 @dataclass
 class VentaSwitchRequiredKeysMixin:
     """Mixin for required keys."""
@@ -442,12 +599,12 @@ class VentaLight(CoordinatorEntity[VentaDataUpdateCoordinator], LightEntity):
     @property
     def is_on(self) -> bool:
         """Return if light is on."""
-        return self.coordinator.data.action.get("LEDStripActive")
+        return self.coordinator.data.action.LEDStripActive
 
     @property
     def rgb_color(self) -> tuple[int, int, int]:
         """Return the rgb color value [int, int, int]."""
-        hex_string = self.coordinator.data.action.get("LEDStrip")
+        hex_string = self.coordinator.data.action.LEDStrip
         return rgb_hex_to_rgb_list(hex_string[1:])
 
     async def async_turn_on(
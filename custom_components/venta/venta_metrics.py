@@ -0,0 +1,81 @@
+"""Venta device transport metrics."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+
+from .const import DIAGNOSTICS_EXCHANGES, METRICS_LATENCY_SAMPLES
+from .venta_protocol import VentaRawRequest
+
+
+class VentaLatency:
+    """Latency of the most recent requests.
+
+    Recording only appends to a bounded deque, the percentiles are computed
+    when read and cached until the next sample.
+    """
+
+    def __init__(self, samples: int = METRICS_LATENCY_SAMPLES) -> None:
+        """Initialize the latency window."""
+        self._samples: deque[float] = deque(maxlen=samples)
+        self._sorted: list[float] | None = None
+
+    def record(self, seconds: float) -> None:
+        """Record the duration of a single request."""
+        self._samples.append(seconds)
+        self._sorted = None
+
+    def percentile(self, percentile: float) -> float | None:
+        """Return the percentile of the window in milliseconds."""
+        if not self._samples:
+            return None
+        if self._sorted is None:
+            self._sorted = sorted(self._samples)
+        index = min(len(self._sorted) - 1, int(len(self._sorted) * percentile))
+        return round(self._sorted[index] * 1000, 1)
+
+    @property
+    def p50(self) -> float | None:
+        """Return the median latency in milliseconds."""
+        return self.percentile(0.5)
+
+    @property
+    def p95(self) -> float | None:
+        """Return the 95th percentile latency in milliseconds."""
+        return self.percentile(0.95)
+
+    @property
+    def max(self) -> float | None:
+        """Return the maximal latency in milliseconds."""
+        return self.percentile(1)
+
+
+@dataclass
+class VentaMetrics:
+    """Counters of the requests sent to a Venta device."""
+
+    polls: VentaLatency = field(default_factory=VentaLatency)
+    actions: VentaLatency = field(default_factory=VentaLatency)
+    retries: int = 0
+    timeouts: int = 0
+    empty_responses: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    sockets_opened: int = 0
+    sockets_open: int = 0
+    sockets_reset: int = 0
+    linger: VentaLatency = field(default_factory=VentaLatency)
+    exchanges: deque[tuple[float, float, VentaRawRequest, bytes]] = field(
+        default_factory=lambda: deque(maxlen=DIAGNOSTICS_EXCHANGES)
+    )
+
+    def record_exchange(
+        self,
+        started: float,
+        duration: float,
+        request: VentaRawRequest,
+        response: bytes,
+    ) -> None:
+        """Keep the raw exchange for the diagnostics, formatted only on export."""
+        self.exchanges.append((started, duration, request, response))
@@ -0,0 +1,212 @@
+"""Typed sections of the Venta device status.
+
+The sections are decoded while the JSON of a response is read, so the status
+is typed in the same pass over the raw bytes. The fields are named like the
+keys in resources/parameters and resources/settings, unknown keys are dropped
+and the values are coerced to the field type, None when they cannot be.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import NoneType
+from typing import Any, ClassVar, TypeVar, get_args, get_origin, get_type_hints
+
+_SectionT = TypeVar("_SectionT", bound="VentaSection")
+
+
+def _converter(kind: type) -> Callable[[Any], Any]:
+    """Return the function coercing a decoded value to the field type."""
+
+    def convert(value: Any) -> Any:  # noqa: ANN401
+        if value is None or type(value) is kind:
+            return value
+        if kind is bool:
+            # Only numbers are read as flags, bool("false") would be True
+            return bool(value) if isinstance(value, int | float) else None
+        if kind is list:
+            return value if isinstance(value, list) else None
+        try:
+            return kind(value)
+        except (TypeError, ValueError):
+            return None
+
+    return convert
+
+
+def _section(cls: type[_SectionT]) -> type[_SectionT]:
+    """Make the class a slotted section, keeping its field types in order."""
+    cls = dataclass(slots=True)(cls)
+    hints = get_type_hints(cls)
+    kinds = [
+        next(kind for kind in get_args(hints[name]) if kind is not NoneType)
+        for name in cls.__slots__
+    ]
+    cls.allowed = tuple(
+        frozenset({get_origin(kind) or kind, NoneType}) for kind in kinds
+    )
+    cls.converters = tuple(_converter(get_origin(kind) or kind) for kind in kinds)
+    return cls
+
+
+class VentaSection:
+    """Base of the typed sections, the missing fields are None."""
+
+    __slots__ = ()
+    allowed: ClassVar[tuple[frozenset[type], ...]]
+    converters: ClassVar[tuple[Callable[[Any], Any], ...]]
+
+    @classmethod
+    def decode(cls: type[_SectionT], values: dict[str, Any]) -> _SectionT:
+        """Build the section from the decoded object, dropping unknown keys."""
+        # The fields are looked up and type checked without a Python loop,
+        # the values are only converted when one has an unexpected type
+        arguments = [*map(values.get, cls.__slots__)]
+        if not all(map(frozenset.__contains__, cls.allowed, map(type, arguments))):
+            arguments = [
+                convert(value)
+                for convert, value in zip(cls.converters, arguments, strict=True)
+            ]
+        return cls(*arguments)
+
+    @classmethod
+    def from_data(cls: type[_SectionT], value: Any) -> _SectionT:  # noqa: ANN401
+        """Return the value as the section, decoding it if still a dict."""
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, dict):
+            return cls.decode(value)
+        return cls()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the fields received from the device."""
+        return {
+            name: value
+            for name in self.__slots__
+            if (value := getattr(self, name)) is not None
+        }
+
+
+@_section
+class VentaHeader(VentaSection):
+    """Header of the device status."""
+
+    DeviceType: int | None = None
+    MacAdress: str | None = None
+    DeviceId: str | None = None
+    DeviceName: str | None = None
+    Error: int | None = None
+    ProtocolV: str | None = None
+    Status: str | None = None
+
+
+@_section
+class VentaAction(VentaSection):
+    """Settings of the device."""
+
+    Power: bool | None = None
+    FanSpeed: int | None = None
+    TargetHum: int | None = None
+    Timer: int | None = None
+    Boost: bool | None = None
+    SleepMode: bool | None = None
+    ChildLock: bool | None = None
+    Automatic: bool | None = None
+    SysLanguage: int | None = None
+    CleanLanguage: int | None = None
+    TempUnit: int | None = None
+    DisplayLeft: int | None = None
+    DisplayRight: int | None = None
+    Reset: int | None = None
+    ConINet: int | None = None
+    DelUser: bool | None = None
+    FiltLifetime: int | None = None
+    BaLi: int | None = None
+    BaLiNormal: int | None = None
+    BaLiStandby: int | None = None
+    BaLiSleep: int | None = None
+    LEDStripActive: bool | None = None
+    LEDStrip: str | None = None
+    LEDStripMode: int | None = None
+    Update: str | None = None
+
+
+@_section
+class VentaInfo(VentaSection):
+    """Versions, counters and warnings of the device."""
+
+    SWMain: str | None = None
+    SWDisplay: str | None = None
+    SWPower: str | None = None
+    SWTouch: str | None = None
+    SWWifi: str | None = None
+    SWWIFI: str | None = None
+    FirmwareVersion: str | None = None
+    CertificateSHA1: str | None = None
+    HWIndexMB: int | None = None
+    HwIndexOption: int | None = None
+    CleanMode: bool | None = None
+    RelState: list[bool] | None = None
+    TimerT: int | None = None
+    OperationT: int | None = None
+    DiscIonT: int | None = None
+    CleaningT: int | None = None
+    CleaningR: int | None = None
+    FilterT: int | None = None
+    ServiceT: int | None = None
+    ServiceMax: int | None = None
+    UVCOnT: int | None = None
+    UVCOffT: int | None = None
+    Warnings: int | None = None
+
+
+@_section
+class VentaMeasure(VentaSection):
+    """Measurements of the device."""
+
+    Time: int | None = None
+    Temperature: float | None = None
+    Humidity: float | None = None
+    WaterLevel: int | None = None
+    Dust: int | None = None
+    FanRpm: int | None = None
+    FanRpm2: int | None = None
+    Co2: int | None = None
+    Voc: int | None = None
+    Toluene: float | None = None
+    Hcho: int | None = None
+    Pm1u0: int | None = None
+    Pm2u5: int | None = None
+    Pm10u: int | None = None
+    PmCalc1u0: float | None = None
+    PmCalc2u5: float | None = None
+    PmCalc10u: float | None = None
+    Particles0u3: int | None = None
+    Particles0u5: int | None = None
+    Particles2u5: int | None = None
+    Particles5u0: int | None = None
+    Particles10u: int | None = None
+    SensorStatus: str | None = None
+
+
+SECTIONS: dict[str, type[VentaSection]] = {
+    "Header": VentaHeader,
+    "Action": VentaAction,
+    "Info": VentaInfo,
+    "Measure": VentaMeasure,
+}
+
+
+def decode_object(data: dict[str, Any]) -> dict[str, Any]:
+    """Type the sections of a status as soon as its object is decoded.
+
+    Used as the object hook of the JSON decoders, the section objects are
+    decoded before the status holding them and are left as is.
+    """
+    if type(data.get("Header")) is not dict:
+        return data
+    for key, section in SECTIONS.items():
+        if type(values := data.get(key)) is dict:
+            data[key] = section.decode(values)
+    return data
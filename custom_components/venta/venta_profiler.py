@@ -0,0 +1,167 @@
+"""On demand profiling of the Venta coordinator cycles."""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import logging
+import pstats
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components import persistent_notification
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, PROFILE_SUMMARY_LINES
+
+if TYPE_CHECKING:
+    from .venta import VentaDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class VentaProfiler:
+    """Profile the next coordinator cycles of the chosen devices.
+
+    Only the synchronous sections run under the profiler, the parsing and
+    mapping of the responses and the listener updates, as anything else of
+    the event loop would run under it during the awaits of a poll. The polls
+    are timed instead, the summary gives their transport time, what is left
+    once the profiled parsing and mapping is taken out. A device unloaded
+    before its last cycle is dropped and the profile of the cycles done so far
+    is still written.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinators: list[VentaDataUpdateCoordinator],
+        cycles: int,
+    ) -> None:
+        """Initialize the profiler."""
+        self._hass = hass
+        self._profile = cProfile.Profile()
+        self._remaining = {coordinator: cycles for coordinator in coordinators}
+        # Duration and time spent parsing and mapping of every poll
+        self._polls: list[tuple[float, float]] = []
+        self._parsing: dict[VentaDataUpdateCoordinator, float] = {}
+        self._partial = False
+
+    @callback
+    def async_start(self) -> None:
+        """Attach the profiler to the coordinators and their devices."""
+        for coordinator in self._remaining:
+            coordinator.profiler = self
+            coordinator.api.device.set_profile(
+                partial(self._async_profile_parsing, coordinator)
+            )
+
+    @callback
+    def async_poll_started(self, coordinator: VentaDataUpdateCoordinator) -> None:
+        """Forget the parsing done outside the polls, e.g. by the actions."""
+        self._parsing.pop(coordinator, None)
+
+    @callback
+    def async_poll_finished(
+        self, coordinator: VentaDataUpdateCoordinator, duration: float
+    ) -> None:
+        """Count the cycle of the coordinator and record its poll duration."""
+        if coordinator not in self._remaining:
+            return
+        self._polls.append((duration, self._parsing.pop(coordinator, 0.0)))
+        self._remaining[coordinator] -= 1
+        if self._remaining[coordinator] <= 0:
+            # The listeners of the cycle are updated before the next iteration
+            self._hass.loop.call_soon(self.async_remove, coordinator)
+
+    @callback
+    def async_profile(self, section: Callable[..., Any], *args: Any) -> Any:  # noqa: ANN401
+        """Run the synchronous section under the profiler."""
+        self._profile.enable()
+        try:
+            return section(*args)
+        finally:
+            self._profile.disable()
+
+    @callback
+    def _async_profile_parsing(
+        self,
+        coordinator: VentaDataUpdateCoordinator,
+        section: Callable[..., Any],
+        *args: Any,  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        """Profile the parsing or mapping of a response, adding up its time."""
+        start = perf_counter()
+        try:
+            return self.async_profile(section, *args)
+        finally:
+            self._parsing[coordinator] = (
+                self._parsing.get(coordinator, 0.0) + perf_counter() - start
+            )
+
+    @callback
+    def async_remove(self, coordinator: VentaDataUpdateCoordinator) -> None:
+        """Detach the coordinator and finish once no coordinator is left."""
+        if (remaining := self._remaining.pop(coordinator, None)) is None:
+            return
+        coordinator.profiler = None
+        coordinator.api.device.set_profile(None)
+        self._parsing.pop(coordinator, None)
+        if remaining > 0:
+            self._partial = True
+        if not self._remaining:
+            self._hass.async_create_background_task(
+                self._async_finish(), f"{DOMAIN} profile writer"
+            )
+
+    async def _async_finish(self) -> None:
+        """Write the results in the executor and notify the user."""
+        path = Path(
+            self._hass.config.path(
+                f"{DOMAIN}_profile_{dt_util.utcnow().strftime('%Y%m%d%H%M%S')}"
+            )
+        )
+        await self._hass.async_add_executor_job(self._write, path)
+        _LOGGER.info("Venta profile written to %s", path)
+        persistent_notification.async_create(
+            self._hass,
+            f"Profile written to {path}.prof and summary to {path}.txt",
+            title="Venta profile",
+        )
+
+    def _write(self, path: Path) -> None:
+        """Dump the profile and its text summary."""
+        self._profile.dump_stats(path.with_suffix(".prof"))
+        summary = io.StringIO()
+        if self._partial:
+            summary.write(
+                "Partial profile, a device was unloaded before its last cycle\n"
+            )
+        if self._polls:
+            summary.write(f"Polls: {len(self._polls)}\n")
+            for name, durations in (
+                ("Duration", [duration for duration, _ in self._polls]),
+                (
+                    "Transport",
+                    [duration - parsing for duration, parsing in self._polls],
+                ),
+                ("Parsing and mapping", [parsing for _, parsing in self._polls]),
+            ):
+                durations.sort()
+                summary.write(
+                    f"{name} per poll: median "
+                    f"{durations[len(durations) // 2] * 1000:.1f} ms, "
+                    f"max {durations[-1] * 1000:.1f} ms\n"
+                )
+            summary.write(
+                "Only the parsing, mapping and listener updates are profiled\n"
+            )
+        if self._profile.getstats():
+            pstats.Stats(self._profile, stream=summary).sort_stats(
+                pstats.SortKey.CUMULATIVE
+            ).print_stats(PROFILE_SUMMARY_LINES)
+        path.with_suffix(".txt").write_text(summary.getvalue())
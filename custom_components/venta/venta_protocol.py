@@ -0,0 +1,363 @@
+"""Sans-IO implementation of the Venta protocols.
+
+Turns the requests into the bytes sent to the devices and the received bytes
+into the device data without doing any I/O, so the strategies, the simulator
+and the benchmarks share the same code and it can be exercised in isolation.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from enum import Enum
+from json import JSONDecodeError, JSONDecoder, dumps, loads
+from typing import Any
+
+from .json import extract_json
+from .venta_payload import (
+    VentaAction,
+    VentaHeader,
+    VentaInfo,
+    VentaMeasure,
+    decode_object,
+)
+
+V0_HASH = "-42"
+V0_DEVICE_NAME = "HomeAssistant"
+V3_ACTION = "control"
+# The statuses are typed while they are decoded
+_DECODER = JSONDecoder(object_hook=decode_object)
+_WHITESPACE = b" \t\r\n"
+
+
+class VentaProtocolError(ValueError):
+    """The message does not follow the Venta protocol."""
+
+
+class VentaDeviceType(Enum):
+    """Venta device types."""
+
+    UNKNOWN = -1
+    LP60 = 1
+    LPH60 = 2
+    LW60 = 3
+    LW60T = 4
+    LW62 = 5
+    LW62T = 6
+    AP902 = 11
+    AH902 = 12
+    AW902 = 13
+    AS100 = 100
+    LW73 = 106
+    LW74 = 107
+    LP73 = 116
+    LP74 = 117
+    AS150 = 150
+    AH5XX = 500
+
+
+class VentaApiVersion(Enum):
+    """Veta api versions."""
+
+    V0 = 0
+    V2 = 2
+    V3 = 3
+
+
+@dataclass
+class VentaApiEndpointDefinition:
+    """Venta api endpoint definition."""
+
+    method: str
+    url: str
+
+
+@dataclass
+class VentaApiDefinition:
+    """Venta api definition."""
+
+    version: VentaApiVersion
+    status: VentaApiEndpointDefinition
+    action: VentaApiEndpointDefinition | None
+    port: int = 80
+
+    @property
+    def id(self) -> str:
+        """Return the id of the definition."""
+        status_id = self.status.url
+        action_id = self.action.url if self.action else "None"
+        return f"{self.version.value}/{status_id}/{action_id}"
+
+
+V3_API_DEFINITION = VentaApiDefinition(
+    VentaApiVersion.V3,
+    VentaApiEndpointDefinition("POST", "api/telemetry"),
+    VentaApiEndpointDefinition("POST", "api/telemetry?request=set"),
+)
+V3_SENSOR_API_DEFINITION = VentaApiDefinition(
+    VentaApiVersion.V3, VentaApiEndpointDefinition("GET", "sensordata.json"), None
+)
+V2_API_DEFINITION = VentaApiDefinition(
+    VentaApiVersion.V2,
+    VentaApiEndpointDefinition("POST", "datastructure"),
+    VentaApiEndpointDefinition("POST", "datastructure"),
+)
+V0_API_DEFINITION = VentaApiDefinition(
+    VentaApiVersion.V0,
+    VentaApiEndpointDefinition("GET", "Complete"),
+    VentaApiEndpointDefinition("POST", "Action"),
+    48000,
+)
+API_DEFINITIONS: list[VentaApiDefinition] = [
+    V3_API_DEFINITION,
+    V3_SENSOR_API_DEFINITION,
+    V2_API_DEFINITION,
+    V0_API_DEFINITION,
+]
+
+# Definitions spoken by the known device types, the others need a detection
+DEVICE_TYPE_API_DEFINITIONS: dict[VentaDeviceType, VentaApiDefinition] = {
+    **dict.fromkeys(
+        (
+            VentaDeviceType.LP60,
+            VentaDeviceType.LPH60,
+            VentaDeviceType.LW60,
+            VentaDeviceType.LW60T,
+            VentaDeviceType.LW62,
+            VentaDeviceType.LW62T,
+            VentaDeviceType.AP902,
+            VentaDeviceType.AH902,
+            VentaDeviceType.AW902,
+        ),
+        V0_API_DEFINITION,
+    ),
+    **dict.fromkeys(
+        (
+            VentaDeviceType.LW73,
+            VentaDeviceType.LW74,
+            VentaDeviceType.LP73,
+            VentaDeviceType.LP74,
+        ),
+        V2_API_DEFINITION,
+    ),
+    **dict.fromkeys(
+        (VentaDeviceType.AS100, VentaDeviceType.AS150), V3_SENSOR_API_DEFINITION
+    ),
+    VentaDeviceType.AH5XX: V3_API_DEFINITION,
+}
+
+
+@dataclass
+class VentaData:
+    """Class for holding the Venta data."""
+
+    header: VentaHeader = field(default_factory=VentaHeader)
+    action: VentaAction = field(default_factory=VentaAction)
+    info: VentaInfo = field(default_factory=VentaInfo)
+    measure: VentaMeasure = field(default_factory=VentaMeasure)
+    is_empty: bool = field(default=False)
+
+
+@dataclass
+class VentaTcpHeader:
+    """Venta TCP header."""
+
+    mac: str
+    device_type: int
+
+
+def encode_json(data: dict[str, Any]) -> bytes:
+    """Serialize the JSON the way the devices expect it."""
+    # Venta devices expect no spaces in the JSON string
+    return dumps(data, separators=(",", ":")).encode()
+
+
+def decode_json(body: bytes | str) -> dict[str, Any] | None:
+    """Parse a JSON body, None when there is none or it is not valid."""
+    if not body.strip():
+        return None
+    try:
+        return loads(body)
+    except ValueError:
+        return None
+
+
+def build_message(
+    method: str,
+    url: str,
+    action: dict[str, Any] | None = None,
+    header: VentaTcpHeader | None = None,
+) -> bytes:
+    """Build the V0 message to send to the Venta device."""
+    message_header: dict[str, Any] = {
+        "Hash": V0_HASH,
+        "DeviceName": V0_DEVICE_NAME,
+    }
+    if header and header.mac and header.device_type:
+        message_header.update(
+            {
+                "DeviceType": header.device_type,
+                "MacAddress": header.mac,
+            }
+        )
+
+    body = encode_json({"Header": message_header, **(action if action else {})})
+    return f"{method} /{url}\nContent-Length: {len(body)}\n".encode() + body
+
+
+def parse_message(message: bytes) -> tuple[str, str, bytes]:
+    """Split the V0 message into the method, url and body."""
+    head, _, rest = message.partition(b"\n")
+    length_line, _, body = rest.partition(b"\n")
+    method, separator, url = head.decode(errors="replace").strip().partition(" /")
+    name, _, length = length_line.decode(errors="replace").partition(":")
+    if not separator or name.strip().lower() != "content-length":
+        raise VentaProtocolError(f"Malformed message: {message!r}")
+    try:
+        return method, url, body[: int(length or 0)]
+    except ValueError as err:
+        raise VentaProtocolError(f"Malformed content length: {length!r}") from err
+
+
+def build_http_request(
+    method: str, url: str, headers: Mapping[str, str], body: bytes = b""
+) -> bytes:
+    """Serialize the V2 or V3 request the way it goes on the wire."""
+    head = f"{method} /{url} HTTP/1.1\r\n" + "".join(
+        f"{name}: {value}\r\n" for name, value in headers.items()
+    )
+    return f"{head}\r\n".encode() + body
+
+
+@dataclass(frozen=True)
+class VentaHttpRequest:
+    """V2 or V3 request as sent, only serialized when exported."""
+
+    method: str
+    url: str
+    headers: Mapping[str, str]
+    body: bytes = b""
+
+    @property
+    def size(self) -> int:
+        """Return the number of bytes of the request, without serializing it."""
+        # "<method> /<url> HTTP/1.1\r\n", "<name>: <value>\r\n" per header, "\r\n"
+        return (
+            len(self.method)
+            + len(self.url)
+            + 13
+            + sum(len(name) + len(value) + 4 for name, value in self.headers.items())
+            + 2
+            + len(self.body)
+        )
+
+    def __bytes__(self) -> bytes:
+        """Serialize the request the way it went on the wire."""
+        return build_http_request(self.method, self.url, self.headers, self.body)
+
+
+# Raw request of an exchange, the V0 message or the parts of an HTTP request
+VentaRawRequest = bytes | VentaHttpRequest
+
+
+def parse_http_request(request: bytes) -> tuple[str, str, bytes]:
+    """Split the V2 or V3 request into the method, url and body."""
+    head, separator, body = request.partition(b"\r\n\r\n")
+    method, _, target = (
+        head.partition(b"\r\n")[0].decode(errors="replace").partition(" /")
+    )
+    url, _, version = target.rpartition(" ")
+    if not separator or not version.startswith("HTTP/"):
+        raise VentaProtocolError(f"Malformed request: {request!r}")
+    return method, url, body
+
+
+def parse_v0_response(response: bytes | str) -> dict[str, Any] | None:
+    """Parse the V0 response, the first JSON object found is used.
+
+    Returns None for an empty response and raises on a malformed one.
+    """
+    if isinstance(response, bytes):
+        response = response.decode(errors="replace")
+    if not (payload := response.strip()):
+        return None
+    try:
+        return next(extract_json(payload, object_hook=decode_object))
+    except StopIteration as err:
+        raise VentaProtocolError(f"Malformed response: {payload}") from err
+
+
+def parse_v0_frame(frame: memoryview) -> dict[str, Any] | None:
+    """Parse the V0 response received so far, None until it is complete.
+
+    The text is decoded straight from the receive buffer and only once it
+    ends like a JSON object, so the chunks of a response cost no parsing.
+    """
+    end = len(frame)
+    while end and frame[end - 1] in _WHITESPACE:
+        end -= 1
+    if not end or frame[end - 1] != ord("}"):
+        return None
+    text = str(frame[:end], "utf-8", "replace")
+    if (start := text.find("{")) == -1:
+        return None
+    try:
+        return _DECODER.raw_decode(text, start)[0]
+    except JSONDecodeError:
+        return None
+
+
+def parse_http_response(body: bytes | str) -> dict[str, Any] | None:
+    """Parse the V2 and V3 response body, None when it is empty."""
+    if not body.strip():
+        return None
+    try:
+        return _DECODER.decode(body.decode() if isinstance(body, bytes) else body)
+    except JSONDecodeError as err:
+        raise VentaProtocolError(f"Malformed response: {body!r}") from err
+
+
+def is_status(data: dict[str, Any] | None) -> bool:
+    """Return if the parsed response is a device status."""
+    return data is not None and data.get("Header") is not None
+
+
+def map_data(data: dict[str, Any] | None) -> VentaData:
+    """Map the parsed device response to data, typing sections still dicts."""
+    if data is None:
+        return VentaData(is_empty=True)
+
+    return VentaData(
+        header=VentaHeader.from_data(data.get("Header")),
+        action=VentaAction.from_data(data.get("Action")),
+        info=VentaInfo.from_data(data.get("Info")),
+        measure=VentaMeasure.from_data(data.get("Measure")),
+    )
+
+
+def device_identity(data: VentaData) -> tuple[str | None, VentaDeviceType]:
+    """Return the mac and the type of the device from its status."""
+    mac = data.header.MacAdress or data.header.DeviceId
+    try:
+        device_type = VentaDeviceType(data.header.DeviceType)
+    except ValueError:
+        device_type = VentaDeviceType.UNKNOWN
+    return mac, device_type
+
+
+def shape_action(version: VentaApiVersion, changes: dict[str, Any]) -> dict[str, Any]:
+    """Shape the changed settings into the action of the protocol version."""
+    if version == VentaApiVersion.V3:
+        return {**changes, "Action": V3_ACTION}
+    return {"Action": changes}
+
+
+def action_changes(action: dict[str, Any] | None) -> dict[str, Any]:
+    """Return the changed settings of an action of any protocol version."""
+    if not action or (changes := action.get("Action")) is None:
+        return {}
+    if isinstance(changes, dict):
+        return changes
+    return {
+        key: value for key, value in action.items() if key not in ("Header", "Action")
+    }
@@ -0,0 +1,164 @@
+"""Host name resolution shared by the Venta devices."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import socket
+from dataclasses import asdict, dataclass, field
+from ipaddress import ip_address
+from time import monotonic
+from typing import Any
+
+from aiohttp.abc import AbstractResolver
+
+from .const import DNS_CACHE_TTL, DNS_NEGATIVE_TTL, DNS_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class VentaResolverStats:
+    """Statistics of the resolver cache."""
+
+    hits: int = 0
+    misses: int = 0
+    failures: int = 0
+    fallbacks: int = 0
+
+
+@dataclass
+class _VentaResolved:
+    """Addresses of a host name, or the error of its last lookup."""
+
+    expires: float
+    addresses: list[tuple[int, str]] = field(default_factory=list)
+    error: str | None = None
+
+
+def is_ip_address(host: str) -> bool:
+    """Return if the host is an address that needs no resolution."""
+    try:
+        ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+class VentaResolver(AbstractResolver):
+    """Caching resolver for the devices configured by host name.
+
+    The addresses are cached for a while and failed lookups for a shorter
+    while, so the polls don't query the DNS or mDNS every time. When a lookup
+    times out, the last known addresses are used until the next attempt.
+    Concurrent lookups of the same name share a single query.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the empty cache."""
+        self.stats = VentaResolverStats()
+        self._cache: dict[tuple[str, int], _VentaResolved] = {}
+        self._lookups: dict[tuple[str, int], asyncio.Task[_VentaResolved]] = {}
+
+    async def resolve(
+        self, host: str, port: int = 0, family: int = socket.AF_UNSPEC
+    ) -> list[dict[str, Any]]:
+        """Return the addresses of the host in the form of the aiohttp resolvers."""
+        if is_ip_address(host):
+            addresses = [(socket.AF_INET6 if ":" in host else socket.AF_INET, host)]
+        else:
+            addresses = await self._addresses(host, family)
+        return [
+            {
+                "hostname": host,
+                "host": address,
+                "port": port,
+                "family": address_family,
+                "proto": socket.IPPROTO_TCP,
+                "flags": socket.AI_NUMERICHOST | socket.AI_NUMERICSERV,
+            }
+            for address_family, address in addresses
+        ]
+
+    async def addresses(self, host: str) -> list[str]:
+        """Return the addresses of the host, in the order to try them."""
+        if is_ip_address(host):
+            return [host]
+        return [address for _, address in await self._addresses(host, socket.AF_UNSPEC)]
+
+    async def close(self) -> None:
+        """Cancel the running lookups."""
+        for lookup in self._lookups.values():
+            lookup.cancel()
+        self._lookups.clear()
+
+    def clear(self) -> None:
+        """Forget the cached addresses."""
+        self._cache.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cache configuration and statistics."""
+        return {
+            "ttl": DNS_CACHE_TTL,
+            "negative_ttl": DNS_NEGATIVE_TTL,
+            "timeout": DNS_TIMEOUT,
+            "cached": len(self._cache),
+            **asdict(self.stats),
+        }
+
+    async def _addresses(self, host: str, family: int) -> list[tuple[int, str]]:
+        """Return the cached addresses of the host, looking them up if expired."""
+        key = (host, family)
+        resolved = self._cache.get(key)
+        if resolved is not None and resolved.expires > monotonic():
+            self.stats.hits += 1
+        else:
+            self.stats.misses += 1
+            if (lookup := self._lookups.get(key)) is None:
+                lookup = self._lookups[key] = asyncio.create_task(
+                    self._lookup(host, family, resolved)
+                )
+                lookup.add_done_callback(lambda _: self._lookups.pop(key, None))
+            # A cancelled poll must not cancel the lookup shared with the others
+            resolved = self._cache[key] = await asyncio.shield(lookup)
+        if resolved.error is not None:
+            raise OSError(resolved.error)
+        return resolved.addresses
+
+    async def _lookup(
+        self, host: str, family: int, previous: _VentaResolved | None
+    ) -> _VentaResolved:
+        """Look the host up, keeping the previous addresses on a timeout."""
+        try:
+            async with asyncio.timeout(DNS_TIMEOUT):
+                infos = await asyncio.get_running_loop().getaddrinfo(
+                    host, None, family=family, type=socket.SOCK_STREAM
+                )
+        except asyncio.TimeoutError:
+            if previous is not None and previous.addresses:
+                self.stats.fallbacks += 1
+                _LOGGER.debug(
+                    "Timeout resolving %s, using %s", host, previous.addresses
+                )
+                return _VentaResolved(
+                    monotonic() + DNS_NEGATIVE_TTL, previous.addresses
+                )
+            self.stats.failures += 1
+            return _VentaResolved(
+                monotonic() + DNS_NEGATIVE_TTL,
+                error=f"Timeout resolving {host}",
+            )
+        except OSError as err:
+            self.stats.failures += 1
+            _LOGGER.debug("Unable to resolve %s: %s", host, err)
+            return _VentaResolved(
+                monotonic() + DNS_NEGATIVE_TTL, error=f"Unable to resolve {host}: {err}"
+            )
+
+        addresses = list(
+            dict.fromkeys(
+                (address_family, address[0])
+                for address_family, _, _, _, address in infos
+            )
+        )
+        return _VentaResolved(monotonic() + DNS_CACHE_TTL, addresses)
@@ -0,0 +1,150 @@
+"""HTTP session dedicated to the Venta devices."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from time import monotonic
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import (
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionQueuedEndParams,
+    TraceConnectionQueuedStartParams,
+    TraceConnectionReuseconnParams,
+    TraceRequestHeadersSentParams,
+)
+
+from .const import (
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_LIMIT_PER_HOST,
+)
+from .venta_resolver import VentaResolver
+
+
+@dataclass
+class VentaSessionStats:
+    """Connection pool statistics of the session."""
+
+    connections_created: int = 0
+    connections_reused: int = 0
+    queued: int = 0
+    queued_s: float = 0.0
+
+    def trace_config(self) -> TraceConfig:
+        """Return the trace config counting into the statistics.
+
+        A namespace passed as trace_request_ctx of a request gets its reused
+        attribute set to whether the request went on a pooled connection, and
+        its headers attribute set to the headers sent.
+        """
+        trace_config = TraceConfig()
+
+        async def _created(
+            _: ClientSession,
+            context: SimpleNamespace,
+            __: TraceConnectionCreateEndParams,
+        ) -> None:
+            self.connections_created += 1
+            if context.trace_request_ctx is not None:
+                context.trace_request_ctx.reused = False
+
+        async def _reused(
+            _: ClientSession,
+            context: SimpleNamespace,
+            __: TraceConnectionReuseconnParams,
+        ) -> None:
+            self.connections_reused += 1
+            if context.trace_request_ctx is not None:
+                context.trace_request_ctx.reused = True
+
+        async def _headers_sent(
+            _: ClientSession,
+            context: SimpleNamespace,
+            params: TraceRequestHeadersSentParams,
+        ) -> None:
+            if context.trace_request_ctx is not None:
+                context.trace_request_ctx.headers = params.headers
+
+        async def _queued_start(
+            _: ClientSession,
+            context: SimpleNamespace,
+            __: TraceConnectionQueuedStartParams,
+        ) -> None:
+            self.queued += 1
+            context.queued_at = monotonic()
+
+        async def _queued_end(
+            _: ClientSession,
+            context: SimpleNamespace,
+            __: TraceConnectionQueuedEndParams,
+        ) -> None:
+            self.queued_s += monotonic() - context.queued_at
+
+        trace_config.on_connection_create_end.append(_created)
+        trace_config.on_connection_reuseconn.append(_reused)
+        trace_config.on_request_headers_sent.append(_headers_sent)
+        trace_config.on_connection_queued_start.append(_queued_start)
+        trace_config.on_connection_queued_end.append(_queued_end)
+        return trace_config
+
+
+class VentaSession:
+    """Lazily created HTTP session with a connector tuned for the devices.
+
+    Every device gets a single keep-alive connection, so the requests to the
+    same device are serialized instead of opening parallel connections. The
+    host names are resolved by a resolver shared with the TCP strategies.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the session holder."""
+        self.stats = VentaSessionStats()
+        self.resolver = VentaResolver()
+        self._session: ClientSession | None = None
+
+    @property
+    def session(self) -> ClientSession:
+        """Return the session, creating it on the first use."""
+        if self._session is None or self._session.closed:
+            self._session = ClientSession(
+                connector=TCPConnector(
+                    limit=0,
+                    limit_per_host=HTTP_LIMIT_PER_HOST,
+                    keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+                    use_dns_cache=False,
+                    resolver=self.resolver,
+                ),
+                # The reads are bounded by the request timeout of each device
+                timeout=ClientTimeout(total=None, sock_connect=HTTP_CONNECT_TIMEOUT),
+                trace_configs=[self.stats.trace_config()],
+            )
+        return self._session
+
+    @property
+    def closed(self) -> bool:
+        """Return if there is no open session."""
+        return self._session is None or self._session.closed
+
+    async def close(self) -> None:
+        """Close the session and its pooled connections."""
+        await self.resolver.close()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the pool configuration and statistics."""
+        return {
+            "open": not self.closed,
+            "limit_per_host": HTTP_LIMIT_PER_HOST,
+            "keepalive_timeout": HTTP_KEEPALIVE_TIMEOUT,
+            "connect_timeout": HTTP_CONNECT_TIMEOUT,
+            **asdict(self.stats),
+            "resolver": self.resolver.as_dict(),
+        }
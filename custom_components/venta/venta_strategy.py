@@ -3,18 +3,96 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+import socket
+import struct
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass
-from json import JSONDecodeError, dumps
-from typing import Any
+from functools import wraps
+from json import dumps
+from time import monotonic, time
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import ClientResponse, ClientSession, ServerDisconnectedError, hdrs
+from aiohttp.http import HttpVersion11
+
+from .const import (
+    KEEP_ALIVE_PROBES,
+    TCP_CLOSE_TIMEOUT,
+    TCP_KEEPALIVE_COUNT,
+    TCP_KEEPALIVE_IDLE,
+    TCP_KEEPALIVE_INTERVAL,
+)
+from .venta_metrics import VentaMetrics
+from .venta_protocol import (
+    VentaHttpRequest,
+    VentaProtocolError,
+    VentaRawRequest,
+    VentaTcpHeader,
+    build_message,
+    parse_http_response,
+    parse_v0_frame,
+    parse_v0_response,
+)
+from .venta_resolver import VentaResolver
+from .venta_session import VentaSession
+
+if TYPE_CHECKING:
+    from .venta_capture import VentaCapture
 
-from aiohttp import ClientSession
+_LOGGER = logging.getLogger(__name__)
 
-from .json import extract_json
-from .utils import retry_on_timeout
+# Runs a synchronous section of an exchange, given with its arguments, and
+# returns its result, e.g. under a profiler
+VentaProfileHook = Callable[..., Any]
 
-_LOGGER = logging.getLogger(__name__)
+
+def _parse(profile: VentaProfileHook | None, parse: Callable, data: Any) -> Any:  # noqa: ANN401
+    """Parse the data, under the profile hook if any."""
+    if profile is None:
+        return parse(data)
+    return profile(parse, data)
+
+
+def retry_on_timeout(retries: int = 5, timeout: int = 10, delay: int = 0.5) -> Callable:
+    """Retry a function on timeout and with a delay.
+
+    The timeout can be overridden by the request_timeout attribute of the instance,
+    the retries and timeouts are counted in its metrics attribute if present.
+    """
+
+    def decorator(fun: Callable) -> Callable:
+        @wraps(fun)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            request_timeout = (
+                getattr(args[0], "request_timeout", None) if args else None
+            ) or timeout
+            metrics = getattr(args[0], "metrics", None) if args else None
+            for attempt in range(retries):
+                if attempt and metrics is not None:
+                    metrics.retries += 1
+                try:
+                    async with asyncio.timeout(request_timeout):
+                        return await fun(*args, **kwargs)
+                except asyncio.TimeoutError:
+                    if metrics is not None:
+                        metrics.timeouts += 1
+                    _LOGGER.warning(
+                        "Timeout calling %s, retrying... (attempt %d/%d)",
+                        fun.__name__,
+                        attempt + 1,
+                        retries,
+                    )
+                    await asyncio.sleep(delay)
+            _LOGGER.error("Retries exhausted calling %s, giving up...", fun.__name__)
+            return None
+
+        return wrapper
+
+    return decorator
 
 
 @dataclass
@@ -25,9 +103,87 @@ class VentaApiHostDefinition:
     port: int
 
 
+@dataclass
+class VentaKeepAlive:
+    """Connection reuse observed on a device.
+
+    Supported stays unknown until a few requests succeeded on a reused
+    connection, a single dropped connection settles it as unsupported.
+    """
+
+    supported: bool | None = None
+    reused: int = 0
+    dropped: int = 0
+
+    def record(self, reused: bool) -> None:
+        """Record if the connection of the last request could be reused."""
+        if self.supported is not None:
+            return
+        if reused:
+            self.reused += 1
+        else:
+            self.dropped += 1
+        if self.dropped:
+            self.supported = False
+        elif self.reused >= KEEP_ALIVE_PROBES:
+            self.supported = True
+        if self.supported is not None:
+            _LOGGER.debug("Keep-alive supported: %s", self.supported)
+
+    def record_stalled(self) -> None:
+        """Give the keep-alive up after a request stalled on a reused connection."""
+        self.dropped += 1
+        if self.supported is not False:
+            self.supported = False
+            _LOGGER.debug("Keep-alive supported: False, a kept connection stalled")
+
+
+@dataclass
+class VentaSocketOptions:
+    """Options of the sockets of the TCP strategy.
+
+    The keep-alive probes are only enabled on the connections that may be
+    kept. The connections are closed with the closing handshake, except after
+    a failed exchange. With abortive_close, a connection still open on the
+    device side is always reset, so it doesn't wait in TIME_WAIT for minutes,
+    holding an ephemeral port.
+    """
+
+    nodelay: bool = True
+    keepalive_idle: int | None = TCP_KEEPALIVE_IDLE  # None disables the probes
+    keepalive_interval: int = TCP_KEEPALIVE_INTERVAL
+    keepalive_count: int = TCP_KEEPALIVE_COUNT
+    close_timeout: float = TCP_CLOSE_TIMEOUT
+    abortive_close: bool = False
+
+    def apply(self, sock: socket.socket, kept: bool) -> None:
+        """Set the options on the connected socket."""
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, self.nodelay)
+        if not kept or self.keepalive_idle is None:
+            return
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        for option, value in (
+            # TCP_KEEPIDLE is named TCP_KEEPALIVE on macOS
+            (
+                getattr(socket, "TCP_KEEPIDLE", getattr(socket, "TCP_KEEPALIVE", None)),
+                self.keepalive_idle,
+            ),
+            (getattr(socket, "TCP_KEEPINTVL", None), self.keepalive_interval),
+            (getattr(socket, "TCP_KEEPCNT", None), self.keepalive_count),
+        ):
+            if option is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, option, value)
+
+
 class VentaProtocolStrategy(ABC):
     """Abstract class for Venta API strategy."""
 
+    request_timeout: int | None = None
+    metrics: VentaMetrics | None = None
+    capture: VentaCapture | None = None
+    keep_alive: VentaKeepAlive | None = None
+    profile: VentaProfileHook | None = None
+
     @abstractmethod
     async def get_status(self, method: str, url: str) -> dict[str, Any] | None:
         """Request status of the Venta device using proper protocol."""
@@ -38,19 +194,71 @@ class VentaProtocolStrategy(ABC):
     ) -> dict[str, Any] | None:
         """Send action to the Venta device using proper protocol."""
 
+    async def close(self) -> None:
+        """Release the resources owned by the strategy."""
+
+    async def __aenter__(self) -> VentaProtocolStrategy:
+        """Use the strategy in the context."""
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        """Close the strategy when leaving the context."""
+        await self.close()
+
+    def _record_reuse(self, reused: bool) -> None:
+        """Pass the observed connection reuse to the keep-alive."""
+        if self.keep_alive is not None:
+            self.keep_alive.record(reused)
+
+    def _record_exchange(
+        self,
+        started: float,
+        duration: float,
+        request: VentaRawRequest,
+        response: bytes,
+    ) -> None:
+        """Pass the raw exchange to the metrics and the capture."""
+        if self.metrics is not None:
+            self.metrics.record_exchange(started, duration, request, response)
+            self.metrics.bytes_in += len(response)
+        if self.capture is not None:
+            self.capture.record(started, duration, request, response)
+
 
 class VentaHttpStrategy(VentaProtocolStrategy):
-    """Venta HTTP strategy."""
+    """Venta HTTP strategy.
+
+    The session can be a client session or a Venta session owned by the
+    caller. Without one the strategy creates its own Venta session on the
+    first request and closes it in close(). Devices without keep-alive get
+    requests asking to close the connection instead of pooling it.
+    """
 
     def __init__(
         self,
         host_definition: VentaApiHostDefinition,
-        session: ClientSession | None = None,
+        session: ClientSession | VentaSession | None = None,
+        request_timeout: int | None = None,
     ) -> None:
         """Venta HTTP strategy constructor."""
         self._host_definition = host_definition
+        self.request_timeout = request_timeout
         self._url = f"http://{host_definition.host}:{host_definition.port}"
-        self._session = session
+        self._owns_session = session is None
+        self._session = VentaSession() if session is None else session
+        self._kept = False
+
+    @property
+    def session(self) -> ClientSession:
+        """Return the client session used for the requests."""
+        if isinstance(self._session, VentaSession):
+            return self._session.session
+        return self._session
+
+    async def close(self) -> None:
+        """Close the own session, a session passed in is left open."""
+        if self._owns_session:
+            await self._session.close()
 
     async def get_status(self, method: str, url: str) -> dict[str, Any] | None:
         """Request status of the Venta device using HTTP protocol."""
@@ -67,47 +275,185 @@ class VentaHttpStrategy(VentaProtocolStrategy):
         self, method: str, url: str, json_action: dict[str, Any] | None = None
     ) -> dict[str, Any] | None:
         """Send request to Venta device using HTTP protocol."""
+        try:
+            return await self._request(method, url, json_action)
+        except ServerDisconnectedError:
+            if not self._kept:
+                raise
+            # The device dropped the kept connection, send again on a new one
+            _LOGGER.debug("Kept connection to %s was dropped", self._url)
+            self._record_reuse(False)
+            self._kept = False
+            return await self._request(method, url, json_action)
+
+    def _record_connection(self, resp: ClientResponse, reused: bool | None) -> None:
+        """Record if the request reused the kept connection and if it is kept.
+
+        Whether the connection was reused is only known with a Venta session.
+        """
+        if self._kept and reused is not None:
+            self._record_reuse(reused)
+        self._kept = (
+            resp.version >= HttpVersion11
+            and resp.headers.get(hdrs.CONNECTION, "").lower() != "close"
+        )
+        if not self._kept:
+            self._record_reuse(False)
 
-        async def _send() -> dict[str, Any]:
-            """Make the http request."""
-            _LOGGER.debug("Sending request to %s with data: %s", url, str(json_action))
-            async with self._session.request(
-                method, f"{self._url}/{url}", json=json_action
-            ) as resp:
-                json = await resp.json(content_type=None)
-                _LOGGER.debug(
-                    "Received response from %s: %s",
-                    url,
-                    str(json),
-                )
-                return json
-
-        if self._session and not self._session.closed:
-            return await _send()
-        async with ClientSession() as self._session:
-            return await _send()
-
-
-@dataclass
-class VentaTcpHeader:
-    """Venta TCP header."""
+    async def _request(
+        self, method: str, url: str, json_action: dict[str, Any] | None = None
+    ) -> dict[str, Any] | None:
+        """Make a single HTTP request.
+
+        The raw request is recorded with the headers sent, which are only
+        known with a Venta session.
+        """
+        _LOGGER.debug("Sending request to %s with data: %s", url, json_action)
+        pooled = self.keep_alive is None or self.keep_alive.supported is not False
+        headers = {} if pooled else {hdrs.CONNECTION: "close"}
+        body = b""
+        if json_action is not None:
+            # Serialized like the json argument of aiohttp, to count its bytes
+            body = dumps(json_action).encode()
+            headers[hdrs.CONTENT_TYPE] = "application/json"
+        trace = SimpleNamespace(reused=None, headers={})
+        started, start = time(), monotonic()
+        async with self.session.request(
+            method,
+            f"{self._url}/{url}",
+            data=body or None,
+            headers=headers,
+            trace_request_ctx=trace,
+        ) as resp:
+            if pooled:
+                self._record_connection(resp, trace.reused)
+            response = await resp.read()
+            request = VentaHttpRequest(method, url, trace.headers, body)
+            if self.metrics is not None:
+                self.metrics.bytes_out += request.size
+            self._record_exchange(started, monotonic() - start, request, response)
+            json = _parse(self.profile, parse_http_response, response)
+            _LOGGER.debug("Received response from %s: %s", url, json)
+            return json
+
+
+class VentaTcpProtocol(asyncio.BufferedProtocol):
+    """Connection to a V0 device receiving into a preallocated buffer.
+
+    The data is received in place, the buffer is only replaced by a larger
+    one when a response doesn't fit. The pending request is resolved as soon
+    as the buffer holds a complete JSON object, or when the device closes.
+    """
 
-    mac: str
-    device_type: int
+    def __init__(
+        self, buffer: bytearray, profile: VentaProfileHook | None = None
+    ) -> None:
+        """Initialize the protocol receiving into the buffer."""
+        self.buffer = buffer
+        self.profile = profile
+        self.transport: asyncio.Transport | None = None
+        self.at_eof = False
+        self._length = 0
+        self._response: asyncio.Future[dict[str, Any] | None] | None = None
+        self._closed = asyncio.get_running_loop().create_future()
+
+    @property
+    def response(self) -> memoryview:
+        """Return the bytes received since the last request."""
+        return memoryview(self.buffer)[: self._length]
+
+    async def request(self, message: bytes) -> dict[str, Any] | None:
+        """Send the message and return the response, None if closed."""
+        self._length = 0
+        if self.transport is None or self.transport.is_closing():
+            return None
+        self._response = asyncio.get_running_loop().create_future()
+        self.transport.write(message)
+        try:
+            return await self._response
+        finally:
+            self._response = None
+
+    async def wait_closed(self) -> None:
+        """Wait until the connection is lost."""
+        await asyncio.shield(self._closed)
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Keep the transport of the connection."""
+        self.transport = transport
+
+    def get_buffer(self, _: int) -> memoryview:
+        """Return the free part of the buffer, doubling it when full."""
+        if self._length == len(self.buffer):
+            # Replaced rather than resized, a view of the buffer may be alive
+            self.buffer = self.buffer + bytes(len(self.buffer))
+        return memoryview(self.buffer)[self._length :]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        """Resolve the request once the response is complete."""
+        self._length += nbytes
+        if self._response is not None and not self._response.done():
+            if (
+                data := _parse(self.profile, parse_v0_frame, self.response)
+            ) is not None:
+                self._response.set_result(data)
+
+    def eof_received(self) -> None:
+        """Resolve the request with what the device sent before closing."""
+        self.at_eof = True
+        self._resolve()
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Resolve the request and the closing of the connection."""
+        self.at_eof = True
+        if exc is not None and self._response is not None:
+            if not self._response.done():
+                self._response.set_exception(exc)
+        self._resolve()
+        if not self._closed.done():
+            self._closed.set_result(None)
+
+    def _resolve(self) -> None:
+        """Resolve the pending request with a response cut by the device."""
+        if self._response is None or self._response.done():
+            return
+        try:
+            self._response.set_result(
+                _parse(self.profile, parse_v0_response, bytes(self.response))
+            )
+        except VentaProtocolError as err:
+            self._response.set_exception(err)
 
 
 class VentaTcpStrategy(VentaProtocolStrategy):
-    """Venta raw TCP strategy."""
+    """Venta raw TCP strategy.
+
+    The responses are received by a VentaTcpProtocol into a buffer reused by
+    the connections of the strategy. Once the keep-alive is not known to be
+    unsupported, a connection left open by the device is kept for the next
+    request. A host name is resolved through the resolver, if any, before
+    connecting. The closing of a connection is bounded by the close timeout
+    of the options.
+    """
 
     _header: VentaTcpHeader | None = None
 
     def __init__(
         self,
         host_definition: VentaApiHostDefinition,
-        buffer_size: int = 2**16,
+        buffer_size: int = 2**12,
+        request_timeout: int | None = None,
+        resolver: VentaResolver | None = None,
+        socket_options: VentaSocketOptions | None = None,
     ) -> None:
         """Venta TCP strategy constructor."""
         self._host_definition = host_definition
+        self.request_timeout = request_timeout
+        self._resolver = resolver
+        self.socket_options = socket_options or VentaSocketOptions()
+        self._connection: VentaTcpProtocol | None = None
+        # Free receive buffers, one is enough unless requests run concurrently
+        self._buffers = [bytearray(buffer_size)]
         self._buffer_size = buffer_size
 
     def set_header(self, header: VentaTcpHeader) -> None:
@@ -126,107 +472,165 @@ class VentaTcpStrategy(VentaProtocolStrategy):
         message = self._build_message(method, url, json)
         return await self._send_request(message)
 
+    async def close(self) -> None:
+        """Close the kept connection."""
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            await self._close(connection)
+
     def _build_message(
         self, method: str, url: str, action: dict[str, Any] | None = None
-    ) -> str:
+    ) -> bytes:
         """Build the message to send to the Venta device."""
-        header = {
-            "Hash": "-42",
-            "DeviceName": "HomeAssistant",
-        }
-
-        if self._header and self._header.mac and self._header.device_type:
-            header.update(
-                {
-                    "DeviceType": self._header.device_type,
-                    "MacAddress": self._header.mac,
-                }
-            )
-
-        body = dumps(
-            {
-                "Header": header,
-                **(action if action else {}),
-            },
-            # Venta devices expect no spaces in the JSON string
-            separators=(",", ":"),
-        )
-        return f"{method} /{url}\nContent-Length: {len(body)}\n{body}"
+        return build_message(method, url, action, self._header)
 
     @retry_on_timeout()
-    async def _send_request(self, message: str) -> dict[str, Any] | None:
+    async def _send_request(self, message: bytes) -> dict[str, Any] | None:
         """Request data from the Venta device using TCP protocol."""
-        writer = None
+        host, port = self._host_definition.host, self._host_definition.port
+        # Taken out, so a concurrent request opens its own connection
+        connection, self._connection = self._connection, None
+        started, start = time(), monotonic()
+        failed = True
 
         try:
-            reader, writer = await asyncio.open_connection(
-                self._host_definition.host, self._host_definition.port
+            data = None
+            if connection is not None:
+                data = await self._exchange_kept(connection, message)
+                if not connection.response:
+                    _LOGGER.debug("Kept connection to %s was dropped", host)
+                    await self._close(connection)
+                    connection = None
+            if connection is None:
+                connection = await self._open_connection(host, port)
+                data = await self._exchange(connection, message)
+
+            response = bytes(connection.response)
+            self._record_exchange(started, monotonic() - start, message, response)
+            _LOGGER.debug(
+                "Receive payload from %s on port %s: %s", host, port, response
             )
+            if self.keep_alive is not None and self.keep_alive.supported is not False:
+                if connection.at_eof:
+                    self._record_reuse(False)
+                elif self._connection is None:
+                    connection, self._connection = None, connection
 
-            try:
-                writer.write(message.encode())
-                await writer.drain()
-            except OSError as err:
-                _LOGGER.error(
-                    "Unable to send payload %r to %s on port %s: %s",
-                    message,
-                    self._host_definition.host,
-                    self._host_definition.port,
-                    err,
-                )
-                return
-
-            try:
-                payload = (await reader.read()).decode().strip()
+            if data is None:
                 _LOGGER.debug(
-                    "Receive payload from %s on port %s: %s",
-                    self._host_definition.host,
-                    self._host_definition.port,
-                    payload,
-                )
-
-                if not payload:
-                    _LOGGER.debug(
-                        "Empty response from %s on port %s: %s",
-                        self._host_definition.host,
-                        self._host_definition.port,
-                        payload,
-                    )
-                    return
-
-                try:
-                    return next(extract_json(payload))
-                except StopIteration:
-                    _LOGGER.error(
-                        "Malformed response from %s on port %s: %s",
-                        self._host_definition.host,
-                        self._host_definition.port,
-                        payload,
-                    )
-
-            except OSError as err:
-                _LOGGER.error(
-                    "Unable to receive payload from %s on port %s: %s",
-                    self._host_definition.host,
-                    self._host_definition.port,
-                    err,
-                )
-            except (JSONDecodeError, TypeError) as err:
-                _LOGGER.error(
-                    "Unable to parse payload from %s on port %s: %s",
-                    self._host_definition.host,
-                    self._host_definition.port,
-                    err,
+                    "Empty response from %s on port %s: %s", host, port, response
                 )
+            failed = False
+            return data
 
+        except VentaProtocolError as err:
+            _LOGGER.error(
+                "Unable to parse payload from %s on port %s: %s", host, port, err
+            )
         except OSError as err:
             _LOGGER.error(
-                "Socket error while connection to %s on port %s: %s",
-                self._host_definition.host,
-                self._host_definition.port,
+                "Socket error while exchanging %r with %s on port %s: %s",
+                message,
+                host,
+                port,
                 err,
             )
         finally:
-            if writer is not None:
-                writer.close()
-                await writer.wait_closed()
+            if connection is not None:
+                # Also reached on a timeout, the connection is not waited for
+                await self._close(connection, abort=failed)
+
+    async def _exchange_kept(
+        self, connection: VentaTcpProtocol, message: bytes
+    ) -> dict[str, Any] | None:
+        """Exchange the message on the kept connection, recording its reuse."""
+        # The profile hook may have changed since the connection was opened
+        connection.profile = self.profile
+        data = None
+        try:
+            with contextlib.suppress(OSError):
+                data = await self._exchange(connection, message)
+        except asyncio.CancelledError:
+            # Timed out by the retries, the next requests open a connection
+            if self.keep_alive is not None:
+                self.keep_alive.record_stalled()
+            raise
+        self._record_reuse(bool(connection.response))
+        return data
+
+    async def _open_connection(self, host: str, port: int) -> VentaTcpProtocol:
+        """Open a connection to the first reachable address of the host."""
+        addresses = [host]
+        if self._resolver is not None:
+            addresses = await self._resolver.addresses(host)
+        loop = asyncio.get_running_loop()
+        buffer = self._buffers.pop() if self._buffers else bytearray(self._buffer_size)
+        try:
+            for address in addresses[:-1]:
+                with contextlib.suppress(OSError):
+                    _, connection = await loop.create_connection(
+                        lambda: VentaTcpProtocol(buffer, self.profile), address, port
+                    )
+                    break
+            else:
+                _, connection = await loop.create_connection(
+                    lambda: VentaTcpProtocol(buffer, self.profile), addresses[-1], port
+                )
+        except BaseException:
+            self._buffers.append(buffer)
+            raise
+
+        if self.metrics is not None:
+            self.metrics.sockets_opened += 1
+            self.metrics.sockets_open += 1
+        try:
+            self.socket_options.apply(
+                connection.transport.get_extra_info("socket"),
+                self.keep_alive is not None and self.keep_alive.supported is not False,
+            )
+        except OSError:
+            await self._close(connection)
+            raise
+        return connection
+
+    async def _exchange(
+        self, connection: VentaTcpProtocol, message: bytes
+    ) -> dict[str, Any] | None:
+        """Send the message and return the parsed response."""
+        if self.metrics is not None:
+            self.metrics.bytes_out += len(message)
+        return await connection.request(message)
+
+    async def _close(self, connection: VentaTcpProtocol, abort: bool = False) -> None:
+        """Close the connection, resetting it when aborted and still open.
+
+        The device may already have reset it. A close not done within the
+        close timeout is aborted, so a device never acknowledging it can't
+        stall the request. The buffer goes back to the free ones.
+        """
+        start = monotonic()
+        options = self.socket_options
+        if (abort or options.abortive_close) and not connection.at_eof:
+            self._reset(connection.transport)
+        else:
+            connection.transport.close()
+            try:
+                async with asyncio.timeout(options.close_timeout):
+                    await connection.wait_closed()
+            except asyncio.TimeoutError:
+                self._reset(connection.transport)
+        self._buffers.append(connection.buffer)
+        if self.metrics is not None:
+            self.metrics.sockets_open -= 1
+            self.metrics.linger.record(monotonic() - start)
+
+    def _reset(self, transport: asyncio.Transport) -> None:
+        """Abort the connection with a reset instead of the closing handshake."""
+        if (sock := transport.get_extra_info("socket")) is not None:
+            with contextlib.suppress(OSError):
+                sock.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+                )
+        transport.abort()
+        if self.metrics is not None:
+            self.metrics.sockets_reset += 1
@@ -0,0 +1,12 @@
+"""Local simulator of Venta devices for all protocol versions."""
+
+from .device import DEVICE_TYPES, VirtualDevice, api_version
+from .server import FaultProfile, VentaSimulator
+
+__all__ = [
+    "DEVICE_TYPES",
+    "FaultProfile",
+    "VentaSimulator",
+    "VirtualDevice",
+    "api_version",
+]
@@ -0,0 +1,90 @@
+"""Run the Venta devices simulator from the command line."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+
+from .device import DEVICE_TYPES
+from .server import HTTP_PORT, TCP_PORT, FaultProfile, VentaSimulator
+
+
+def _parse_args() -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m simulator", description="Simulate many Venta devices."
+    )
+    parser.add_argument("-n", "--devices", type=int, default=len(DEVICE_TYPES))
+    parser.add_argument(
+        "-t",
+        "--types",
+        type=int,
+        nargs="+",
+        default=list(DEVICE_TYPES),
+        choices=DEVICE_TYPES,
+        help="device types to spread the virtual devices over",
+    )
+    parser.add_argument("--network", default="127.1.0.0/16")
+    parser.add_argument(
+        "--bind", help="single bind address for all devices, e.g. 0.0.0.0"
+    )
+    parser.add_argument("--http-port", type=int, default=HTTP_PORT)
+    parser.add_argument("--tcp-port", type=int, default=TCP_PORT)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--hang-rate", type=float, default=0.0)
+    parser.add_argument("--truncate-rate", type=float, default=0.0)
+    parser.add_argument("--garbage-rate", type=float, default=0.0)
+    parser.add_argument("--no-keep-alive", action="store_true")
+    parser.add_argument("--hosts-file", type=Path, help="write the device hosts")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    return parser.parse_args()
+
+
+async def _run(args: argparse.Namespace) -> None:
+    """Run the simulator until cancelled."""
+    simulator = VentaSimulator.create(
+        args.devices,
+        tuple(args.types),
+        FaultProfile(
+            latency=args.latency,
+            jitter=args.jitter,
+            failure_rate=args.failure_rate,
+            hang_rate=args.hang_rate,
+            truncate_rate=args.truncate_rate,
+            garbage_rate=args.garbage_rate,
+            keep_alive=not args.no_keep_alive,
+        ),
+        network=args.network,
+        http_port=args.http_port,
+        tcp_port=args.tcp_port,
+        bind=args.bind,
+    )
+    async with simulator:
+        lines = [
+            f"{device.host}\t{device.device_type}\tv{device.api_version}\t{device.mac}"
+            for device in simulator.devices.values()
+        ]
+        if args.hosts_file:
+            args.hosts_file.write_text("\n".join(lines) + "\n")
+        else:
+            print("\n".join(lines))
+        logging.info("Serving %d virtual devices", len(lines))
+        await asyncio.Event().wait()
+
+
+def main() -> None:
+    """Run the simulator."""
+    args = _parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+    try:
+        asyncio.run(_run(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
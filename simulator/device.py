@@ -0,0 +1,126 @@
+"""Virtual Venta devices generated from the resources definitions."""
+
+from __future__ import annotations
+
+import json
+import random
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from custom_components.venta.venta_protocol import action_changes
+
+RESOURCES_PATH = Path(__file__).parent.parent / "resources"
+
+V0_DEVICE_TYPES: tuple[int, ...] = (1, 2, 3, 4, 5, 6, 11, 12, 13)
+V2_DEVICE_TYPES: tuple[int, ...] = (106, 107, 116, 117)
+V3_DEVICE_TYPES: tuple[int, ...] = (100, 150, 500)
+DEVICE_TYPES: tuple[int, ...] = V0_DEVICE_TYPES + V2_DEVICE_TYPES + V3_DEVICE_TYPES
+
+SECTIONS: tuple[str, ...] = ("Header", "Action", "Info", "Measure")
+DRIFTING_FIELDS: frozenset[str] = frozenset(
+    {"Temperature", "Humidity", "Dust", "FanRpm", "Voc", "Co2", "Hcho", "Toluene"}
+)
+
+
+def api_version(device_type: int) -> int:
+    """Return the protocol version spoken by the device type."""
+    if device_type in V0_DEVICE_TYPES:
+        return 0
+    if device_type in V2_DEVICE_TYPES:
+        return 2
+    return 3
+
+
+@cache
+def load_definitions(device_type: int) -> dict[str, list[dict[str, Any]]]:
+    """Load the parameters and settings definitions of the device type."""
+    definitions: dict[str, list[dict[str, Any]]] = {}
+    for kind in ("parameters", "settings"):
+        path = RESOURCES_PATH / kind / f"{device_type:03}.json"
+        if path.exists():
+            definitions.update(json.loads(path.read_text()))
+    return definitions
+
+
+def _initial_value(definition: dict[str, Any], rng: random.Random) -> Any:  # noqa: ANN401
+    """Generate the initial value of a single field."""
+    if "default" in definition:
+        return definition["default"]
+    if values := definition.get("values"):
+        if (value := values[0].get("value")) is not None:
+            return value
+
+    kind = definition.get("type")
+    minimum = definition.get("minimum", 0)
+    maximum = definition.get("maximum", 100)
+    if kind in ("integer", "long"):
+        return rng.randint(int(minimum), int(min(maximum, minimum + 1000)))
+    if kind == "BigDecimal":
+        return round(rng.uniform(max(minimum, 15), min(maximum, 60)), 2)
+    return {"boolean": False, "array": [0, 0, 0, 0]}.get(kind, "")
+
+
+@dataclass
+class VirtualDevice:
+    """State of a single virtual Venta device."""
+
+    device_type: int
+    host: str
+    mac: str
+    state: dict[str, dict[str, Any]] = field(default_factory=dict)
+    requests: int = 0
+    actions: int = 0
+
+    @property
+    def api_version(self) -> int:
+        """Return the protocol version of the device."""
+        return api_version(self.device_type)
+
+    @classmethod
+    def create(
+        cls, device_type: int, host: str, index: int, seed: int | None = None
+    ) -> VirtualDevice:
+        """Create a virtual device with the state based on the resources."""
+        rng = random.Random(seed if seed is not None else index)
+        mac = ":".join(f"{byte:02x}" for byte in (0x02, 0x56, *index.to_bytes(4)))
+        state: dict[str, dict[str, Any]] = {}
+        for section in SECTIONS:
+            state[section] = {
+                definition["name"]: _initial_value(definition, rng)
+                for definition in load_definitions(device_type).get(section, [])
+            }
+
+        header = state["Header"]
+        header["DeviceType"] = device_type
+        if "DeviceId" in header:
+            header["DeviceId"] = mac
+        else:
+            header["MacAdress"] = mac
+        if "Action" in state:
+            state["Action"]["Power"] = True
+        if "Info" in state and "Warnings" in state["Info"]:
+            state["Info"]["Warnings"] = 0
+        return cls(device_type, host, mac, state)
+
+    def status(self) -> dict[str, Any]:
+        """Return the current status and move the measurements a bit."""
+        self.requests += 1
+        measure = self.state.get("Measure", {})
+        for name, value in measure.items():
+            if name in DRIFTING_FIELDS and isinstance(value, int | float):
+                delta = random.uniform(-0.5, 0.5)
+                measure[name] = (
+                    round(value + delta, 2)
+                    if isinstance(value, float)
+                    else max(0, value + round(delta))
+                )
+        return {section: values for section, values in self.state.items() if values}
+
+    def apply(self, body: dict[str, Any] | None) -> dict[str, Any]:
+        """Apply the action from the request body and return the status."""
+        if changes := action_changes(body):
+            self.actions += 1
+            self.state.setdefault("Action", {}).update(changes)
+        return self.status()
@@ -0,0 +1,289 @@
+"""Asyncio servers speaking the Venta protocols for many virtual devices."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import ipaddress
+import logging
+import random
+from dataclasses import dataclass
+
+from custom_components.venta.venta_protocol import (
+    decode_json,
+    encode_json,
+    parse_message,
+)
+
+from .device import DEVICE_TYPES, V2_DEVICE_TYPES, VirtualDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+HTTP_PORT = 80
+TCP_PORT = 48000
+
+V2_URLS: frozenset[str] = frozenset({"datastructure"})
+V3_URLS: frozenset[str] = frozenset({"api/telemetry", "api/telemetry?request=set"})
+V3_SENSOR_URLS: frozenset[str] = frozenset({"sensordata.json"})
+V3_SENSOR_DEVICE_TYPES: tuple[int, ...] = (100, 150)
+GARBAGE = b"\x00\xff garbage \x1b[0m"
+
+
+@dataclass
+class FaultProfile:
+    """Latency and failure behaviour of the virtual devices."""
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    failure_rate: float = 0.0
+    hang_rate: float = 0.0
+    truncate_rate: float = 0.0
+    garbage_rate: float = 0.0
+    keep_alive: bool = True
+
+    async def delay(self) -> None:
+        """Sleep for the configured latency with jitter."""
+        delay = self.latency + random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def fails(self) -> bool:
+        """Return if the current exchange should fail."""
+        return self.failure_rate > 0 and random.random() < self.failure_rate
+
+    def hangs(self) -> bool:
+        """Return if the current exchange should never be answered."""
+        return self.hang_rate > 0 and random.random() < self.hang_rate
+
+    def truncates(self) -> bool:
+        """Return if the current response should be cut short by a close."""
+        return self.truncate_rate > 0 and random.random() < self.truncate_rate
+
+    def garbles(self) -> bool:
+        """Return if the current response should start with garbage."""
+        return self.garbage_rate > 0 and random.random() < self.garbage_rate
+
+
+class VentaSimulator:
+    """Serve many virtual Venta devices from a single process.
+
+    Every device gets its own loopback address. Without a bind address a
+    listener is opened per device, otherwise one listener per protocol is
+    opened on the bind address and requests are routed by the local address.
+    """
+
+    def __init__(
+        self,
+        devices: list[VirtualDevice],
+        faults: FaultProfile | None = None,
+        *,
+        http_port: int = HTTP_PORT,
+        tcp_port: int = TCP_PORT,
+        bind: str | None = None,
+    ) -> None:
+        """Virtual devices simulator constructor."""
+        self.devices = {device.host: device for device in devices}
+        self.faults = faults or FaultProfile()
+        self.http_port = http_port
+        self.tcp_port = tcp_port
+        self._bind = bind
+        self._servers: list[asyncio.Server] = []
+        self._connections: dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+    @classmethod
+    def create(  # noqa: PLR0913
+        cls,
+        count: int,
+        device_types: tuple[int, ...] = DEVICE_TYPES,
+        faults: FaultProfile | None = None,
+        *,
+        network: str = "127.1.0.0/16",
+        http_port: int = HTTP_PORT,
+        tcp_port: int = TCP_PORT,
+        bind: str | None = None,
+    ) -> VentaSimulator:
+        """Create a simulator with devices spread over the device types."""
+        hosts = ipaddress.ip_network(network).hosts()
+        devices = [
+            VirtualDevice.create(
+                device_types[index % len(device_types)], str(next(hosts)), index
+            )
+            for index in range(count)
+        ]
+        return cls(devices, faults, http_port=http_port, tcp_port=tcp_port, bind=bind)
+
+    async def start(self) -> None:
+        """Start listening for all devices."""
+        if self._bind is not None:
+            self._servers = [
+                await asyncio.start_server(
+                    self._handle_http, self._bind, self.http_port, backlog=1024
+                ),
+                await asyncio.start_server(
+                    self._handle_tcp, self._bind, self.tcp_port, backlog=1024
+                ),
+            ]
+            # Resolve the ephemeral ports when started with port 0
+            self.http_port = self._servers[0].sockets[0].getsockname()[1]
+            self.tcp_port = self._servers[1].sockets[0].getsockname()[1]
+            return
+
+        for device in self.devices.values():
+            handler, port = (
+                (self._handle_tcp, self.tcp_port)
+                if device.api_version == 0
+                else (self._handle_http, self.http_port)
+            )
+            self._servers.append(
+                await asyncio.start_server(handler, device.host, port, backlog=16)
+            )
+
+    async def stop(self) -> None:
+        """Stop all listeners and close the open connections."""
+        for server in self._servers:
+            server.close()
+        for server in self._servers:
+            await server.wait_closed()
+        self._servers = []
+
+        for writer in self._connections.values():
+            writer.transport.abort()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+
+    async def __aenter__(self) -> VentaSimulator:
+        """Start the simulator in the context."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        """Stop the simulator when leaving the context."""
+        await self.stop()
+
+    def _track(self, writer: asyncio.StreamWriter) -> None:
+        """Remember the connection so it can be closed on stop."""
+        if (task := asyncio.current_task()) is not None:
+            self._connections[task] = writer
+
+    async def _untrack(self, writer: asyncio.StreamWriter) -> None:
+        """Close the connection and forget it."""
+        self._connections.pop(asyncio.current_task(), None)
+        writer.close()
+        with contextlib.suppress(OSError):
+            await writer.wait_closed()
+
+    def _device(
+        self, writer: asyncio.StreamWriter, version: int
+    ) -> VirtualDevice | None:
+        """Find the device addressed by the connection."""
+        device = self.devices.get(writer.get_extra_info("sockname")[0])
+        if device is None or (device.api_version == 0) != (version == 0):
+            return None
+        return device
+
+    async def _fault(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bool:
+        """Apply the fault profile, returns if the exchange was aborted."""
+        await self.faults.delay()
+        if self.faults.hangs():
+            await reader.read()
+            return True
+        if self.faults.fails():
+            writer.transport.abort()
+            return True
+        return False
+
+    def _garble(self, payload: bytes) -> bytes:
+        """Prepend garbage to the payload when the fault profile says so."""
+        return GARBAGE + payload if self.faults.garbles() else payload
+
+    def _truncate(self, payload: bytes) -> bytes:
+        """Return the payload cut short, the connection is closed after it."""
+        return payload[: random.randrange(1, len(payload))]
+
+    async def _handle_tcp(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Handle the V0 raw TCP exchanges, several with keep-alive."""
+        self._track(writer)
+        try:
+            device = self._device(writer, 0)
+            while request_line := await reader.readline():
+                length_line = await reader.readline()
+                length = int(length_line.decode().partition(":")[2] or 0)
+                body = await reader.readexactly(length) if length else b""
+                if device is None or await self._fault(reader, writer):
+                    return
+
+                _, url, body = parse_message(request_line + length_line + body)
+                if url == "Action":
+                    payload = device.apply(decode_json(body))
+                else:
+                    payload = device.status()
+                response = self._garble(encode_json(payload))
+                if truncated := self.faults.truncates():
+                    response = self._truncate(response)
+                writer.write(response)
+                await writer.drain()
+                if truncated or not self.faults.keep_alive:
+                    return
+        except (OSError, ValueError, asyncio.IncompleteReadError) as err:
+            # Malformed messages raise VentaProtocolError, a ValueError
+            _LOGGER.debug("TCP exchange failed: %s", err)
+        finally:
+            await self._untrack(writer)
+
+    async def _handle_http(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Handle the V2 and V3 HTTP exchanges."""
+        self._track(writer)
+        try:
+            device = self._device(writer, 2)
+            while request_line := (await reader.readline()).decode().strip():
+                headers = {}
+                while header := (await reader.readline()).decode().strip():
+                    name, _, value = header.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                body = await reader.readexactly(length) if length else b""
+                if device is None or await self._fault(reader, writer):
+                    return
+
+                _, path, _ = request_line.split(" ", 2)
+                status, payload = self._http_response(device, path.lstrip("/"), body)
+                payload = self._garble(payload)
+                keep_alive = self.faults.keep_alive and (
+                    headers.get("connection", "keep-alive").lower() != "close"
+                )
+                head = (
+                    f"HTTP/1.1 {status}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                    "\r\n"
+                ).encode()
+                if truncated := self.faults.truncates():
+                    payload = self._truncate(payload)
+                writer.write(head + payload)
+                await writer.drain()
+                if truncated or not keep_alive:
+                    return
+        except (OSError, ValueError, asyncio.IncompleteReadError) as err:
+            _LOGGER.debug("HTTP exchange failed: %s", err)
+        finally:
+            await self._untrack(writer)
+
+    def _http_response(
+        self, device: VirtualDevice, url: str, body: bytes
+    ) -> tuple[str, bytes]:
+        """Build the HTTP response for the requested endpoint."""
+        if device.device_type in V2_DEVICE_TYPES:
+            urls = V2_URLS
+        elif device.device_type in V3_SENSOR_DEVICE_TYPES:
+            urls = V3_SENSOR_URLS
+        else:
+            urls = V3_URLS
+        if url not in urls:
+            return "404 Not Found", b"{}"
+        return "200 OK", encode_json(device.apply(decode_json(body)))
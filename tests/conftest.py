@@ -0,0 +1,91 @@
+"""Fixtures for the Venta tests."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from dataclasses import replace
+from datetime import timedelta
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.venta.venta import (
+    VentaApi,
+    VentaDataUpdateCoordinator,
+    VentaDevice,
+    VentaDeviceType,
+)
+from custom_components.venta.venta_protocol import (
+    DEVICE_TYPE_API_DEFINITIONS,
+    VentaApiVersion,
+    map_data,
+)
+from simulator import FaultProfile, VentaSimulator, VirtualDevice
+
+from .const import SIMULATOR_HOST
+
+
+@pytest.fixture
+def device_type() -> int:
+    """Return the type of the simulated device, overridden by the tests."""
+    return 1
+
+
+@pytest.fixture
+def faults() -> FaultProfile:
+    """Return the fault profile of the simulator, overridden by the tests."""
+    return FaultProfile()
+
+
+@pytest.fixture
+async def simulator(
+    socket_enabled: None, device_type: int, faults: FaultProfile
+) -> AsyncIterator[VentaSimulator]:
+    """Serve a single virtual device on ephemeral ports."""
+    async with VentaSimulator(
+        [VirtualDevice.create(device_type, SIMULATOR_HOST, 0)],
+        faults,
+        http_port=0,
+        tcp_port=0,
+        bind=SIMULATOR_HOST,
+    ) as simulator:
+        yield simulator
+
+
+@pytest.fixture
+async def device(simulator: VentaSimulator) -> AsyncIterator[VentaDevice]:
+    """Return a device talking to the simulated device."""
+    virtual = next(iter(simulator.devices.values()))
+    device = VentaDevice(
+        SIMULATOR_HOST, timedelta(seconds=10), None, request_timeout=0.1
+    )
+    definition = DEVICE_TYPE_API_DEFINITIONS[VentaDeviceType(virtual.device_type)]
+    port = (
+        simulator.tcp_port
+        if definition.version is VentaApiVersion.V0
+        else simulator.http_port
+    )
+    device._set_api_definition(replace(definition, port=port))
+    await device.init()
+    yield device
+    await device.close()
+
+
+@pytest.fixture
+async def coordinator(
+    hass: HomeAssistant, device_type: int
+) -> AsyncIterator[VentaDataUpdateCoordinator]:
+    """Return a coordinator holding the status of a virtual device."""
+    virtual = VirtualDevice.create(device_type, SIMULATOR_HOST, 0)
+    device = VentaDevice(
+        SIMULATOR_HOST,
+        timedelta(seconds=10),
+        DEVICE_TYPE_API_DEFINITIONS[VentaDeviceType(device_type)].id,
+    )
+    device.mac = virtual.mac
+    device.device_type = VentaDeviceType(device_type)
+    coordinator = VentaDataUpdateCoordinator(hass, VentaApi(device))
+    coordinator.data = map_data(virtual.status())
+    yield coordinator
+    await coordinator.async_shutdown()
+    await device.close()
@@ -0,0 +1,4 @@
+"""Constants for the Venta tests."""
+
+# The only host the sockets may connect to during the tests
+SIMULATOR_HOST = "127.0.0.1"
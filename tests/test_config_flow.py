@@ -0,0 +1,343 @@
+"""Tests for the Venta config flow."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import replace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from homeassistant import config_entries
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_HOST, CONF_MAC
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.helpers.service_info.dhcp import DhcpServiceInfo
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.venta.config_flow import ConfigVersion
+from custom_components.venta.const import (
+    CONF_API_DEFINITION_ID,
+    CONF_HOSTS,
+    CONF_NETWORK,
+    DATA_SESSION,
+    DOMAIN,
+)
+from custom_components.venta.integration import async_update_options
+from custom_components.venta.venta import VentaDataUpdateCoordinator
+from custom_components.venta.venta_discovery import (
+    VentaDiscoveredDevice,
+    VentaHostReport,
+    network_hosts,
+)
+from custom_components.venta.venta_protocol import (
+    DEVICE_TYPE_API_DEFINITIONS,
+    VentaDeviceType,
+)
+
+HOST = "192.168.1.20"
+MAC = "02:56:00:00:00:01"
+NETWORK = "192.168.1.0/24"
+
+DEVICE = VentaDiscoveredDevice(
+    HOST,
+    MAC,
+    VentaDeviceType.LW73,
+    DEVICE_TYPE_API_DEFINITIONS[VentaDeviceType.LW73],
+    0.01,
+)
+DHCP_DISCOVERY = DhcpServiceInfo(
+    ip=HOST, hostname="venta-lw73", macaddress="025600000001"
+)
+DISCOVERY_INFO = {
+    CONF_HOST: HOST,
+    CONF_MAC: MAC,
+    CONF_API_DEFINITION_ID: DEVICE.api_definition.id,
+    "model": DEVICE.device_type.name,
+}
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
+
+
+@pytest.fixture
+def identify() -> Iterator[AsyncMock]:
+    """Replace the identification of the hosts by a status request."""
+    with patch(
+        "custom_components.venta.config_flow.identify", return_value=DEVICE
+    ) as identify:
+        yield identify
+
+
+@pytest.fixture
+def discover() -> Iterator[AsyncMock]:
+    """Replace the scan of the networks."""
+    with patch("custom_components.venta.config_flow.discover") as discover:
+        yield discover
+
+
+@pytest.fixture(autouse=True)
+def setup_entry() -> Iterator[AsyncMock]:
+    """Skip the setup of the created entries."""
+    with patch("custom_components.venta.async_setup_entry", return_value=True) as mock:
+        yield mock
+
+
+async def test_dhcp_discovery(hass: HomeAssistant, identify: AsyncMock) -> None:
+    """Test a device found by DHCP is identified and confirmed."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": config_entries.SOURCE_DHCP},
+        data=DHCP_DISCOVERY,
+    )
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "discovery_confirm"
+    assert result["description_placeholders"] == {"model": "LW73", CONF_HOST: HOST}
+    identify.assert_awaited_once_with(HOST, hass.data[DATA_SESSION])
+
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], {})
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["title"] == HOST
+    assert result["data"][CONF_MAC] == MAC
+    assert result["data"][CONF_API_DEFINITION_ID] == DEVICE.api_definition.id
+    assert result["result"].unique_id == MAC
+
+
+async def test_dhcp_not_venta_device(hass: HomeAssistant, identify: AsyncMock) -> None:
+    """Test a host answering no Venta status is ignored."""
+    identify.return_value = None
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": config_entries.SOURCE_DHCP},
+        data=DHCP_DISCOVERY,
+    )
+
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "not_venta_device"
+
+
+async def test_dhcp_known_device_new_host(
+    hass: HomeAssistant, identify: AsyncMock
+) -> None:
+    """Test a known device found at a new address only updates its host."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=ConfigVersion.V4,
+        unique_id=MAC,
+        data={
+            CONF_HOST: "192.168.1.10",
+            CONF_MAC: MAC,
+            CONF_API_DEFINITION_ID: DEVICE.api_definition.id,
+        },
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": config_entries.SOURCE_DHCP},
+        data=DHCP_DISCOVERY,
+    )
+
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "already_configured"
+    assert entry.data[CONF_HOST] == HOST
+    identify.assert_not_awaited()
+
+
+@pytest.mark.parametrize(
+    ("source", "data"),
+    [
+        (config_entries.SOURCE_DHCP, DHCP_DISCOVERY),
+        (config_entries.SOURCE_INTEGRATION_DISCOVERY, DISCOVERY_INFO),
+        (config_entries.SOURCE_IMPORT, DISCOVERY_INFO),
+    ],
+)
+async def test_known_device_new_host_reloaded_once(
+    hass: HomeAssistant,
+    identify: AsyncMock,
+    coordinator: VentaDataUpdateCoordinator,
+    source: str,
+    data: object,
+) -> None:
+    """Test a loaded entry moved to a new host is reloaded by its listener only."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=ConfigVersion.V4,
+        unique_id=MAC,
+        state=ConfigEntryState.LOADED,
+        data={
+            CONF_HOST: coordinator.api.device.host,
+            CONF_MAC: MAC,
+            CONF_API_DEFINITION_ID: coordinator.api.device.api_definition.id,
+        },
+    )
+    entry.add_to_hass(hass)
+    entry.add_update_listener(async_update_options)
+    hass.data[DOMAIN] = {entry.entry_id: coordinator}
+
+    with patch.object(hass.config_entries, "async_reload") as reload:
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": source}, data=data
+        )
+        await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "already_configured"
+    assert entry.data[CONF_HOST] == HOST
+    reload.assert_awaited_once_with(entry.entry_id)
+
+
+async def test_dhcp_known_device_same_host(
+    hass: HomeAssistant, identify: AsyncMock
+) -> None:
+    """Test a known device at the same address leaves the entry as is."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=ConfigVersion.V4,
+        unique_id=MAC,
+        data={
+            CONF_HOST: HOST,
+            CONF_MAC: MAC,
+            CONF_API_DEFINITION_ID: DEVICE.api_definition.id,
+        },
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": config_entries.SOURCE_DHCP},
+        data=DHCP_DISCOVERY,
+    )
+
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "already_configured"
+    assert entry.data[CONF_HOST] == HOST
+    identify.assert_not_awaited()
+
+
+async def _scan_form(hass: HomeAssistant) -> dict:
+    """Start a flow at the scan form."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    assert result["type"] is FlowResultType.MENU
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"next_step_id": "scan"}
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "scan"
+    return result
+
+
+@pytest.mark.parametrize(
+    ("network", "error"),
+    [("192.168.1.0/33", "invalid_network"), ("10.0.0.0/16", "network_too_large")],
+)
+async def test_scan_invalid_network(
+    hass: HomeAssistant, discover: AsyncMock, network: str, error: str
+) -> None:
+    """Test a malformed or too large network is refused before scanning."""
+    result = await _scan_form(hass)
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_NETWORK: network}
+    )
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {CONF_NETWORK: error}
+    discover.assert_not_called()
+
+
+async def test_scan_offers_new_devices(
+    hass: HomeAssistant, discover: AsyncMock
+) -> None:
+    """Test the devices found are offered, except the configured ones."""
+    MockConfigEntry(domain=DOMAIN, unique_id=MAC).add_to_hass(hass)
+    other = replace(DEVICE, host="192.168.1.21", mac="02:56:00:00:00:02")
+    discover.return_value = [DEVICE, other]
+    result = await _scan_form(hass)
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_NETWORK: NETWORK}
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "devices_found"
+    assert result["description_placeholders"] == {"count": "1"}
+    assert discover.call_args.args[0] == network_hosts(NETWORK)
+    (flow,) = hass.config_entries.flow.async_progress_by_handler(DOMAIN)
+    assert flow["context"]["source"] == config_entries.SOURCE_INTEGRATION_DISCOVERY
+    assert flow["context"]["unique_id"] == other.mac
+    assert flow["step_id"] == "discovery_confirm"
+
+
+async def test_scan_without_new_devices(
+    hass: HomeAssistant, discover: AsyncMock
+) -> None:
+    """Test the scan aborts when only configured devices are found."""
+    MockConfigEntry(domain=DOMAIN, unique_id=MAC).add_to_hass(hass)
+    discover.return_value = [DEVICE]
+    result = await _scan_form(hass)
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_NETWORK: NETWORK}
+    )
+
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "no_devices_found"
+
+
+async def test_hosts_adds_new_devices(hass: HomeAssistant) -> None:
+    """Test the listed hosts add their new devices once and report every host."""
+    MockConfigEntry(domain=DOMAIN, unique_id=MAC).add_to_hass(hass)
+    other = replace(DEVICE, host="192.168.1.21", mac="02:56:00:00:00:02")
+    reports = [
+        VentaHostReport(HOST, 0.01, DEVICE),
+        VentaHostReport(other.host, 0.02, other),
+        VentaHostReport("192.168.1.22", 0.03, other, duplicate_of=other.host),
+        VentaHostReport("192.168.1.23", 0.04),
+    ]
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"next_step_id": "hosts"}
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "hosts"
+
+    with patch(
+        "custom_components.venta.config_flow.identify_hosts", return_value=reports
+    ) as identify_hosts:
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {
+                CONF_HOSTS: "192.168.1.20, 192.168.1.21\n"
+                "192.168.1.22;192.168.1.23  192.168.1.20\n"
+            },
+        )
+        await hass.async_block_till_done()
+
+    assert identify_hosts.call_args.args[0] == [report.host for report in reports]
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "hosts_added"
+    assert result["description_placeholders"] == {
+        "count": "1",
+        "report": "\n".join(
+            [
+                "- 192.168.1.20: LW73 already configured (10 ms)",
+                "- 192.168.1.21: LW73 added (20 ms)",
+                "- 192.168.1.22: same device as 192.168.1.21 (30 ms)",
+                "- 192.168.1.23: no Venta device found (40 ms)",
+            ]
+        ),
+    }
+    entries = {
+        entry.unique_id: entry for entry in hass.config_entries.async_entries(DOMAIN)
+    }
+    assert set(entries) == {MAC, other.mac}
+    assert entries[other.mac].data[CONF_HOST] == other.host
+    assert entries[other.mac].data[CONF_API_DEFINITION_ID] == other.api_definition.id
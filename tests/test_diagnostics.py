@@ -0,0 +1,67 @@
+"""Tests for the Venta diagnostics."""
+
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.const import CONF_HOST, CONF_MAC
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.venta.const import DOMAIN
+from custom_components.venta.diagnostics import async_get_config_entry_diagnostics
+from custom_components.venta.venta import (
+    VentaApi,
+    VentaDataUpdateCoordinator,
+    VentaDevice,
+)
+from custom_components.venta.venta_protocol import (
+    DEVICE_TYPE_API_DEFINITIONS,
+    VentaDeviceType,
+    VentaHttpRequest,
+    encode_json,
+    map_data,
+)
+
+from .const import SIMULATOR_HOST
+
+MAC = "02:56:00:00:00:6a"
+
+
+async def test_diagnostics_redact_mac(hass: HomeAssistant) -> None:
+    """Test the mac address is redacted from the entry, data and exchanges."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, unique_id=MAC, data={CONF_HOST: SIMULATOR_HOST, CONF_MAC: MAC}
+    )
+    entry.add_to_hass(hass)
+    device = VentaDevice(
+        SIMULATOR_HOST,
+        timedelta(seconds=10),
+        DEVICE_TYPE_API_DEFINITIONS[VentaDeviceType.LW73].id,
+    )
+    device.mac = MAC
+    device.device_type = VentaDeviceType.LW73
+    coordinator = VentaDataUpdateCoordinator(hass, VentaApi(device))
+    status = {"Header": {"DeviceType": 106, "MacAdress": MAC}, "Action": {}}
+    coordinator.data = map_data(status)
+    body = encode_json({"Header": {"MacAdress": MAC.upper()}})
+    device.metrics.record_exchange(
+        0.0,
+        0.1,
+        VentaHttpRequest("POST", "datastructure", {"Host": SIMULATOR_HOST}, body),
+        encode_json(status),
+    )
+    hass.data[DOMAIN] = {entry.entry_id: coordinator}
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert MAC not in json.dumps(diagnostics).lower()
+    assert diagnostics["entry"]["unique_id"] == REDACTED
+    assert diagnostics["data"]["header"]["MacAdress"] == REDACTED
+    (exchange,) = diagnostics["exchanges"]
+    assert exchange["request"].startswith("POST /datastructure HTTP/1.1\r\n")
+    assert REDACTED in exchange["request"]
+    assert REDACTED in exchange["response"]
+    await device.close()
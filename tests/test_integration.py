@@ -0,0 +1,247 @@
+"""Tests for the Home Assistant setup of the Venta integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_HOST, CONF_MAC, CONF_SCAN_INTERVAL, CONF_TIMEOUT
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+)
+
+from custom_components.venta.const import (
+    ATTR_NEW_HOST,
+    ATTR_OLD_HOST,
+    CONF_API_DEFINITION_ID,
+    CONF_ENTITY_PROFILE,
+    DATA_REDISCOVERY,
+    DOMAIN,
+    ENTITY_PROFILE_MINIMAL,
+    EVENT_HOST_CHANGED,
+    REDISCOVERY_FAILURES,
+)
+from custom_components.venta.integration import (
+    async_rediscover,
+    async_start_rediscovery,
+    async_unload_entry,
+    async_update_options,
+)
+from custom_components.venta.utils import async_close_session
+from custom_components.venta.venta import VentaDataUpdateCoordinator
+from custom_components.venta.venta_discovery import VentaDiscoveredDevice
+from custom_components.venta.venta_protocol import VentaData
+
+NEW_HOST = "127.0.0.2"
+SCAN_INTERVAL = 30
+TIMEOUT = 3
+
+
+@pytest.fixture
+def entry(
+    hass: HomeAssistant, coordinator: VentaDataUpdateCoordinator
+) -> MockConfigEntry:
+    """Return the loaded entry of the coordinator."""
+    device = coordinator.api.device
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=device.host,
+        unique_id=device.mac,
+        state=ConfigEntryState.LOADED,
+        data={
+            CONF_HOST: device.host,
+            CONF_MAC: device.mac,
+            CONF_API_DEFINITION_ID: device.api_definition.id,
+        },
+    )
+    entry.add_to_hass(hass)
+    hass.data[DOMAIN] = {entry.entry_id: coordinator}
+    return entry
+
+
+@pytest.fixture
+def reload(hass: HomeAssistant) -> Iterator[AsyncMock]:
+    """Replace the reload of the entries."""
+    with patch.object(hass.config_entries, "async_reload") as reload:
+        yield reload
+
+
+@pytest.fixture
+def find_device() -> Iterator[AsyncMock]:
+    """Replace the search of a device on the local networks."""
+    with (
+        patch(
+            "custom_components.venta.integration.network.async_get_adapters",
+            return_value=[],
+        ),
+        patch("custom_components.venta.integration.find_device") as find_device,
+    ):
+        yield find_device
+
+
+async def test_interval_and_timeout_applied(
+    hass: HomeAssistant,
+    coordinator: VentaDataUpdateCoordinator,
+    entry: MockConfigEntry,
+    reload: AsyncMock,
+) -> None:
+    """Test the scan interval and timeout are applied without a reload."""
+    hass.config_entries.async_update_entry(
+        entry,
+        data={**entry.data, CONF_SCAN_INTERVAL: SCAN_INTERVAL, CONF_TIMEOUT: TIMEOUT},
+    )
+    with patch.object(coordinator, "async_request_refresh") as refresh:
+        await async_update_options(hass, entry)
+
+    reload.assert_not_called()
+    refresh.assert_awaited_once()
+    assert coordinator.update_interval == timedelta(seconds=SCAN_INTERVAL)
+    assert coordinator.api.device.update_interval == timedelta(seconds=SCAN_INTERVAL)
+    assert coordinator.api.device.request_timeout == TIMEOUT
+
+
+async def test_profile_change_reloads(
+    hass: HomeAssistant, entry: MockConfigEntry, reload: AsyncMock
+) -> None:
+    """Test changing the entity profile reloads the entry."""
+    hass.config_entries.async_update_entry(
+        entry, data={**entry.data, CONF_ENTITY_PROFILE: ENTITY_PROFILE_MINIMAL}
+    )
+    await async_update_options(hass, entry)
+
+    reload.assert_awaited_once_with(entry.entry_id)
+
+
+async def test_rediscover_moves_device(
+    hass: HomeAssistant,
+    coordinator: VentaDataUpdateCoordinator,
+    entry: MockConfigEntry,
+    reload: AsyncMock,
+    find_device: AsyncMock,
+) -> None:
+    """Test a device found at a new host is moved there without a reload."""
+    device = coordinator.api.device
+    old_host = device.host
+    find_device.return_value = VentaDiscoveredDevice(
+        NEW_HOST, device.mac, device.device_type, device.api_definition, 0.0
+    )
+    entry.add_update_listener(async_update_options)
+    events = async_capture_events(hass, EVENT_HOST_CHANGED)
+
+    with patch.object(coordinator, "async_request_refresh") as refresh:
+        await async_rediscover(hass, entry)
+        await hass.async_block_till_done()
+
+    hosts = find_device.call_args.args[1]
+    assert NEW_HOST in hosts
+    assert old_host not in hosts
+    assert device.host == NEW_HOST
+    assert entry.data[CONF_HOST] == NEW_HOST
+    assert entry.title == NEW_HOST
+    assert entry.data[CONF_API_DEFINITION_ID] == device.api_definition.id
+    (event,) = events
+    assert event.data[CONF_MAC] == device.mac
+    assert event.data[ATTR_OLD_HOST] == old_host
+    assert event.data[ATTR_NEW_HOST] == NEW_HOST
+    refresh.assert_awaited_once()
+    reload.assert_not_called()
+    await async_close_session(hass)
+
+
+async def test_rediscover_device_not_found(
+    hass: HomeAssistant,
+    coordinator: VentaDataUpdateCoordinator,
+    entry: MockConfigEntry,
+    find_device: AsyncMock,
+) -> None:
+    """Test an entry whose device is not found is left as it is."""
+    old_host = coordinator.api.device.host
+    find_device.return_value = None
+    events = async_capture_events(hass, EVENT_HOST_CHANGED)
+
+    await async_rediscover(hass, entry)
+
+    assert coordinator.api.device.host == old_host
+    assert entry.data[CONF_HOST] == old_host
+    assert not events
+    await async_close_session(hass)
+
+
+async def test_rediscover_unloaded_entry(
+    hass: HomeAssistant,
+    coordinator: VentaDataUpdateCoordinator,
+    find_device: AsyncMock,
+) -> None:
+    """Test a device found after its entry was unloaded is not moved."""
+    device = coordinator.api.device
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id=device.mac,
+        data={CONF_HOST: device.host, CONF_MAC: device.mac},
+    )
+    entry.add_to_hass(hass)
+    find_device.return_value = VentaDiscoveredDevice(
+        NEW_HOST, device.mac, device.device_type, device.api_definition, 0.0
+    )
+
+    await async_rediscover(hass, entry)
+
+    assert entry.data[CONF_HOST] == device.host != NEW_HOST
+    await async_close_session(hass)
+
+
+async def test_rediscovery_throttled_and_cancelled(
+    hass: HomeAssistant, entry: MockConfigEntry
+) -> None:
+    """Test a sweep starts once per interval and is cancelled on unload."""
+    with (
+        patch(
+            "custom_components.venta.integration.async_rediscover",
+            side_effect=lambda *_: asyncio.Event().wait(),
+        ) as rediscover,
+        patch.object(hass.config_entries, "async_unload_platforms", return_value=True),
+    ):
+        async_start_rediscovery(hass, entry)
+        _, task = hass.data[DATA_REDISCOVERY][entry.entry_id]
+        async_start_rediscovery(hass, entry)
+
+        assert hass.data[DATA_REDISCOVERY][entry.entry_id][1] is task
+        rediscover.assert_called_once_with(hass, entry)
+
+        assert await async_unload_entry(hass, entry)
+        await asyncio.sleep(0)
+
+    assert task.cancelled()
+    assert entry.entry_id not in hass.data[DATA_REDISCOVERY]
+
+
+async def test_unreachable_reported(
+    hass: HomeAssistant, coordinator: VentaDataUpdateCoordinator
+) -> None:
+    """Test an unreachable device is reported after consecutive failed updates."""
+    on_unreachable = Mock()
+    api = coordinator.api
+    unreachable = VentaDataUpdateCoordinator(hass, api, on_unreachable=on_unreachable)
+
+    with patch.object(api, "async_update", return_value=VentaData(is_empty=True)):
+        for _ in range(REDISCOVERY_FAILURES - 1):
+            await unreachable.async_refresh()
+        on_unreachable.assert_not_called()
+
+        await unreachable.async_refresh()
+        on_unreachable.assert_called_once()
+
+        await unreachable.async_refresh()
+        assert on_unreachable.call_count == 2  # noqa: PLR2004
+
+    with patch.object(api, "async_update", return_value=coordinator.data):
+        await unreachable.async_refresh()
+
+    assert unreachable.failures == 0
+    await unreachable.async_shutdown()
@@ -0,0 +1,46 @@
+"""Tests for the Venta coordinator."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+from custom_components.venta.const import SLOW_UPDATE_TIER_INTERVAL
+from custom_components.venta.venta import VentaDataUpdateCoordinator, VentaUpdateTier
+
+
+def test_slow_tier_updates(coordinator: VentaDataUpdateCoordinator) -> None:
+    """Test the slow tier is only updated when due or its raw fields changed."""
+    fast, slow = Mock(), Mock()
+    coordinator.async_add_listener(fast, VentaUpdateTier.FAST)
+    coordinator.async_add_listener(slow, VentaUpdateTier.SLOW)
+    data = coordinator.data
+
+    coordinator.async_update_listeners()
+    data.measure.Humidity = (data.measure.Humidity or 0) + 1
+    coordinator.async_update_listeners()
+
+    assert fast.call_count == 2  # noqa: PLR2004
+    assert slow.call_count == 1
+
+    data.info.OperationT = (data.info.OperationT or 0) + 1
+    coordinator.async_update_listeners()
+
+    assert slow.call_count == 2  # noqa: PLR2004
+
+    for _ in range(SLOW_UPDATE_TIER_INTERVAL):
+        coordinator.async_update_listeners()
+
+    assert fast.call_count == SLOW_UPDATE_TIER_INTERVAL + 3
+    assert slow.call_count == 3  # noqa: PLR2004
+
+
+def test_slow_tier_on_failed_update(coordinator: VentaDataUpdateCoordinator) -> None:
+    """Test the slow tier is updated when the device is lost."""
+    slow = Mock()
+    coordinator.async_add_listener(slow, VentaUpdateTier.SLOW)
+
+    coordinator.async_update_listeners()
+    coordinator.last_update_success = False
+    coordinator.async_update_listeners()
+
+    assert slow.call_count == 2  # noqa: PLR2004
@@ -0,0 +1,91 @@
+"""Tests for the capture and replay of the Venta exchanges."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from pathlib import Path
+
+import pytest
+
+from benchmarks.replay import replay
+from custom_components.venta.venta import VentaDevice
+from custom_components.venta.venta_capture import (
+    VentaCapture,
+    VentaReplayStrategy,
+    is_action,
+    read_capture,
+)
+
+FAN_SPEED = 3
+POLLS = 2
+
+
+async def _capture(device: VentaDevice, path: Path) -> list[dict]:
+    """Capture an action followed by status polls of the device."""
+    capture = VentaCapture(path)
+    writer = asyncio.create_task(capture.async_run())
+    device.set_capture(capture)
+    await device.action({"Action": {"FanSpeed": FAN_SPEED}})
+    for _ in range(POLLS):
+        await device.status()
+    writer.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await writer
+    return read_capture([path])
+
+
+@pytest.mark.parametrize("device_type", [1, 106])
+async def test_capture(device: VentaDevice, tmp_path: Path) -> None:
+    """Test the exchanges are written with their method and url."""
+    exchanges = await _capture(device, tmp_path / "capture.jsonl")
+
+    assert [is_action(exchange) for exchange in exchanges] == [
+        True,
+        *[False] * POLLS,
+    ]
+    assert {(exchange["method"], exchange["url"]) for exchange in exchanges[1:]} == {
+        (device.api_definition.status.method, device.api_definition.status.url)
+    }
+    assert exchanges[0]["url"] == device.api_definition.action.url
+
+
+@pytest.mark.parametrize("device_type", [106])
+async def test_replay_status_and_action(device: VentaDevice, tmp_path: Path) -> None:
+    """Test the V2 status and action sharing their url are replayed apart."""
+    exchanges = await _capture(device, tmp_path / "capture.jsonl")
+    definition = device.api_definition
+    strategy = VentaReplayStrategy(exchanges, speed=0)
+
+    status = await strategy.get_status(definition.status.method, definition.status.url)
+    action = await strategy.send_action(
+        definition.action.method, definition.action.url, {}
+    )
+
+    assert status["Header"].MacAdress == device.mac
+    assert "Measure" in status
+    assert action["Action"].FanSpeed == FAN_SPEED
+    assert await strategy.get_status("GET", definition.status.url) is None
+
+
+@pytest.mark.parametrize("device_type", [1, 106])
+async def test_replay_capture_starting_with_action(
+    device: VentaDevice, tmp_path: Path
+) -> None:
+    """Test the benchmark replays the polls of a capture starting with an action."""
+    path = tmp_path / "capture.jsonl"
+    await _capture(device, path)
+
+    poll, cpu = await replay([path], speed=0)
+
+    assert poll.model == device.device_type.value
+    assert poll.iterations == POLLS
+    assert cpu.iterations == POLLS
+
+
+async def test_replay_without_polls(tmp_path: Path) -> None:
+    """Test a capture without status polls replays nothing."""
+    path = tmp_path / "capture.jsonl"
+    path.write_text("")
+
+    assert await replay([path], speed=0) == []
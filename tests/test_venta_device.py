@@ -0,0 +1,82 @@
+"""Tests for the setup of the Venta entities."""
+
+from __future__ import annotations
+
+from importlib import import_module
+from unittest.mock import Mock
+
+from homeassistant.const import CONF_HOST, EntityCategory
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import EntityDescription
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.venta.const import (
+    DOMAIN,
+    ENTITY_PROFILE_FULL,
+    ENTITY_PROFILE_MINIMAL,
+)
+from custom_components.venta.venta import VentaDataUpdateCoordinator
+from custom_components.venta.venta_device import async_profile_descriptions
+
+from .const import SIMULATOR_HOST
+
+DESCRIPTIONS = [
+    EntityDescription(key="humidity"),
+    EntityDescription(key="timer", entity_category=EntityCategory.CONFIG),
+    EntityDescription(key="warnings", entity_category=EntityCategory.DIAGNOSTIC),
+]
+
+
+async def test_profile_disables_entities_left_out(
+    hass: HomeAssistant, coordinator: VentaDataUpdateCoordinator
+) -> None:
+    """Test the entities left out are disabled, and enabled again later."""
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_HOST: SIMULATOR_HOST})
+    entry.add_to_hass(hass)
+    coordinator.config_entry = entry
+    registry = er.async_get(hass)
+    entity_ids = [
+        registry.async_get_or_create(
+            "sensor",
+            DOMAIN,
+            f"{coordinator.api.device.mac}-{description.key}",
+            config_entry=entry,
+        ).entity_id
+        for description in DESCRIPTIONS
+    ]
+
+    coordinator.entity_profile = ENTITY_PROFILE_MINIMAL
+    descriptions = async_profile_descriptions(coordinator, DESCRIPTIONS)
+
+    assert descriptions == DESCRIPTIONS[:1]
+    assert [registry.async_get(entity_id).disabled_by for entity_id in entity_ids] == [
+        None,
+        er.RegistryEntryDisabler.INTEGRATION,
+        er.RegistryEntryDisabler.INTEGRATION,
+    ]
+
+    coordinator.entity_profile = ENTITY_PROFILE_FULL
+    descriptions = async_profile_descriptions(coordinator, DESCRIPTIONS)
+
+    assert descriptions == DESCRIPTIONS
+    assert all(
+        registry.async_get(entity_id).disabled_by is None for entity_id in entity_ids
+    )
+
+
+async def test_profile_filters_descriptions(
+    coordinator: VentaDataUpdateCoordinator,
+) -> None:
+    """Test only the entities of the profile are made by the device modules."""
+    coordinator.entity_profile = ENTITY_PROFILE_MINIMAL
+    add_entities = Mock()
+
+    module = import_module(
+        f"custom_components.venta.devices.{coordinator.api.device.device_type.value}"
+    )
+    await module.async_setup_sensor(coordinator, add_entities)
+
+    (entities,) = add_entities.call_args.args
+    assert entities
+    assert all(entity.entity_category is None for entity in entities)
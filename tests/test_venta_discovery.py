@@ -0,0 +1,130 @@
+"""Tests for the discovery of the Venta devices."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.venta.venta_discovery import (
+    VentaDiscoveredDevice,
+    discover,
+    identify,
+    identify_hosts,
+    network_hosts,
+    same_mac,
+)
+from custom_components.venta.venta_protocol import (
+    API_DEFINITIONS,
+    DEVICE_TYPE_API_DEFINITIONS,
+    VentaApiVersion,
+    VentaDeviceType,
+)
+from simulator import VentaSimulator
+
+from .const import SIMULATOR_HOST
+
+NETWORK_HOSTS = 254
+
+
+@pytest.fixture
+def simulated_ports(simulator: VentaSimulator, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Move the api definitions to the ports of the simulator."""
+    definitions = [
+        replace(
+            definition,
+            port=simulator.tcp_port
+            if definition.version is VentaApiVersion.V0
+            else simulator.http_port,
+        )
+        for definition in API_DEFINITIONS
+    ]
+    monkeypatch.setattr(
+        "custom_components.venta.venta_discovery.API_DEFINITIONS", definitions
+    )
+    monkeypatch.setattr(
+        "custom_components.venta.venta_client.API_DEFINITIONS", definitions
+    )
+
+
+def test_network_hosts() -> None:
+    """Test the hosts of the network leave out its network and broadcast."""
+    hosts = network_hosts("192.168.1.7/24")
+
+    assert len(hosts) == NETWORK_HOSTS
+    assert hosts[0] == "192.168.1.1"
+    assert hosts[-1] == "192.168.1.254"
+    with pytest.raises(ValueError):
+        network_hosts("192.168.1.0/33")
+
+
+def test_same_mac() -> None:
+    """Test the mac addresses are compared whatever their format."""
+    assert same_mac("02:56:00:00:00:0A", "02-56-00-00-00-0a")
+    assert not same_mac("02:56:00:00:00:0a", "02:56:00:00:00:0b")
+
+
+@pytest.mark.usefixtures("simulated_ports")
+@pytest.mark.parametrize("device_type", [1, 106])
+async def test_identify(simulator: VentaSimulator, device_type: int) -> None:
+    """Test the device is identified with the api of its model."""
+    virtual = next(iter(simulator.devices.values()))
+
+    device = await identify(SIMULATOR_HOST)
+
+    assert device is not None
+    assert device.host == SIMULATOR_HOST
+    assert device.mac == virtual.mac
+    assert device.device_type is VentaDeviceType(device_type)
+    assert (
+        device.api_definition.id
+        == DEVICE_TYPE_API_DEFINITIONS[VentaDeviceType(device_type)].id
+    )
+
+
+@pytest.mark.usefixtures("simulated_ports")
+async def test_identify_without_device(simulator: VentaSimulator) -> None:
+    """Test a host without open Venta ports is not identified."""
+    await simulator.stop()
+
+    assert await identify(SIMULATOR_HOST) is None
+
+
+@pytest.mark.usefixtures("simulated_ports")
+async def test_discover(simulator: VentaSimulator) -> None:
+    """Test only the hosts with a device are discovered."""
+    await simulator.stop()
+    assert await discover([SIMULATOR_HOST]) == []
+
+    await simulator.start()
+    (device,) = await discover([SIMULATOR_HOST])
+
+    assert device.mac == next(iter(simulator.devices.values())).mac
+
+
+async def test_identify_hosts() -> None:
+    """Test every host is reported, the same device once under its first host."""
+    device = VentaDiscoveredDevice(
+        "192.168.1.20",
+        "02:56:00:00:00:0a",
+        VentaDeviceType.LW73,
+        DEVICE_TYPE_API_DEFINITIONS[VentaDeviceType.LW73],
+        0.01,
+    )
+    devices = {
+        device.host: device,
+        "192.168.1.21": None,
+        "192.168.1.22": replace(device, host="192.168.1.22", mac=device.mac.upper()),
+    }
+
+    with patch(
+        "custom_components.venta.venta_discovery.identify",
+        side_effect=lambda host, _: devices[host],
+    ):
+        reports = await identify_hosts(devices)
+
+    assert [report.host for report in reports] == list(devices)
+    assert [report.device for report in reports] == list(devices.values())
+    assert [report.duplicate_of for report in reports] == [None, None, device.host]
+    assert all(report.duration >= 0 for report in reports)
@@ -0,0 +1,126 @@
+"""Tests for the Venta entities."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+
+from custom_components.venta.venta import VentaDataUpdateCoordinator
+from custom_components.venta.venta_entity import (
+    VentaSensor,
+    VentaSensorEntityDescription,
+)
+
+HUMIDITY = 40.0
+DEADBAND = 0.5
+MIN_INTERVAL = timedelta(seconds=30)
+MAX_STALENESS = timedelta(minutes=5)
+
+
+class Clock:
+    """Monotonic clock moved by the tests."""
+
+    def __init__(self) -> None:
+        """Start the clock."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Iterator[Clock]:
+    """Replace the monotonic clock of the entities."""
+    clock = Clock()
+    with patch("custom_components.venta.venta_entity.monotonic", clock):
+        yield clock
+
+
+def _humidity_sensor(
+    coordinator: VentaDataUpdateCoordinator, **kwargs: object
+) -> VentaSensor:
+    """Return a humidity sensor whose state writes are recorded."""
+    sensor = VentaSensor(
+        coordinator,
+        VentaSensorEntityDescription(
+            key="humidity",
+            value_func=lambda coordinator: coordinator.data.measure.Humidity,
+            max_staleness=MAX_STALENESS,
+            **kwargs,
+        ),
+    )
+    sensor.async_write_ha_state = Mock()
+    return sensor
+
+
+def _update(
+    coordinator: VentaDataUpdateCoordinator, sensor: VentaSensor, humidity: float
+) -> None:
+    """Update the sensor with a new humidity."""
+    coordinator.data.measure.Humidity = humidity
+    sensor._handle_coordinator_update()
+
+
+def test_deadband(coordinator: VentaDataUpdateCoordinator, clock: Clock) -> None:
+    """Test changes within the deadband are not written until stale."""
+    sensor = _humidity_sensor(coordinator, deadband=DEADBAND)
+
+    _update(coordinator, sensor, HUMIDITY)
+    _update(coordinator, sensor, HUMIDITY + DEADBAND / 2)
+    clock.now += 60
+    _update(coordinator, sensor, HUMIDITY - DEADBAND / 2)
+
+    assert sensor.async_write_ha_state.call_count == 1
+    assert sensor.suppressed_writes == 2  # noqa: PLR2004
+
+    _update(coordinator, sensor, HUMIDITY + DEADBAND * 2)
+    clock.now += MAX_STALENESS.total_seconds()
+    _update(coordinator, sensor, HUMIDITY + DEADBAND * 2)
+
+    assert sensor.async_write_ha_state.call_count == 3  # noqa: PLR2004
+
+
+def test_min_interval(coordinator: VentaDataUpdateCoordinator, clock: Clock) -> None:
+    """Test the state is written at most once per interval."""
+    sensor = _humidity_sensor(coordinator, min_interval=MIN_INTERVAL)
+
+    _update(coordinator, sensor, HUMIDITY)
+    clock.now += MIN_INTERVAL.total_seconds() / 2
+    _update(coordinator, sensor, HUMIDITY + 10)
+
+    assert sensor.async_write_ha_state.call_count == 1
+
+    clock.now += MIN_INTERVAL.total_seconds()
+    _update(coordinator, sensor, HUMIDITY + 10)
+
+    assert sensor.async_write_ha_state.call_count == 2  # noqa: PLR2004
+
+
+def test_unavailable_written_at_once(
+    coordinator: VentaDataUpdateCoordinator, clock: Clock
+) -> None:
+    """Test losing the device is written even within the deadband."""
+    sensor = _humidity_sensor(coordinator, deadband=DEADBAND)
+
+    _update(coordinator, sensor, HUMIDITY)
+    coordinator.last_update_success = False
+    _update(coordinator, sensor, HUMIDITY)
+
+    assert sensor.async_write_ha_state.call_count == 2  # noqa: PLR2004
+
+
+def test_without_filters_always_written(
+    coordinator: VentaDataUpdateCoordinator,
+) -> None:
+    """Test a sensor without deadband or interval writes every update."""
+    sensor = _humidity_sensor(coordinator)
+
+    _update(coordinator, sensor, HUMIDITY)
+    _update(coordinator, sensor, HUMIDITY)
+
+    assert sensor.async_write_ha_state.call_count == 2  # noqa: PLR2004
+    assert sensor.suppressed_writes == 0
@@ -0,0 +1,99 @@
+"""Tests for the Venta transport metrics."""
+
+from __future__ import annotations
+
+from importlib import import_module
+
+import pytest
+
+from custom_components.venta.const import ATTR_POLL_LATENCY_P50, ATTR_RETRIES
+from custom_components.venta.venta import VentaDataUpdateCoordinator, VentaDevice
+from custom_components.venta.venta_entity import (
+    METRICS_SENSOR_DESCRIPTIONS,
+    VentaSensor,
+)
+from custom_components.venta.venta_metrics import VentaLatency
+from simulator import VentaSimulator
+
+REQUESTS = 3
+RETRIES = 5
+METRICS_KEYS = {description.key for description in METRICS_SENSOR_DESCRIPTIONS}
+
+
+def test_latency_percentiles() -> None:
+    """Test the percentiles of the window are given in milliseconds."""
+    latency = VentaLatency()
+
+    assert latency.p50 is None
+    assert latency.max is None
+
+    for seconds in (0.03, 0.01, 0.02):
+        latency.record(seconds)
+
+    assert latency.p50 == 20.0  # noqa: PLR2004
+    assert latency.p95 == 30.0  # noqa: PLR2004
+    assert latency.max == 30.0  # noqa: PLR2004
+
+    latency.record(0.05)
+
+    assert latency.max == 50.0  # noqa: PLR2004
+
+
+def test_latency_window_bounded() -> None:
+    """Test the oldest samples leave the window."""
+    latency = VentaLatency(samples=2)
+
+    for seconds in (0.5, 0.01, 0.02):
+        latency.record(seconds)
+
+    assert latency.max == 20.0  # noqa: PLR2004
+
+
+async def test_poll_metrics(device: VentaDevice) -> None:
+    """Test the polls record their latency and the transferred bytes."""
+    for _ in range(REQUESTS):
+        assert not (await device.status()).is_empty
+
+    assert device.metrics.polls.p50 is not None
+    assert device.metrics.bytes_in > 0
+    assert device.metrics.bytes_out > 0
+    assert device.metrics.retries == 0
+    assert device.metrics.empty_responses == 0
+
+
+async def test_timeout_metrics(device: VentaDevice, simulator: VentaSimulator) -> None:
+    """Test an unanswered poll counts its timeouts, retries and empty response."""
+    simulator.faults.hang_rate = 1
+
+    assert (await device.status()).is_empty
+
+    assert device.metrics.timeouts == RETRIES
+    assert device.metrics.retries == RETRIES - 1
+    assert device.metrics.empty_responses == 1
+
+
+@pytest.mark.parametrize("device_type", [1, 5, 6, 11, 12, 106, 150, 500])
+async def test_metric_sensors(
+    coordinator: VentaDataUpdateCoordinator, device_type: int
+) -> None:
+    """Test every model adds the metric sensors, disabled by default."""
+    module = import_module(f"custom_components.venta.devices.{device_type}")
+    sensors: list[VentaSensor] = []
+    await module.async_setup_sensor(coordinator, sensors.extend)
+    metrics = {
+        sensor.entity_description.key: sensor
+        for sensor in sensors
+        if sensor.entity_description.key in METRICS_KEYS
+    }
+
+    assert set(metrics) == METRICS_KEYS
+    assert not any(
+        sensor.entity_description.entity_registry_enabled_default
+        for sensor in metrics.values()
+    )
+
+    coordinator.api.device.metrics.polls.record(0.25)
+    coordinator.api.device.metrics.retries = 2
+
+    assert metrics[ATTR_POLL_LATENCY_P50].native_value == 250.0  # noqa: PLR2004
+    assert metrics[ATTR_RETRIES].native_value == 2  # noqa: PLR2004
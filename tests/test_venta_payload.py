@@ -0,0 +1,57 @@
+"""Tests for the typed sections of the Venta status."""
+
+from __future__ import annotations
+
+from custom_components.venta.venta_payload import (
+    VentaAction,
+    VentaHeader,
+    VentaInfo,
+    VentaMeasure,
+)
+from custom_components.venta.venta_protocol import parse_http_response
+
+TEMPERATURE = 21
+FAN_SPEED = 3
+
+
+def test_status_decoded_into_sections() -> None:
+    """Test the sections are typed while the response is decoded."""
+    status = parse_http_response(
+        b'{"Header":{"DeviceType":106,"MacAdress":"02:56:00:00:00:6a","Extra":1},'
+        b'"Action":{"Power":true,"FanSpeed":3},"Info":{"Warnings":0},'
+        b'"Measure":{"Temperature":21.5,"Nested":{"Unknown":true}},"Other":{}}'
+    )
+
+    assert isinstance(status["Header"], VentaHeader)
+    assert status["Header"].DeviceType == 106  # noqa: PLR2004
+    assert status["Header"].as_dict() == {
+        "DeviceType": 106,
+        "MacAdress": "02:56:00:00:00:6a",
+    }
+    assert status["Action"] == VentaAction(Power=True, FanSpeed=FAN_SPEED)
+    assert status["Info"] == VentaInfo(Warnings=0)
+    assert status["Measure"].Humidity is None
+    assert status["Other"] == {}
+
+
+def test_values_coerced_to_field_types() -> None:
+    """Test the values are coerced to the field type, None when they can't be."""
+    measure = VentaMeasure.decode({"Temperature": TEMPERATURE, "Humidity": "wet"})
+    action = VentaAction.decode({"Power": 1, "SleepMode": "false", "FanSpeed": "3"})
+    info = VentaInfo.decode({"RelState": "on", "Warnings": None})
+
+    assert measure.Temperature == float(TEMPERATURE)
+    assert isinstance(measure.Temperature, float)
+    assert measure.Humidity is None
+    assert action == VentaAction(Power=True, SleepMode=None, FanSpeed=FAN_SPEED)
+    assert info.RelState is None
+    assert info.Warnings is None
+
+
+def test_sections_from_data() -> None:
+    """Test the sections of a status parsed without typing are decoded."""
+    header = VentaHeader(DeviceType=1)
+
+    assert VentaHeader.from_data(header) is header
+    assert VentaHeader.from_data({"DeviceType": 1}) == header
+    assert VentaHeader.from_data(None) == VentaHeader()
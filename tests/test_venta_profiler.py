@@ -0,0 +1,73 @@
+"""Tests for the Venta profiler."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.venta.venta import (
+    VentaApi,
+    VentaDataUpdateCoordinator,
+    VentaDevice,
+)
+from custom_components.venta.venta_profiler import VentaProfiler
+
+CYCLES = 2
+
+
+async def _summary(path: Path) -> str:
+    """Wait for the summary written in the background and return it."""
+    async with asyncio.timeout(5):
+        while not (summaries := list(path.glob("venta_profile_*.txt"))):
+            await asyncio.sleep(0.01)
+    assert list(path.glob("venta_profile_*.prof"))
+    return summaries[0].read_text()
+
+
+@pytest.mark.parametrize(
+    ("device_type", "parser"),
+    [(1, "parse_v0_frame"), (106, "parse_http_response")],
+)
+async def test_profile_polls(
+    hass: HomeAssistant, device: VentaDevice, tmp_path: Path, parser: str
+) -> None:
+    """Test the parsing and mapping are profiled and the transport is timed."""
+    hass.config.config_dir = str(tmp_path)
+    coordinator = VentaDataUpdateCoordinator(hass, VentaApi(device))
+    VentaProfiler(hass, [coordinator], CYCLES).async_start()
+
+    for _ in range(CYCLES):
+        await coordinator.async_refresh()
+    summary = await _summary(tmp_path)
+
+    assert coordinator.profiler is None
+    assert device.profile is None
+    assert f"Polls: {CYCLES}\n" in summary
+    assert "Transport per poll: median" in summary
+    assert "Parsing and mapping per poll: median" in summary
+    assert parser in summary
+    assert "map_data" in summary
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.parametrize("device_type", [1])
+async def test_profile_unloaded_device(
+    hass: HomeAssistant, device: VentaDevice, tmp_path: Path
+) -> None:
+    """Test a device unloaded before its last cycle gives a partial profile."""
+    hass.config.config_dir = str(tmp_path)
+    coordinator = VentaDataUpdateCoordinator(hass, VentaApi(device))
+    profiler = VentaProfiler(hass, [coordinator], CYCLES)
+    profiler.async_start()
+
+    await coordinator.async_refresh()
+    profiler.async_remove(coordinator)
+    summary = await _summary(tmp_path)
+
+    assert device.profile is None
+    assert summary.startswith("Partial profile")
+    assert "Polls: 1\n" in summary
+    await coordinator.async_shutdown()
@@ -0,0 +1,167 @@
+"""Tests for the sans-IO Venta protocol functions."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from custom_components.venta.venta_protocol import (
+    VentaApiVersion,
+    VentaDeviceType,
+    VentaHttpRequest,
+    VentaProtocolError,
+    VentaTcpHeader,
+    action_changes,
+    build_http_request,
+    build_message,
+    device_identity,
+    encode_json,
+    map_data,
+    parse_http_request,
+    parse_http_response,
+    parse_message,
+    parse_v0_frame,
+    parse_v0_response,
+    shape_action,
+)
+
+ROOT = Path(__file__).parent.parent
+# Home Assistant is hidden, an entry of None in sys.modules fails its import
+STANDALONE_IMPORTS = """
+import sys
+sys.modules["homeassistant"] = None
+import custom_components.venta.venta_protocol
+import custom_components.venta.venta_client
+import custom_components.venta.__main__
+import simulator
+import benchmarks.stages
+"""
+
+STATUS = {
+    "Header": {"DeviceType": 1, "MacAdress": "02:56:00:00:00:00"},
+    "Action": {"Power": True, "FanSpeed": 2},
+    "Info": {"Warnings": 0},
+    "Measure": {"Humidity": 45.5},
+}
+
+
+def _plain(data: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Return the parsed status with the typed sections as dicts."""
+    return data and {key: section.as_dict() for key, section in data.items()}
+
+
+def test_message_round_trip() -> None:
+    """Test a V0 message is split back into its parts."""
+    message = build_message(
+        "POST",
+        "Action",
+        {"Action": {"FanSpeed": 3}},
+        VentaTcpHeader("02:56:00:00:00:00", 1),
+    )
+
+    method, url, body = parse_message(message)
+
+    assert (method, url) == ("POST", "Action")
+    assert b" " not in body
+    assert b'"MacAddress":"02:56:00:00:00:00"' in body
+    assert body.endswith(b'"Action":{"FanSpeed":3}}')
+
+
+def test_parse_message_malformed() -> None:
+    """Test a message without the content length is rejected."""
+    with pytest.raises(VentaProtocolError):
+        parse_message(b"GET /Complete\n{}")
+
+
+def test_http_request_round_trip() -> None:
+    """Test an HTTP request is split back into its parts."""
+    request = build_http_request(
+        "POST", "datastructure", {"Content-Length": "2"}, b"{}"
+    )
+
+    assert request.startswith(b"POST /datastructure HTTP/1.1\r\n")
+    assert parse_http_request(request) == ("POST", "datastructure", b"{}")
+
+
+def test_http_request_parts() -> None:
+    """Test the recorded request parts are sized and serialized like sent."""
+    request = VentaHttpRequest(
+        "POST", "datastructure", {"Host": "venta", "Content-Length": "2"}, b"{}"
+    )
+
+    assert request.size == len(bytes(request))
+    assert bytes(request) == build_http_request(
+        "POST", "datastructure", request.headers, b"{}"
+    )
+
+
+def test_parse_v0_frame_chunks() -> None:
+    """Test a V0 response is only parsed once complete."""
+    response = encode_json(STATUS) + b"\r\n"
+    buffer = bytearray()
+    results = []
+    for start in range(0, len(response), 16):
+        buffer += response[start : start + 16]
+        results.append(parse_v0_frame(memoryview(buffer)))
+
+    assert _plain(results[-1]) == STATUS
+    assert all(result is None for result in results[:-1])
+
+
+@pytest.mark.parametrize(
+    "frame", [b"", b"  \r\n", b"no json}", b'{"Header": {"DeviceType": 1}']
+)
+def test_parse_v0_frame_incomplete(frame: bytes) -> None:
+    """Test an incomplete or empty frame is not parsed."""
+    assert parse_v0_frame(memoryview(frame)) is None
+
+
+def test_parse_v0_response() -> None:
+    """Test the first JSON object of the response is used."""
+    response = parse_v0_response(b"junk " + encode_json(STATUS) + b" {}")
+    assert _plain(response) == STATUS
+    assert parse_v0_response(b" \n") is None
+    with pytest.raises(VentaProtocolError):
+        parse_v0_response(b"garbage")
+
+
+def test_parse_http_response() -> None:
+    """Test the HTTP response bodies."""
+    assert _plain(parse_http_response(encode_json(STATUS))) == STATUS
+    assert parse_http_response(b"") is None
+    with pytest.raises(VentaProtocolError):
+        parse_http_response(b"{garbage")
+
+
+def test_map_data_and_identity() -> None:
+    """Test the status is mapped and identifies the device."""
+    data = map_data(STATUS)
+
+    assert not data.is_empty
+    assert data.measure.Humidity == STATUS["Measure"]["Humidity"]
+    assert device_identity(data) == ("02:56:00:00:00:00", VentaDeviceType.LP60)
+    assert map_data(None).is_empty
+    assert device_identity(map_data({"Header": {"DeviceType": 9999}}))[1] is (
+        VentaDeviceType.UNKNOWN
+    )
+
+
+@pytest.mark.parametrize(
+    "version", [VentaApiVersion.V0, VentaApiVersion.V2, VentaApiVersion.V3]
+)
+def test_action_round_trip(version: VentaApiVersion) -> None:
+    """Test the changes survive the shaping of every protocol version."""
+    changes = {"Power": False, "FanSpeed": 1}
+
+    assert action_changes(shape_action(version, changes)) == changes
+
+
+def test_import_without_home_assistant() -> None:
+    """Test the sans-IO core, client, simulator and benchmarks need no HA."""
+    subprocess.run(  # noqa: S603
+        [sys.executable, "-c", STANDALONE_IMPORTS], cwd=ROOT, check=True
+    )
@@ -0,0 +1,100 @@
+"""Tests for the caching resolver of the Venta host names."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+from collections.abc import AsyncIterator, Iterator
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from custom_components.venta.const import DNS_CACHE_TTL
+from custom_components.venta.venta_resolver import VentaResolver
+
+HOST = "venta.local"
+ADDRESSES = ["192.168.1.20", "fe80::1"]
+INFOS = [
+    (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.168.1.20", 0)),
+    (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.168.1.20", 0)),
+    (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("fe80::1", 0, 0, 0)),
+]
+
+
+@pytest.fixture
+async def getaddrinfo() -> AsyncIterator[AsyncMock]:
+    """Replace the lookups of the host names."""
+    loop = asyncio.get_running_loop()
+    with patch.object(loop, "getaddrinfo", return_value=INFOS) as getaddrinfo:
+        yield getaddrinfo
+
+
+@pytest.fixture
+def clock() -> Iterator[list[float]]:
+    """Replace the clock of the cache expiry, moved by the tests."""
+    now = [1000.0]
+    with patch(
+        "custom_components.venta.venta_resolver.monotonic", side_effect=lambda: now[0]
+    ):
+        yield now
+
+
+async def test_address_not_resolved(getaddrinfo: AsyncMock) -> None:
+    """Test an address is used as it is."""
+    resolver = VentaResolver()
+
+    assert await resolver.addresses("192.168.1.20") == ["192.168.1.20"]
+    (resolved,) = await resolver.resolve("fe80::1", 80)
+
+    assert resolved["host"] == "fe80::1"
+    assert resolved["family"] == socket.AF_INET6
+    assert resolved["port"] == 80  # noqa: PLR2004
+    getaddrinfo.assert_not_called()
+
+
+async def test_lookup_cached(getaddrinfo: AsyncMock, clock: list[float]) -> None:
+    """Test the addresses are looked up once per time to live."""
+    resolver = VentaResolver()
+
+    results = await asyncio.gather(*(resolver.addresses(HOST) for _ in range(3)))
+    assert results == [ADDRESSES] * 3
+    assert await resolver.addresses(HOST) == ADDRESSES
+    getaddrinfo.assert_awaited_once()
+
+    clock[0] += DNS_CACHE_TTL + 1
+    assert await resolver.addresses(HOST) == ADDRESSES
+
+    assert getaddrinfo.await_count == 2  # noqa: PLR2004
+    assert resolver.stats.misses == 4  # noqa: PLR2004
+    assert resolver.stats.hits == 1
+
+
+async def test_failed_lookup_cached(getaddrinfo: AsyncMock) -> None:
+    """Test a failed lookup is not retried before its shorter time to live."""
+    getaddrinfo.side_effect = socket.gaierror("Name or service not known")
+    resolver = VentaResolver()
+
+    for _ in range(2):
+        with pytest.raises(OSError, match=f"Unable to resolve {HOST}"):
+            await resolver.addresses(HOST)
+
+    getaddrinfo.assert_awaited_once()
+    assert resolver.stats.failures == 1
+
+
+async def test_lookup_timeout_keeps_addresses(
+    getaddrinfo: AsyncMock, clock: list[float]
+) -> None:
+    """Test the last known addresses are used when a lookup times out."""
+    resolver = VentaResolver()
+    assert await resolver.addresses(HOST) == ADDRESSES
+
+    clock[0] += DNS_CACHE_TTL + 1
+    getaddrinfo.side_effect = asyncio.TimeoutError
+    assert await resolver.addresses(HOST) == ADDRESSES
+    assert resolver.stats.fallbacks == 1
+
+    resolver.clear()
+    with pytest.raises(OSError, match=f"Timeout resolving {HOST}"):
+        await resolver.addresses(HOST)
+    assert resolver.stats.failures == 1
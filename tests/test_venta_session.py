@@ -0,0 +1,154 @@
+"""Tests for the lifecycle of the Venta sessions."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from homeassistant.const import CONF_HOST, CONF_MAC, EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.venta.const import (
+    DATA_SESSION,
+    DATA_SESSION_LISTENER,
+    DOMAIN,
+)
+from custom_components.venta.integration import async_unload_entry
+from custom_components.venta.utils import async_close_session, async_get_session
+from custom_components.venta.venta import (
+    VentaApi,
+    VentaDataUpdateCoordinator,
+    VentaDevice,
+    VentaDeviceType,
+)
+from custom_components.venta.venta_protocol import DEVICE_TYPE_API_DEFINITIONS
+from custom_components.venta.venta_session import VentaSession
+
+from .const import SIMULATOR_HOST
+
+
+def _close_listeners(hass: HomeAssistant) -> int:
+    """Return the number of listeners of the shutdown."""
+    return hass.bus.async_listeners().get(EVENT_HOMEASSISTANT_CLOSE, 0)
+
+
+async def test_shared_session(hass: HomeAssistant) -> None:
+    """Test the session is shared and its shutdown listener removed on close."""
+    listeners = _close_listeners(hass)
+
+    session = async_get_session(hass)
+    assert not session.session.closed
+
+    assert async_get_session(hass) is session
+    assert _close_listeners(hass) == listeners + 1
+
+    await async_close_session(hass)
+
+    assert session.closed
+    assert DATA_SESSION not in hass.data
+    assert DATA_SESSION_LISTENER not in hass.data
+    assert _close_listeners(hass) == listeners
+    assert async_get_session(hass) is not session
+    await async_close_session(hass)
+
+
+async def test_session_closed_on_shutdown(hass: HomeAssistant) -> None:
+    """Test the shared session is closed when Home Assistant closes."""
+    session = async_get_session(hass)
+    assert not session.session.closed
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+
+    assert session.closed
+    assert DATA_SESSION not in hass.data
+    assert DATA_SESSION_LISTENER not in hass.data
+
+
+@pytest.mark.parametrize("device_type", [106])
+async def test_device_owned_session(device: VentaDevice) -> None:
+    """Test a device without a session closes the one it created."""
+    assert not (await device.status()).is_empty
+    session = device._session
+
+    assert not session.closed
+
+    await device.close()
+
+    assert session.closed
+
+
+async def test_device_shared_session() -> None:
+    """Test a device given a session leaves it open."""
+    session = VentaSession()
+    assert not session.session.closed
+    device = VentaDevice(
+        SIMULATOR_HOST,
+        timedelta(seconds=10),
+        DEVICE_TYPE_API_DEFINITIONS[VentaDeviceType.LW73].id,
+        session,
+    )
+
+    await device.close()
+
+    assert not session.closed
+    await session.close()
+
+
+async def test_last_unload_closes_session(
+    hass: HomeAssistant, coordinator: VentaDataUpdateCoordinator
+) -> None:
+    """Test unloading the last entry closes its device and the shared session."""
+    session = async_get_session(hass)
+    assert not session.session.closed
+    device = coordinator.api.device
+    entries = []
+    for mac in (device.mac, "02:56:00:00:00:ff"):
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            unique_id=mac,
+            data={CONF_HOST: SIMULATOR_HOST, CONF_MAC: mac},
+        )
+        entry.add_to_hass(hass)
+        entries.append(entry)
+    other = VentaDataUpdateCoordinator(
+        hass,
+        VentaApi(VentaDevice(SIMULATOR_HOST, timedelta(seconds=10), None, session)),
+    )
+    hass.data[DOMAIN] = {entries[0].entry_id: coordinator, entries[1].entry_id: other}
+
+    with (
+        patch.object(hass.config_entries, "async_unload_platforms", return_value=True),
+        patch.object(device, "close", wraps=device.close) as close,
+    ):
+        assert await async_unload_entry(hass, entries[0])
+
+        close.assert_awaited_once()
+        assert not session.closed
+
+        assert await async_unload_entry(hass, entries[1])
+
+    assert session.closed
+    assert DATA_SESSION not in hass.data
+
+
+async def test_unload_failed_keeps_session(
+    hass: HomeAssistant, coordinator: VentaDataUpdateCoordinator
+) -> None:
+    """Test a failed unload keeps the device and the session."""
+    session = async_get_session(hass)
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_HOST: SIMULATOR_HOST})
+    entry.add_to_hass(hass)
+    hass.data[DOMAIN] = {entry.entry_id: coordinator}
+
+    with (
+        patch.object(hass.config_entries, "async_unload_platforms", return_value=False),
+        patch.object(coordinator.api.device, "close", AsyncMock()) as close,
+    ):
+        assert not await async_unload_entry(hass, entry)
+
+    close.assert_not_awaited()
+    assert hass.data[DATA_SESSION] is session
+    await async_close_session(hass)
@@ -0,0 +1,258 @@
+"""Tests for the Venta transports against the simulator."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+from collections.abc import AsyncIterator, Callable
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.venta.const import KEEP_ALIVE_PROBES, TCP_KEEPALIVE_IDLE
+from custom_components.venta.venta_metrics import VentaMetrics
+from custom_components.venta.venta_protocol import (
+    VentaHttpRequest,
+    VentaTcpHeader,
+    encode_json,
+)
+from custom_components.venta.venta_resolver import VentaResolver
+from custom_components.venta.venta_strategy import (
+    VentaApiHostDefinition,
+    VentaHttpStrategy,
+    VentaKeepAlive,
+    VentaSocketOptions,
+    VentaTcpStrategy,
+)
+from simulator import FaultProfile, VentaSimulator
+
+from .const import SIMULATOR_HOST
+
+FAN_SPEED = 3
+UNREACHABLE_HOST = "127.0.0.2"
+REQUESTS = 3
+
+
+@pytest.fixture
+async def stalling_port(
+    socket_enabled: None, simulator: VentaSimulator
+) -> AsyncIterator[int]:
+    """Serve a V0 device answering once per connection, then holding it open."""
+    device = next(iter(simulator.devices.values()))
+
+    async def _handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        await reader.readline()
+        length = int((await reader.readline()).decode().partition(":")[2])
+        await reader.readexactly(length)
+        writer.write(encode_json(device.status()))
+        await reader.read()
+        writer.close()
+
+    server = await asyncio.start_server(_handle, SIMULATOR_HOST, 0)
+    async with server:
+        yield server.sockets[0].getsockname()[1]
+
+
+def _tcp_strategy(simulator: VentaSimulator) -> VentaTcpStrategy:
+    """Return a TCP strategy for the simulated V0 device."""
+    device = next(iter(simulator.devices.values()))
+    strategy = VentaTcpStrategy(
+        VentaApiHostDefinition(SIMULATOR_HOST, simulator.tcp_port), request_timeout=5
+    )
+    strategy.set_header(VentaTcpHeader(device.mac, device.device_type))
+    strategy.metrics = VentaMetrics()
+    strategy.keep_alive = VentaKeepAlive()
+    return strategy
+
+
+async def test_tcp_status_and_action(simulator: VentaSimulator) -> None:
+    """Test the V0 status and action exchanges."""
+    device = next(iter(simulator.devices.values()))
+    async with _tcp_strategy(simulator) as strategy:
+        status = await strategy.get_status("GET", "Complete")
+        response = await strategy.send_action(
+            "POST", "Action", {"Action": {"FanSpeed": FAN_SPEED}}
+        )
+
+    assert status["Header"].MacAdress == device.mac
+    assert response["Action"].FanSpeed == FAN_SPEED
+    assert device.state["Action"]["FanSpeed"] == FAN_SPEED
+    assert strategy.metrics.bytes_in > 0
+    assert strategy.metrics.bytes_out > 0
+    assert strategy.metrics.sockets_open == 0
+
+
+async def test_tcp_keep_alive(simulator: VentaSimulator) -> None:
+    """Test the V0 connection is kept once the device keeps it open."""
+    async with _tcp_strategy(simulator) as strategy:
+        for _ in range(KEEP_ALIVE_PROBES + 2):
+            assert await strategy.get_status("GET", "Complete")
+
+    assert strategy.keep_alive.supported is True
+    assert strategy.metrics.sockets_opened == 1
+    assert strategy.metrics.sockets_reset == 0
+
+
+@pytest.mark.parametrize("faults", [FaultProfile(keep_alive=False)])
+async def test_tcp_without_keep_alive(simulator: VentaSimulator) -> None:
+    """Test a connection per request when the device closes them."""
+    async with _tcp_strategy(simulator) as strategy:
+        for _ in range(REQUESTS):
+            assert await strategy.get_status("GET", "Complete")
+
+    assert strategy.keep_alive.supported is False
+    assert strategy.metrics.sockets_opened == REQUESTS
+    assert strategy.metrics.sockets_open == 0
+
+
+@pytest.mark.parametrize(
+    ("options", "kept", "keepalive"),
+    [
+        (VentaSocketOptions(), True, True),
+        (VentaSocketOptions(), False, False),
+        (VentaSocketOptions(keepalive_idle=None), True, False),
+    ],
+)
+@pytest.mark.usefixtures("socket_enabled")
+def test_socket_options(
+    options: VentaSocketOptions, kept: bool, keepalive: bool
+) -> None:
+    """Test the keep-alive probes are only set on the sockets that may be kept."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        options.apply(sock, kept)
+
+        assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        assert bool(sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)) is (
+            keepalive
+        )
+        if keepalive and hasattr(socket, "TCP_KEEPIDLE"):
+            assert (
+                sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE)
+                == TCP_KEEPALIVE_IDLE
+            )
+
+
+@pytest.mark.parametrize(("abortive_close", "resets"), [(False, 0), (True, REQUESTS)])
+async def test_tcp_close(
+    simulator: VentaSimulator, abortive_close: bool, resets: int
+) -> None:
+    """Test the connections still open on the device are closed or reset."""
+    strategy = _tcp_strategy(simulator)
+    strategy.keep_alive = None
+    strategy.socket_options = VentaSocketOptions(abortive_close=abortive_close)
+    async with strategy:
+        for _ in range(REQUESTS):
+            assert await strategy.get_status("GET", "Complete")
+
+    assert strategy.metrics.sockets_opened == REQUESTS
+    assert strategy.metrics.sockets_open == 0
+    assert strategy.metrics.sockets_reset == resets
+    assert strategy.metrics.linger.max is not None
+
+
+@pytest.mark.parametrize("faults", [FaultProfile(hang_rate=1)])
+async def test_tcp_unanswered_exchange_reset(simulator: VentaSimulator) -> None:
+    """Test a connection left unanswered is reset without the closing handshake."""
+    async with _tcp_strategy(simulator) as strategy:
+        with pytest.raises(asyncio.TimeoutError):
+            # Timed out the way the retries of the device do
+            async with asyncio.timeout(0.1):
+                await strategy.get_status("GET", "Complete")
+
+    assert strategy.metrics.sockets_open == 0
+    assert strategy.metrics.sockets_reset == 1
+
+
+@pytest.mark.parametrize("faults", [FaultProfile(failure_rate=1)])
+async def test_tcp_failed_exchange(simulator: VentaSimulator) -> None:
+    """Test a connection reset by the device gives no data."""
+    async with _tcp_strategy(simulator) as strategy:
+        assert await strategy.get_status("GET", "Complete") is None
+
+    assert strategy.metrics.sockets_open == 0
+
+
+async def test_tcp_resolved_addresses(simulator: VentaSimulator) -> None:
+    """Test the addresses of the host are tried in order until one connects."""
+    device = next(iter(simulator.devices.values()))
+    resolver = VentaResolver()
+    strategy = VentaTcpStrategy(
+        VentaApiHostDefinition("venta.local", simulator.tcp_port),
+        request_timeout=5,
+        resolver=resolver,
+    )
+    strategy.set_header(VentaTcpHeader(device.mac, device.device_type))
+    strategy.metrics = VentaMetrics()
+    loop = asyncio.get_running_loop()
+    create_connection = loop.create_connection
+    tried: list[str] = []
+
+    async def _create_connection(
+        factory: Callable[[], asyncio.Protocol], host: str, port: int
+    ) -> tuple[asyncio.Transport, asyncio.Protocol]:
+        tried.append(host)
+        if host == UNREACHABLE_HOST:
+            raise ConnectionRefusedError
+        return await create_connection(factory, host, port)
+
+    with patch.object(loop, "create_connection", _create_connection):
+        with patch.object(
+            resolver, "addresses", return_value=[UNREACHABLE_HOST, SIMULATOR_HOST]
+        ):
+            async with strategy:
+                status = await strategy.get_status("GET", "Complete")
+
+        assert status["Header"].MacAdress == device.mac
+        assert tried == [UNREACHABLE_HOST, SIMULATOR_HOST]
+        assert strategy.metrics.sockets_opened == 1
+
+        with patch.object(resolver, "addresses", return_value=[UNREACHABLE_HOST]):
+            async with strategy:
+                assert await strategy.get_status("GET", "Complete") is None
+
+    assert strategy.metrics.sockets_opened == 1
+
+
+@pytest.mark.parametrize("device_type", [106])
+async def test_http_status_and_action(simulator: VentaSimulator) -> None:
+    """Test the V2 status and action exchanges."""
+    device = next(iter(simulator.devices.values()))
+    strategy = VentaHttpStrategy(
+        VentaApiHostDefinition(SIMULATOR_HOST, simulator.http_port),
+        request_timeout=5,
+    )
+    strategy.metrics = VentaMetrics()
+    async with strategy:
+        status = await strategy.get_status("POST", "datastructure")
+        response = await strategy.send_action(
+            "POST", "datastructure", {"Action": {"Power": False}}
+        )
+
+    assert status["Header"].MacAdress == device.mac
+    assert response["Action"].Power is False
+    requests = [request for _, _, request, _ in strategy.metrics.exchanges]
+    assert all(isinstance(request, VentaHttpRequest) for request in requests)
+    assert bytes(requests[0]).startswith(b"POST /datastructure HTTP/1.1\r\n")
+    assert strategy.metrics.bytes_out == sum(len(bytes(r)) for r in requests)
+
+
+async def test_tcp_stalled_kept_connection(
+    simulator: VentaSimulator, stalling_port: int
+) -> None:
+    """Test a request stalled on a kept connection gives the keep-alive up."""
+    device = next(iter(simulator.devices.values()))
+    strategy = VentaTcpStrategy(
+        VentaApiHostDefinition(SIMULATOR_HOST, stalling_port), request_timeout=1
+    )
+    strategy.set_header(VentaTcpHeader(device.mac, device.device_type))
+    strategy.metrics = VentaMetrics()
+    strategy.keep_alive = VentaKeepAlive()
+    async with strategy:
+        for _ in range(REQUESTS):
+            assert await strategy.get_status("GET", "Complete")
+
+    assert strategy.keep_alive.supported is False
+    assert strategy.metrics.timeouts == 1
+    assert strategy.metrics.sockets_open == 0